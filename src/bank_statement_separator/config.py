@@ -2,13 +2,21 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+from dotenv.variables import parse_variables
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+def _parse_csv_list(value: str) -> List[str]:
+    """Split a comma-separated value into a list of non-empty, trimmed items."""
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
 class Config(BaseModel):
     """Application configuration with validation and defaults."""
 
@@ -250,6 +258,23 @@ class Config(BaseModel):
         extra="forbid",
     )
 
+    @field_validator(
+        "allowed_input_dirs",
+        "allowed_output_dirs",
+        "paperless_tags",
+        "paperless_input_tags",
+        "paperless_error_tags",
+        "paperless_error_severity_levels",
+        "allowed_file_extensions",
+        mode="before",
+    )
+    @classmethod
+    def split_comma_separated(cls, v: Any) -> Any:
+        """Accept comma-separated strings for list fields."""
+        if isinstance(v, str):
+            return _parse_csv_list(v)
+        return v
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -349,12 +374,144 @@ def validate_env_file(env_file_path: str) -> bool:
     return True
 
 
-def load_config(env_file: Optional[str] = None) -> Config:
+# Map environment variables to config fields
+_ENV_MAPPING = {
+    # LLM Provider Configuration
+    "LLM_PROVIDER": "llm_provider",
+    "OPENAI_API_KEY": "openai_api_key",
+    "OPENAI_MODEL": "openai_model",
+    "OLLAMA_BASE_URL": "ollama_base_url",
+    "OLLAMA_MODEL": "ollama_model",
+    "LLM_TEMPERATURE": "llm_temperature",
+    "LLM_MAX_TOKENS": "llm_max_tokens",
+    "LLM_FALLBACK_ENABLED": "llm_fallback_enabled",
+    "CHUNK_SIZE": "chunk_size",
+    "CHUNK_OVERLAP": "chunk_overlap",
+    "MAX_FILENAME_LENGTH": "max_filename_length",
+    "DEFAULT_OUTPUT_DIR": "default_output_dir",
+    "PROCESSED_INPUT_DIR": "processed_input_dir",
+    "ENABLE_AUDIT_LOGGING": "enable_audit_logging",
+    "LOG_LEVEL": "log_level",
+    "LOG_FILE": "log_file",
+    "ALLOWED_INPUT_DIRS": "allowed_input_dirs",
+    "ALLOWED_OUTPUT_DIRS": "allowed_output_dirs",
+    "MAX_FILE_SIZE_MB": "max_file_size_mb",
+    "ENABLE_FALLBACK_PROCESSING": "enable_fallback_processing",
+    "INCLUDE_BANK_IN_FILENAME": "include_bank_in_filename",
+    "DATE_FORMAT": "date_format",
+    "MAX_PAGES_PER_STATEMENT": "max_pages_per_statement",
+    "MAX_TOTAL_PAGES": "max_total_pages",
+    "PAPERLESS_ENABLED": "paperless_enabled",
+    "PAPERLESS_URL": "paperless_url",
+    "PAPERLESS_TOKEN": "paperless_token",
+    "PAPERLESS_TAGS": "paperless_tags",
+    "PAPERLESS_CORRESPONDENT": "paperless_correspondent",
+    "PAPERLESS_DOCUMENT_TYPE": "paperless_document_type",
+    "PAPERLESS_STORAGE_PATH": "paperless_storage_path",
+    "PAPERLESS_INPUT_TAGS": "paperless_input_tags",
+    "PAPERLESS_INPUT_CORRESPONDENT": "paperless_input_correspondent",
+    "PAPERLESS_INPUT_DOCUMENT_TYPE": "paperless_input_document_type",
+    "PAPERLESS_MAX_DOCUMENTS": "paperless_max_documents",
+    "PAPERLESS_QUERY_TIMEOUT": "paperless_query_timeout",
+    "PAPERLESS_TAG_WAIT_TIME": "paperless_tag_wait_time",
+    "PAPERLESS_INPUT_PROCESSED_TAG": "paperless_input_processed_tag",
+    "PAPERLESS_INPUT_REMOVE_UNPROCESSED_TAG": "paperless_input_remove_unprocessed_tag",
+    "PAPERLESS_INPUT_PROCESSING_TAG": "paperless_input_processing_tag",
+    "PAPERLESS_INPUT_UNPROCESSED_TAG_NAME": "paperless_input_unprocessed_tag_name",
+    "PAPERLESS_INPUT_TAGGING_ENABLED": "paperless_input_tagging_enabled",
+    "PAPERLESS_ERROR_DETECTION_ENABLED": "paperless_error_detection_enabled",
+    "PAPERLESS_ERROR_TAGS": "paperless_error_tags",
+    "PAPERLESS_ERROR_TAG_THRESHOLD": "paperless_error_tag_threshold",
+    "PAPERLESS_ERROR_SEVERITY_LEVELS": "paperless_error_severity_levels",
+    "PAPERLESS_ERROR_BATCH_TAGGING": "paperless_error_batch_tagging",
+    # Error Handling
+    "QUARANTINE_DIRECTORY": "quarantine_directory",
+    "MAX_RETRY_ATTEMPTS": "max_retry_attempts",
+    "CONTINUE_ON_VALIDATION_WARNINGS": "continue_on_validation_warnings",
+    "AUTO_QUARANTINE_CRITICAL_FAILURES": "auto_quarantine_critical_failures",
+    "PRESERVE_FAILED_OUTPUTS": "preserve_failed_outputs",
+    "ENABLE_ERROR_REPORTING": "enable_error_reporting",
+    "ERROR_REPORT_DIRECTORY": "error_report_directory",
+    "VALIDATION_STRICTNESS": "validation_strictness",
+    # Document Validation
+    "MIN_PAGES_PER_STATEMENT": "min_pages_per_statement",
+    "MAX_FILE_AGE_DAYS": "max_file_age_days",
+    "ALLOWED_FILE_EXTENSIONS": "allowed_file_extensions",
+    "REQUIRE_TEXT_CONTENT": "require_text_content",
+    "MIN_TEXT_CONTENT_RATIO": "min_text_content_ratio",
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_env_file(
+    env_path: str, mtime_ns: int, size: int
+) -> Mapping[str, Optional[str]]:
+    """Parse an env file once per (path, mtime, size) and cache the raw values.
+
+    ``${VAR}`` references are left unexpanded so the cached values do not depend
+    on os.environ; read_env_file expands them on every call.
+    """
+    return MappingProxyType(dotenv_values(env_path, interpolate=False))
+
+
+def _interpolate_env_values(
+    raw_values: Mapping[str, Optional[str]],
+) -> Dict[str, Optional[str]]:
+    """Expand ``${VAR}`` references as dotenv does, against the current os.environ.
+
+    Earlier values in the file take precedence over the process environment.
+    """
+    resolved: Dict[str, Optional[str]] = {}
+    for name, value in raw_values.items():
+        if value is not None and "$" in value:
+            env = {**os.environ, **resolved}
+            value = "".join(atom.resolve(env) for atom in parse_variables(value))
+        resolved[name] = value
+    return resolved
+
+
+def read_env_file(env_file: str) -> Mapping[str, Optional[str]]:
+    """
+    Return the parsed values of an environment file.
+
+    Parsing is cached and only repeated when the file's modification time or
+    size changes; ``${VAR}`` references are expanded against the current
+    environment on every call.
+
+    Args:
+        env_file: Path to the environment file
+
+    Returns:
+        Mapping[str, Optional[str]]: Read-only mapping of variable names to values
+    """
+    stat = os.stat(env_file)
+    raw_values = _parse_env_file(
+        os.path.abspath(env_file), stat.st_mtime_ns, stat.st_size
+    )
+    return MappingProxyType(_interpolate_env_values(raw_values))
+
+
+def clear_env_file_cache() -> None:
+    """Discard cached environment file contents (mainly for tests)."""
+    _parse_env_file.cache_clear()
+
+
+def clear_config_cache() -> None:
+    """Discard configurations cached by load_config (mainly for tests)."""
+    _cached_config.cache_clear()
+
+
+def load_config(
+    env_file: Optional[str] = None, overrides: Optional[Dict[str, str]] = None
+) -> Config:
     """
     Load configuration from environment variables and .env file.
 
     Args:
         env_file: Optional path to .env file. If None, uses default .env
+        overrides: Optional environment variable values (e.g.
+            {"PAPERLESS_ENABLED": "true"}) that take precedence over the
+            process environment without modifying os.environ
 
     Returns:
         Config: Validated configuration instance
@@ -368,8 +525,14 @@ def load_config(env_file: Optional[str] = None) -> Config:
         if env_file:
             # Validate the custom env file before loading
             validate_env_file(env_file)
-            # Load the custom env file with override=True to ensure it takes precedence
-            load_dotenv(env_file, override=True)
+            # Apply the custom env file over os.environ so it takes precedence
+            os.environ.update(
+                {
+                    key: value
+                    for key, value in read_env_file(env_file).items()
+                    if value is not None
+                }
+            )
         else:
             # Load default .env if it exists
             load_dotenv()
@@ -379,124 +542,108 @@ def load_config(env_file: Optional[str] = None) -> Config:
     except (OSError, IOError) as e:
         raise ValueError(f"Failed to load environment file: {e}") from e
 
-    # Convert environment variables to the format expected by Pydantic
-    config_data = {}
+    overrides = overrides or {}
+    unknown_overrides = sorted(set(overrides) - _ENV_MAPPING.keys())
+    if unknown_overrides:
+        raise ValueError(
+            f"Unknown configuration overrides: {', '.join(unknown_overrides)}"
+        )
+
+    env_items = tuple(
+        (env_var, overrides[env_var] if env_var in overrides else os.getenv(env_var))
+        for env_var in _ENV_MAPPING
+    )
+    # Callers adjust the returned config (e.g. CLI options), so hand out copies
+    return _cached_config(env_items).model_copy(deep=True)
+
+
+@lru_cache(maxsize=4)
+def _cached_config(env_items: Tuple[Tuple[str, Optional[str]], ...]) -> Config:
+    """Validate a configuration once per distinct set of environment values."""
+    return _config_from_env(dict(env_items))
+
+
+def load_config_from_mapping(values: Mapping[str, str]) -> Config:
+    """
+    Build configuration from environment-style values without any file access.
+
+    The values are converted and validated exactly as ``load_config`` does for an
+    env file, but neither the filesystem nor os.environ is consulted. Keys that
+    are not configuration variables are ignored.
+
+    Args:
+        values: Mapping of environment variable names to string values
+
+    Returns:
+        Config: Validated configuration instance
+    """
+    return _config_from_env({env_var: values.get(env_var) for env_var in _ENV_MAPPING})
 
-    # Map environment variables to config fields
-    env_mapping = {
-        # LLM Provider Configuration
-        "LLM_PROVIDER": "llm_provider",
-        "OPENAI_API_KEY": "openai_api_key",
-        "OPENAI_MODEL": "openai_model",
-        "OLLAMA_BASE_URL": "ollama_base_url",
-        "OLLAMA_MODEL": "ollama_model",
-        "LLM_TEMPERATURE": "llm_temperature",
-        "LLM_MAX_TOKENS": "llm_max_tokens",
-        "LLM_FALLBACK_ENABLED": "llm_fallback_enabled",
-        "CHUNK_SIZE": "chunk_size",
-        "CHUNK_OVERLAP": "chunk_overlap",
-        "MAX_FILENAME_LENGTH": "max_filename_length",
-        "DEFAULT_OUTPUT_DIR": "default_output_dir",
-        "PROCESSED_INPUT_DIR": "processed_input_dir",
-        "ENABLE_AUDIT_LOGGING": "enable_audit_logging",
-        "LOG_LEVEL": "log_level",
-        "LOG_FILE": "log_file",
-        "ALLOWED_INPUT_DIRS": "allowed_input_dirs",
-        "ALLOWED_OUTPUT_DIRS": "allowed_output_dirs",
-        "MAX_FILE_SIZE_MB": "max_file_size_mb",
-        "ENABLE_FALLBACK_PROCESSING": "enable_fallback_processing",
-        "INCLUDE_BANK_IN_FILENAME": "include_bank_in_filename",
-        "DATE_FORMAT": "date_format",
-        "MAX_PAGES_PER_STATEMENT": "max_pages_per_statement",
-        "MAX_TOTAL_PAGES": "max_total_pages",
-        "PAPERLESS_ENABLED": "paperless_enabled",
-        "PAPERLESS_URL": "paperless_url",
-        "PAPERLESS_TOKEN": "paperless_token",
-        "PAPERLESS_TAGS": "paperless_tags",
-        "PAPERLESS_CORRESPONDENT": "paperless_correspondent",
-        "PAPERLESS_DOCUMENT_TYPE": "paperless_document_type",
-        "PAPERLESS_STORAGE_PATH": "paperless_storage_path",
-        "PAPERLESS_INPUT_TAGS": "paperless_input_tags",
-        "PAPERLESS_INPUT_CORRESPONDENT": "paperless_input_correspondent",
-        "PAPERLESS_INPUT_DOCUMENT_TYPE": "paperless_input_document_type",
-        "PAPERLESS_MAX_DOCUMENTS": "paperless_max_documents",
-        "PAPERLESS_QUERY_TIMEOUT": "paperless_query_timeout",
-        "PAPERLESS_TAG_WAIT_TIME": "paperless_tag_wait_time",
-        "PAPERLESS_INPUT_PROCESSED_TAG": "paperless_input_processed_tag",
-        "PAPERLESS_INPUT_REMOVE_UNPROCESSED_TAG": "paperless_input_remove_unprocessed_tag",
-        "PAPERLESS_INPUT_PROCESSING_TAG": "paperless_input_processing_tag",
-        "PAPERLESS_INPUT_UNPROCESSED_TAG_NAME": "paperless_input_unprocessed_tag_name",
-        "PAPERLESS_INPUT_TAGGING_ENABLED": "paperless_input_tagging_enabled",
-        "PAPERLESS_ERROR_DETECTION_ENABLED": "paperless_error_detection_enabled",
-        "PAPERLESS_ERROR_TAGS": "paperless_error_tags",
-        "PAPERLESS_ERROR_TAG_THRESHOLD": "paperless_error_tag_threshold",
-        "PAPERLESS_ERROR_SEVERITY_LEVELS": "paperless_error_severity_levels",
-        "PAPERLESS_ERROR_BATCH_TAGGING": "paperless_error_batch_tagging",
-        # Error Handling
-        "QUARANTINE_DIRECTORY": "quarantine_directory",
-        "MAX_RETRY_ATTEMPTS": "max_retry_attempts",
-        "CONTINUE_ON_VALIDATION_WARNINGS": "continue_on_validation_warnings",
-        "AUTO_QUARANTINE_CRITICAL_FAILURES": "auto_quarantine_critical_failures",
-        "PRESERVE_FAILED_OUTPUTS": "preserve_failed_outputs",
-        "ENABLE_ERROR_REPORTING": "enable_error_reporting",
-        "ERROR_REPORT_DIRECTORY": "error_report_directory",
-        "VALIDATION_STRICTNESS": "validation_strictness",
-        # Document Validation
-        "MIN_PAGES_PER_STATEMENT": "min_pages_per_statement",
-        "MAX_FILE_AGE_DAYS": "max_file_age_days",
-        "ALLOWED_FILE_EXTENSIONS": "allowed_file_extensions",
-        "REQUIRE_TEXT_CONTENT": "require_text_content",
-        "MIN_TEXT_CONTENT_RATIO": "min_text_content_ratio",
+
+_TRUTHY = frozenset({"true", "1", "yes", "on", "t", "y"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment string as a boolean flag."""
+    return value.strip().lower() in _TRUTHY
+
+
+_BOOL_FIELDS = frozenset(
+    {
+        "enable_audit_logging",
+        "enable_fallback_processing",
+        "include_bank_in_filename",
+        "paperless_enabled",
+        "paperless_input_remove_unprocessed_tag",
+        "paperless_input_tagging_enabled",
+        "paperless_error_detection_enabled",
+        "paperless_error_batch_tagging",
+    }
+)
+_FLOAT_FIELDS = frozenset({"llm_temperature", "paperless_error_tag_threshold"})
+_INT_FIELDS = frozenset(
+    {
+        "llm_max_tokens",
+        "chunk_size",
+        "chunk_overlap",
+        "max_filename_length",
+        "max_file_size_mb",
+        "max_pages_per_statement",
+        "max_total_pages",
+        "paperless_max_documents",
+        "paperless_query_timeout",
+        "paperless_tag_wait_time",
     }
+)
+
+
+def _converter_for(config_key: str) -> Optional[Callable[[str], Any]]:
+    """Return the string converter for a config field, or None to pass through."""
+    if config_key in _BOOL_FIELDS:
+        return _parse_bool
+    if config_key in _FLOAT_FIELDS:
+        return float
+    if config_key in _INT_FIELDS:
+        return int
+    return None
+
+
+# Resolved once so each load does a single dict lookup per variable
+_ENV_CONVERTERS = {
+    env_var: (config_key, _converter_for(config_key))
+    for env_var, config_key in _ENV_MAPPING.items()
+}
+
+
+def _config_from_env(env_values: Mapping[str, Optional[str]]) -> Config:
+    """Convert environment variable strings into a validated Config."""
+    # Convert environment variables to the format expected by Pydantic
+    config_data = {}
 
-    for env_var, config_key in env_mapping.items():
-        value = os.getenv(env_var)
+    for env_var, (config_key, convert) in _ENV_CONVERTERS.items():
+        value = env_values[env_var]
         if value is not None:
-            # Handle special cases for type conversion
-            if config_key in [
-                "allowed_input_dirs",
-                "allowed_output_dirs",
-                "paperless_tags",
-                "paperless_input_tags",
-                "paperless_error_tags",
-                "paperless_error_severity_levels",
-                "allowed_file_extensions",
-            ]:
-                # Split comma-separated values into list
-                config_data[config_key] = [
-                    item.strip() for item in value.split(",") if item.strip()
-                ]
-            elif config_key in [
-                "enable_audit_logging",
-                "enable_fallback_processing",
-                "include_bank_in_filename",
-                "paperless_enabled",
-                "paperless_input_remove_unprocessed_tag",
-                "paperless_input_tagging_enabled",
-                "paperless_error_detection_enabled",
-                "paperless_error_batch_tagging",
-            ]:
-                # Convert string to boolean
-                config_data[config_key] = value.lower() in ("true", "1", "yes", "on")
-            elif config_key in ["llm_temperature", "paperless_error_tag_threshold"]:
-                # Convert to float
-                config_data[config_key] = float(value)
-            elif config_key in [
-                "llm_max_tokens",
-                "chunk_size",
-                "chunk_overlap",
-                "max_filename_length",
-                "max_file_size_mb",
-                "max_pages_per_statement",
-                "max_total_pages",
-                "paperless_max_documents",
-                "paperless_query_timeout",
-                "paperless_tag_wait_time",
-            ]:
-                # Convert to int
-                config_data[config_key] = int(value)
-            else:
-                config_data[config_key] = value
+            config_data[config_key] = convert(value) if convert else value
 
     return Config(**config_data)
 
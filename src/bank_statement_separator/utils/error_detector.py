@@ -15,6 +15,26 @@ MAX_PAGES_PER_STATEMENT = 50  # Maximum pages for a valid statement
 # Constants for metadata validation
 FALLBACK_ACCOUNT_PREFIX = "ACCT"  # Prefix used for fallback account numbers
 
+# Error message keywords that indicate an LLM provider failure
+LLM_ERROR_KEYWORDS = ("llm", "api", "model", "openai", "ollama")
+
+# Boundary reasoning recorded when LLM detection fell back to page segmentation
+FALLBACK_BOUNDARY_REASONING = "Fallback page-based segmentation"
+
+# Workflow steps that indicate a PDF processing failure
+PDF_ERROR_STEPS = frozenset({"pdf_ingestion_error", "pdf_generation_error"})
+
+# Other failed workflow steps mapped to (error type, severity, description label)
+STEP_FAILURES = {
+    "metadata_extraction_error": (
+        "metadata_extraction_failure",
+        "high",
+        "Metadata extraction",
+    ),
+    "file_organization_error": ("file_output_error", "high", "File organization"),
+    "output_validation_error": ("validation_failure", "critical", "Output validation"),
+}
+
 
 @dataclass
 class ProcessingError:
@@ -28,7 +48,13 @@ class ProcessingError:
 
 
 class ErrorDetector:
-    """Detects processing errors during workflow execution."""
+    """Detects processing errors during workflow execution.
+
+    Confidence checks read ``detected_boundaries`` and ``extracted_metadata``
+    from the workflow state as lists of dicts with an optional numeric
+    ``confidence`` key (missing values count as fully confident). Boundaries
+    also carry ``start_page``/``end_page`` and an optional ``reasoning`` string.
+    """
 
     def __init__(self, config: Config):
         """Initialize error detector with configuration.
@@ -38,6 +64,23 @@ class ErrorDetector:
         """
         self.config = config
 
+        # Resolve config-derived values once instead of on every detection call
+        self._confidence_threshold = config.paperless_error_tag_threshold
+        self._severity_levels = frozenset(config.paperless_error_severity_levels or ())
+        self._detectors = (
+            self._detect_llm_failures,
+            self._detect_boundary_issues,
+            self._detect_pdf_errors,
+            self._detect_metadata_issues,
+            self._detect_output_issues,
+            self._detect_validation_failures,
+        )
+        self._step_failure_detectors = (
+            self._detect_llm_step_failure,
+            self._detect_pdf_step_failure,
+            self._detect_step_failure,
+        )
+
     def detect_errors(self, workflow_state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect processing errors from workflow state.
 
@@ -55,23 +98,14 @@ class ErrorDetector:
 
         current_step = workflow_state.get("current_step", "")
 
-        # Detect LLM analysis failures
-        errors.extend(self._detect_llm_failures(workflow_state))
-
-        # Detect boundary detection issues
-        errors.extend(self._detect_boundary_issues(workflow_state))
-
-        # Detect PDF processing errors
-        errors.extend(self._detect_pdf_errors(workflow_state))
-
-        # Detect metadata extraction problems
-        errors.extend(self._detect_metadata_issues(workflow_state))
+        # Failed steps are all named "*_error"; successful steps skip these checks
+        if "error" in current_step:
+            for detector in self._step_failure_detectors:
+                errors.extend(detector(workflow_state))
 
-        # Detect file output issues
-        errors.extend(self._detect_output_issues(workflow_state))
-
-        # Detect validation failures
-        errors.extend(self._detect_validation_failures(workflow_state))
+        # Run LLM, boundary, PDF, metadata, output and validation checks
+        for detector in self._detectors:
+            errors.extend(detector(workflow_state))
 
         # Log detected errors
         if errors:
@@ -85,48 +119,81 @@ class ErrorDetector:
 
         return errors
 
-    def _detect_llm_failures(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Detect LLM analysis failures."""
-        errors = []
+    def _detect_llm_step_failure(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Detect a failed step caused by the LLM provider."""
+        error_message = state.get("error_message", "")
+
+        if not any(keyword in error_message.lower() for keyword in LLM_ERROR_KEYWORDS):
+            return []
+
+        current_step = state.get("current_step", "")
+        return [
+            {
+                "type": "llm_analysis_failure",
+                "severity": "high",
+                "description": f"LLM analysis failed: {error_message}",
+                "step": current_step,
+                "details": {"error_message": error_message},
+            }
+        ]
+
+    def _detect_pdf_step_failure(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Detect a failed PDF ingestion or generation step."""
+        current_step = state.get("current_step", "")
+
+        if current_step not in PDF_ERROR_STEPS:
+            return []
+
+        error_message = state.get("error_message", "")
+        severity = "critical" if "pdf_ingestion" in current_step else "high"
+        return [
+            {
+                "type": "pdf_processing_error",
+                "severity": severity,
+                "description": f"PDF processing failed: {error_message}",
+                "step": current_step,
+                "details": {"error_message": error_message},
+            }
+        ]
+
+    def _detect_step_failure(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Detect a failed metadata, file organization or validation step."""
         current_step = state.get("current_step", "")
+        step_failure = STEP_FAILURES.get(current_step)
+
+        if step_failure is None:
+            return []
+
+        error_type, severity, label = step_failure
         error_message = state.get("error_message", "")
+        return [
+            {
+                "type": error_type,
+                "severity": severity,
+                "description": f"{label} failed: {error_message}",
+                "step": current_step,
+                "details": {"error_message": error_message},
+            }
+        ]
 
-        # Check for explicit LLM-related error steps
-        if "error" in current_step and any(
-            keyword in error_message.lower()
-            for keyword in ["llm", "api", "model", "openai", "ollama"]
-        ):
-            errors.append(
-                {
-                    "type": "llm_analysis_failure",
-                    "severity": "high",
-                    "description": f"LLM analysis failed: {error_message}",
-                    "step": current_step,
-                    "details": {"error_message": error_message},
-                }
-            )
+    def _detect_llm_failures(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Detect LLM analysis failures."""
+        errors = []
 
         # Check for boundary detection fallback (indicates LLM failure)
-        boundaries = state.get("detected_boundaries", [])
-        if boundaries and any(
-            b.get("reasoning") == "Fallback page-based segmentation" for b in boundaries
-        ):
+        fallback_count = sum(
+            1
+            for b in state.get("detected_boundaries") or ()
+            if b.get("reasoning") == FALLBACK_BOUNDARY_REASONING
+        )
+        if fallback_count:
             errors.append(
                 {
                     "type": "llm_analysis_failure",
                     "severity": "medium",
                     "description": "LLM boundary detection failed, used fallback method",
                     "step": "statement_detection",
-                    "details": {
-                        "fallback_boundaries": len(
-                            [
-                                b
-                                for b in boundaries
-                                if b.get("reasoning")
-                                == "Fallback page-based segmentation"
-                            ]
-                        )
-                    },
+                    "details": {"fallback_boundaries": fallback_count},
                 }
             )
 
@@ -140,43 +207,31 @@ class ErrorDetector:
         if not boundaries:
             return errors
 
-        # Check for low confidence boundaries and suspicious patterns in single loop
-        low_confidence_boundaries = []
-        suspicious_boundaries = []
-
-        for boundary in boundaries:
-            # Check confidence
-            if (
-                boundary.get("confidence", 1.0)
-                < self.config.paperless_error_tag_threshold
-            ):
-                low_confidence_boundaries.append(boundary)
-
-            # Check for suspicious patterns (very small or very large segments)
-            start_page = boundary.get("start_page", 1)
-            end_page = boundary.get("end_page", 1)
-            page_count = end_page - start_page + 1
-
-            if (
-                page_count < MIN_PAGES_PER_STATEMENT
-                or page_count > MAX_PAGES_PER_STATEMENT
-            ):
-                suspicious_boundaries.append(boundary)
-
-        if low_confidence_boundaries:
-            avg_confidence = sum(
-                b.get("confidence", 0) for b in low_confidence_boundaries
-            ) / len(low_confidence_boundaries)
+        low_confidences = self._low_confidences(boundaries)
+
+        # Check for suspicious patterns (very small or very large segments)
+        suspicious_boundaries = [
+            boundary
+            for boundary in boundaries
+            if not (
+                MIN_PAGES_PER_STATEMENT
+                <= boundary.get("end_page", 1) - boundary.get("start_page", 1) + 1
+                <= MAX_PAGES_PER_STATEMENT
+            )
+        ]
+
+        if low_confidences:
+            avg_confidence = sum(low_confidences) / len(low_confidences)
             errors.append(
                 {
                     "type": "low_confidence_boundaries",
                     "severity": "high" if avg_confidence < 0.3 else "medium",
-                    "description": f"Found {len(low_confidence_boundaries)} boundaries with low confidence (avg: {avg_confidence:.2f})",
+                    "description": f"Found {len(low_confidences)} boundaries with low confidence (avg: {avg_confidence:.2f})",
                     "step": "statement_detection",
                     "details": {
-                        "low_confidence_count": len(low_confidence_boundaries),
+                        "low_confidence_count": len(low_confidences),
                         "average_confidence": avg_confidence,
-                        "threshold": self.config.paperless_error_tag_threshold,
+                        "threshold": self._confidence_threshold,
                     },
                 }
             )
@@ -194,24 +249,15 @@ class ErrorDetector:
 
         return errors
 
+    def _low_confidences(self, items: List[Dict[str, Any]]) -> List[float]:
+        """Return the confidence values that fall below the error threshold."""
+        threshold = self._confidence_threshold
+        confidences = [item.get("confidence", 1.0) for item in items]
+        return [c for c in confidences if c < threshold]
+
     def _detect_pdf_errors(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect PDF processing errors."""
         errors = []
-        current_step = state.get("current_step", "")
-        error_message = state.get("error_message", "")
-
-        # Check for PDF processing error steps
-        if current_step in ["pdf_ingestion_error", "pdf_generation_error"]:
-            severity = "critical" if "pdf_ingestion" in current_step else "high"
-            errors.append(
-                {
-                    "type": "pdf_processing_error",
-                    "severity": severity,
-                    "description": f"PDF processing failed: {error_message}",
-                    "step": current_step,
-                    "details": {"error_message": error_message},
-                }
-            )
 
         # Check for missing generated files
         generated_files = state.get("generated_files", [])
@@ -238,44 +284,24 @@ class ErrorDetector:
     def _detect_metadata_issues(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect metadata extraction problems."""
         errors = []
-        current_step = state.get("current_step", "")
-        error_message = state.get("error_message", "")
-
-        # Check for metadata extraction error step
-        if current_step == "metadata_extraction_error":
-            errors.append(
-                {
-                    "type": "metadata_extraction_failure",
-                    "severity": "high",
-                    "description": f"Metadata extraction failed: {error_message}",
-                    "step": current_step,
-                    "details": {"error_message": error_message},
-                }
-            )
 
         # Check for low confidence metadata
         extracted_metadata = state.get("extracted_metadata", [])
         if extracted_metadata:
-            low_confidence_metadata = [
-                m
-                for m in extracted_metadata
-                if m.get("confidence", 1.0) < self.config.paperless_error_tag_threshold
-            ]
+            low_confidences = self._low_confidences(extracted_metadata)
 
-            if low_confidence_metadata:
-                avg_confidence = sum(
-                    m.get("confidence", 0) for m in low_confidence_metadata
-                ) / len(low_confidence_metadata)
+            if low_confidences:
+                avg_confidence = sum(low_confidences) / len(low_confidences)
                 errors.append(
                     {
                         "type": "metadata_extraction_failure",
                         "severity": "medium",
-                        "description": f"Low confidence metadata extraction for {len(low_confidence_metadata)} statements (avg: {avg_confidence:.2f})",
+                        "description": f"Low confidence metadata extraction for {len(low_confidences)} statements (avg: {avg_confidence:.2f})",
                         "step": "metadata_extraction",
                         "details": {
-                            "low_confidence_count": len(low_confidence_metadata),
+                            "low_confidence_count": len(low_confidences),
                             "average_confidence": avg_confidence,
-                            "threshold": self.config.paperless_error_tag_threshold,
+                            "threshold": self._confidence_threshold,
                         },
                     }
                 )
@@ -302,20 +328,6 @@ class ErrorDetector:
     def _detect_output_issues(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect file output issues."""
         errors = []
-        current_step = state.get("current_step", "")
-
-        # Check for file organization errors
-        if current_step == "file_organization_error":
-            error_message = state.get("error_message", "")
-            errors.append(
-                {
-                    "type": "file_output_error",
-                    "severity": "high",
-                    "description": f"File organization failed: {error_message}",
-                    "step": current_step,
-                    "details": {"error_message": error_message},
-                }
-            )
 
         # Check for skipped fragments due to low confidence
         skipped_fragments = state.get("skipped_fragments", 0)
@@ -341,22 +353,8 @@ class ErrorDetector:
     ) -> List[Dict[str, Any]]:
         """Detect validation failures."""
         errors = []
-        current_step = state.get("current_step", "")
         validation_results = state.get("validation_results", {})
 
-        # Check for validation error step
-        if current_step == "output_validation_error":
-            error_message = state.get("error_message", "")
-            errors.append(
-                {
-                    "type": "validation_failure",
-                    "severity": "critical",
-                    "description": f"Output validation failed: {error_message}",
-                    "step": current_step,
-                    "details": {"error_message": error_message},
-                }
-            )
-
         # Check validation results for specific failures
         if validation_results and not validation_results.get("is_valid", True):
             failed_checks = []
@@ -395,9 +393,4 @@ class ErrorDetector:
             return False
 
         # Check if any errors meet the severity threshold
-        severity_levels = self.config.paperless_error_severity_levels
-        for error in errors:
-            if error["severity"] in severity_levels:
-                return True
-
-        return False
+        return any(error["severity"] in self._severity_levels for error in errors)
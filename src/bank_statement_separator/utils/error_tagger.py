@@ -1,7 +1,7 @@
 """Error tagging utility for applying error tags to Paperless documents."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..config import Config
 from .paperless_client import PaperlessClient
@@ -12,14 +12,18 @@ logger = logging.getLogger(__name__)
 class ErrorTagger:
     """Applies error tags to Paperless documents with processing issues."""
 
-    def __init__(self, config: Config):
+    def __init__(
+        self, config: Config, paperless_client: Optional[PaperlessClient] = None
+    ):
         """Initialize error tagger with configuration.
 
         Args:
             config: Application configuration
+            paperless_client: Existing client to tag through; a new one is
+                created from ``config`` if omitted
         """
         self.config = config
-        self.paperless_client = PaperlessClient(config)
+        self.paperless_client = paperless_client or PaperlessClient(config)
 
     def apply_error_tags(
         self, errors: List[Dict[str, Any]], upload_results: Dict[str, Any]
@@ -125,48 +129,41 @@ class ErrorTagger:
             logger.warning("No document IDs available for batch error tagging")
             return result
 
-        # Apply error tags to all documents
+        # Apply error tags to all documents in a single bulk request
         try:
             error_tags = self._generate_error_tags(errors)
 
-            for document_id in document_ids:
-                try:
-                    tag_result = self.paperless_client.apply_tags_to_document(
-                        document_id,
-                        error_tags,
-                        wait_time=self.config.paperless_tag_wait_time,
-                    )
-
-                    if tag_result.get("success"):
-                        result["tagged_documents"] += 1
-                        result["details"].append(
-                            {
-                                "document_id": document_id,
-                                "tags_applied": tag_result.get("tags_applied", 0),
-                                "tags": error_tags,
-                            }
-                        )
-                        logger.info(
-                            f"Applied {len(error_tags)} error tags to document {document_id}"
-                        )
-                    else:
-                        result["success"] = False
-                        error_msg = tag_result.get("error", "Unknown tagging error")
-                        result["errors"].append(
-                            f"Failed to tag document {document_id}: {error_msg}"
-                        )
-                        logger.warning(
-                            f"Failed to apply error tags to document {document_id}: {error_msg}"
-                        )
-
-                except Exception as e:
-                    result["success"] = False
-                    result["errors"].append(
-                        f"Exception tagging document {document_id}: {str(e)}"
-                    )
-                    logger.error(
-                        f"Exception applying error tags to document {document_id}: {e}"
-                    )
+            tag_result = self.paperless_client.apply_tags_to_documents(
+                document_ids,
+                error_tags,
+                wait_time=self.config.paperless_tag_wait_time,
+            )
+
+            if tag_result.get("success"):
+                result["tagged_documents"] = len(document_ids)
+                result["details"] = [
+                    {
+                        "document_id": document_id,
+                        "tags_applied": tag_result.get("tags_applied", 0),
+                        "tags": error_tags,
+                    }
+                    for document_id in document_ids
+                ]
+                logger.info(
+                    f"Applied {len(error_tags)} error tags to {len(document_ids)} documents"
+                )
+            else:
+                # One bulk request means the batch succeeds or fails as a whole;
+                # still report the outcome per document as individual mode does
+                result["success"] = False
+                error_msg = tag_result.get("error", "Unknown tagging error")
+                result["errors"].extend(
+                    f"Failed to tag document {document_id}: {error_msg}"
+                    for document_id in document_ids
+                )
+                logger.warning(
+                    f"Failed to apply error tags to documents {document_ids}: {error_msg}"
+                )
 
         except Exception as e:
             result["success"] = False
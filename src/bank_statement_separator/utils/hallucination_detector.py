@@ -3,11 +3,65 @@
 import logging
 import re
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Known valid bank patterns (expandable)
+KNOWN_BANKS = frozenset(
+    {
+        "westpac",
+        "commonwealth",
+        "anz",
+        "nab",
+        "bendigo",
+        "suncorp",
+        "chase",
+        "wells fargo",
+        "bank of america",
+        "citibank",
+        "jpmorgan",
+        "hsbc",
+        "barclays",
+        "lloyds",
+        "royal bank",
+        "td bank",
+    }
+)
+
+# Words too generic to count towards a bank name match
+_GENERIC_BANK_WORDS = frozenset({"bank", "banking", "corporation", "company"})
+
+# Suspicious patterns that often indicate hallucinations
+SUSPICIOUS_BANK_PATTERNS = (
+    r"bank\s+of\s+[a-z]+\s+[a-z]+\s+[a-z]+",  # overly complex bank names
+    r"account\s+ending\s+in\s+\*+",  # generic account descriptions
+    r"customer\s+service",  # generic service terms
+    r"statement\s+period\s+unknown",  # generic period descriptions
+)
+
+_PLACEHOLDER_ACCOUNT_NUMBERS = frozenset(
+    {"123456789", "000000000", "111111111", "***1234***"}
+)
+
+# Years from the 1800s, 1900s and 2000s
+_YEAR_RE = re.compile(r"\b(1[89]\d{2}|20\d{2})\b")
+
+
+@lru_cache(maxsize=256)
+def _bank_words(bank: str) -> frozenset:
+    """Return the substantial (longer than three letters) words of a bank name."""
+    return frozenset(word for word in bank.split() if len(word) > 3)
+
+
+@lru_cache(maxsize=256)
+def _compile_suspicious_pattern(pattern: str) -> re.Pattern:
+    """Compile a suspicious bank name pattern once."""
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class HallucinationType(Enum):
     """Types of hallucinations that can be detected."""
@@ -41,33 +95,13 @@ class HallucinationDetector:
     def __init__(self):
         self.alerts: List[HallucinationAlert] = []
 
-        # Known valid bank patterns (expandable)
-        self.valid_banks = {
-            "westpac",
-            "commonwealth",
-            "anz",
-            "nab",
-            "bendigo",
-            "suncorp",
-            "chase",
-            "wells fargo",
-            "bank of america",
-            "citibank",
-            "jpmorgan",
-            "hsbc",
-            "barclays",
-            "lloyds",
-            "royal bank",
-            "td bank",
-        }
+        # Per-instance copies so callers can extend them without side effects
+        self.valid_banks = set(KNOWN_BANKS)
+        self.suspicious_patterns = list(SUSPICIOUS_BANK_PATTERNS)
 
-        # Suspicious patterns that often indicate hallucinations
-        self.suspicious_patterns = [
-            r"bank\s+of\s+[a-z]+\s+[a-z]+\s+[a-z]+",  # overly complex bank names
-            r"account\s+ending\s+in\s+\*+",  # generic account descriptions
-            r"customer\s+service",  # generic service terms
-            r"statement\s+period\s+unknown",  # generic period descriptions
-        ]
+    def reset(self) -> None:
+        """Forget alerts recorded by earlier validations."""
+        self.alerts.clear()
 
     def validate_boundary_response(
         self, boundaries: List[Dict[str, Any]], total_pages: int, document_text: str
@@ -75,13 +109,17 @@ class HallucinationDetector:
         """Validate boundary detection response for hallucinations."""
         alerts = []
 
+        # Resolve each boundary's pages once for the range checks
+        page_ranges = [
+            (boundary.get("start_page", 1), boundary.get("end_page", total_pages))
+            for boundary in boundaries
+        ]
+
         # Check for phantom statements (more boundaries than possible)
-        alerts.extend(
-            self._check_phantom_statements(boundaries, total_pages, document_text)
-        )
+        alerts.extend(self._check_phantom_statements(page_ranges, total_pages))
 
         # Check for invalid page ranges
-        alerts.extend(self._check_invalid_page_ranges(boundaries, total_pages))
+        alerts.extend(self._check_invalid_page_ranges(page_ranges))
 
         # Check for duplicate boundaries
         alerts.extend(self._check_duplicate_boundaries(boundaries))
@@ -112,18 +150,18 @@ class HallucinationDetector:
         return alerts
 
     def _check_phantom_statements(
-        self, boundaries: List[Dict[str, Any]], total_pages: int, document_text: str
+        self, page_ranges: List[Tuple[int, int]], total_pages: int
     ) -> List[HallucinationAlert]:
         """Detect phantom statements that don't exist in the document."""
         alerts = []
 
-        if len(boundaries) > total_pages:
+        if len(page_ranges) > total_pages:
             alerts.append(
                 HallucinationAlert(
                     type=HallucinationType.PHANTOM_STATEMENT,
                     severity="critical",
-                    description=f"Detected {len(boundaries)} statements in {total_pages}-page document",
-                    detected_value=len(boundaries),
+                    description=f"Detected {len(page_ranges)} statements in {total_pages}-page document",
+                    detected_value=len(page_ranges),
                     expected_value=f"≤{total_pages}",
                     confidence=1.0,
                     source="boundary_validation",
@@ -131,10 +169,7 @@ class HallucinationDetector:
             )
 
         # Check if boundaries reference content that doesn't exist
-        for i, boundary in enumerate(boundaries):
-            start_page = boundary.get("start_page", 1)
-            end_page = boundary.get("end_page", total_pages)
-
+        for i, (start_page, end_page) in enumerate(page_ranges):
             if start_page > total_pages or end_page > total_pages:
                 alerts.append(
                     HallucinationAlert(
@@ -151,15 +186,12 @@ class HallucinationDetector:
         return alerts
 
     def _check_invalid_page_ranges(
-        self, boundaries: List[Dict[str, Any]], total_pages: int
+        self, page_ranges: List[Tuple[int, int]]
     ) -> List[HallucinationAlert]:
         """Check for logically invalid page ranges."""
         alerts = []
 
-        for i, boundary in enumerate(boundaries):
-            start_page = boundary.get("start_page", 1)
-            end_page = boundary.get("end_page", total_pages)
-
+        for i, (start_page, end_page) in enumerate(page_ranges):
             if start_page > end_page:
                 alerts.append(
                     HallucinationAlert(
@@ -251,24 +283,16 @@ class HallucinationDetector:
         # Check if bank name appears in document text
         if bank_name not in document_text.lower():
             # Check for partial matches with known banks (require substantial words, not just "of", "the", etc.)
-            bank_words = bank_name.split()
-            substantial_words = [
+            substantial_words = {
                 word
-                for word in bank_words
-                if len(word) > 3
-                and word not in ["bank", "banking", "corporation", "company"]
-            ]
-            found_match = False
-
-            for known_bank in self.valid_banks:
-                known_words = known_bank.split()
-                substantial_known_words = [
-                    word for word in known_words if len(word) > 3
-                ]
-                # Require at least one substantial word match
-                if any(word in substantial_words for word in substantial_known_words):
-                    found_match = True
-                    break
+                for word in bank_name.split()
+                if len(word) > 3 and word not in _GENERIC_BANK_WORDS
+            }
+            # Require at least one substantial word match
+            found_match = any(
+                not _bank_words(known_bank).isdisjoint(substantial_words)
+                for known_bank in self.valid_banks
+            )
 
             if not found_match:
                 alerts.append(
@@ -284,7 +308,7 @@ class HallucinationDetector:
 
         # Check for suspicious patterns
         for pattern in self.suspicious_patterns:
-            if re.search(pattern, bank_name, re.IGNORECASE):
+            if _compile_suspicious_pattern(pattern).search(bank_name):
                 alerts.append(
                     HallucinationAlert(
                         type=HallucinationType.FABRICATED_BANK,
@@ -309,7 +333,7 @@ class HallucinationDetector:
             return alerts
 
         # Check for obviously fake patterns
-        if account_number in ["123456789", "000000000", "111111111", "***1234***"]:
+        if account_number in _PLACEHOLDER_ACCOUNT_NUMBERS:
             alerts.append(
                 HallucinationAlert(
                     type=HallucinationType.NONSENSICAL_ACCOUNT,
@@ -346,10 +370,7 @@ class HallucinationDetector:
         statement_period = metadata.get("statement_period", "")
         if statement_period:
             # Check for future dates (statements shouldn't be from the future)
-            from datetime import datetime
-
-            # Extract years from statement period (match 1800s, 1900s, 2000s)
-            years = re.findall(r"\b(1[89]\d{2}|20\d{2})\b", statement_period)
+            years = _YEAR_RE.findall(statement_period)
             current_year = datetime.now().year
 
             for year_str in years:
@@ -1,9 +1,14 @@
 """Paperless-ngx API client for document upload integration."""
 
+import asyncio
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
 
@@ -11,6 +16,43 @@ from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_REQUEST_METHODS = frozenset(
+    {"request", "get", "head", "post", "put", "patch", "delete"}
+)
+
+
+class _TimeoutSession:
+    """View of a pooled session that applies one timeout to every request.
+
+    The session's own timeout is sized for slow uploads; wrapping it keeps the
+    timeout each call site asks for, just as a one-off client would.
+    """
+
+    def __init__(self, session: httpx.Client, timeout: float):
+        self._session = session
+        self._timeout = timeout
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._session, name)
+        if name not in _REQUEST_METHODS:
+            return attr
+
+        def send(*args: Any, **kwargs: Any) -> httpx.Response:
+            kwargs.setdefault("timeout", self._timeout)
+            return attr(*args, **kwargs)
+
+        return send
+
 
 class PaperlessUploadError(Exception):
     """Exception raised when paperless-ngx upload fails."""
@@ -39,6 +81,53 @@ class PaperlessClient:
             if config.paperless_token
             else {}
         )
+        # Lower-cased tag name -> tag ID, filled as tags are resolved
+        self._tag_id_cache: Dict[str, int] = {}
+        # Pooled keep-alive client, only set between open_session() and close()
+        self._session: Optional[httpx.Client] = None
+
+    def open_session(self) -> "PaperlessClient":
+        """Open a pooled HTTP client reused by all subsequent requests.
+
+        Without a session every API call opens its own connection. Holding one
+        open lets repeated uploads and tag updates reuse keep-alive connections
+        instead of paying a TCP/TLS handshake per request. Call close() when done.
+
+        Returns:
+            PaperlessClient: This client, for chaining
+        """
+        if self._session is None:
+            self._session = httpx.Client(
+                timeout=max(60.0, float(self.config.paperless_query_timeout)),
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                transport=httpx.HTTPTransport(retries=3),
+            )
+        return self
+
+    def close(self) -> None:
+        """Close the pooled HTTP client opened by open_session(), if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "PaperlessClient":
+        return self.open_session()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def _http_client(self, timeout: float = 5.0) -> Iterator[httpx.Client]:
+        """Yield the pooled session if open, otherwise a one-off client.
+
+        Either way every request made through the yielded client uses
+        ``timeout``.
+        """
+        if self._session is not None:
+            yield _TimeoutSession(self._session, timeout)
+        else:
+            with httpx.Client(timeout=timeout) as client:
+                yield client
 
     def is_enabled(self) -> bool:
         """Check if paperless integration is enabled and properly configured.
@@ -67,7 +156,7 @@ class PaperlessClient:
             )
 
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with self._http_client(timeout=30.0) as client:
                 response = client.get(
                     f"{self.base_url}/api/documents/",
                     headers=self.headers,
@@ -86,6 +175,30 @@ class PaperlessClient:
             logger.error(error_msg)
             raise PaperlessUploadError(error_msg) from e
 
+    def ping(self, timeout: float = 2.0) -> bool:
+        """Cheaply check whether the paperless-ngx API is reachable.
+
+        Unlike test_connection(), this never raises and uses a short timeout,
+        so callers can skip work up front when the server is offline.
+
+        Args:
+            timeout: Seconds to wait for the API root to respond
+
+        Returns:
+            bool: True if the API root answered with a successful status
+        """
+        if not self.is_enabled():
+            return False
+
+        try:
+            with self._http_client(timeout=timeout) as client:
+                response = client.head(f"{self.base_url}/api/", headers=self.headers)
+        except httpx.RequestError as e:
+            logger.debug(f"Paperless ping failed: {e}")
+            return False
+
+        return response.is_success
+
     def upload_document(
         self,
         file_path: Path,
@@ -119,8 +232,52 @@ class PaperlessClient:
         if not file_path.exists():
             raise PaperlessUploadError(f"File not found: {file_path}")
 
+        result = self.upload_document_bytes(
+            data=file_path.read_bytes(),
+            filename=file_path.name,
+            title=title,
+            tags=tags,
+            correspondent=correspondent,
+            document_type=document_type,
+            storage_path=storage_path,
+        )
+        result["file_path"] = str(file_path)
+        return result
+
+    def upload_document_bytes(
+        self,
+        data: bytes,
+        filename: str,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        correspondent: Optional[str] = None,
+        document_type: Optional[str] = None,
+        storage_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload in-memory PDF content to paperless-ngx.
+
+        Args:
+            data: PDF content to upload
+            filename: Filename to report for the upload
+            title: Document title (defaults to filename stem)
+            tags: List of tags to apply (uses config defaults if None)
+            correspondent: Correspondent name (uses config default if None)
+            document_type: Document type (uses config default if None)
+            storage_path: Storage path name (uses config default if None)
+
+        Returns:
+            Dict containing upload response with document ID and status
+
+        Raises:
+            PaperlessUploadError: If upload fails
+        """
+        if not self.is_enabled():
+            raise PaperlessUploadError(
+                "Paperless integration not enabled or configured"
+            )
+
         # Prepare metadata
-        title = title or file_path.stem
+        title = title or Path(filename).stem
         tags = tags or self.config.paperless_tags or []
         correspondent = correspondent or self.config.paperless_correspondent
         document_type = document_type or self.config.paperless_document_type
@@ -161,12 +318,12 @@ class PaperlessClient:
             form_data["storage_path"] = str(resolved_storage_path)
 
         try:
-            with httpx.Client(timeout=60.0) as client:
+            with self._http_client(timeout=60.0) as client:
                 # Upload file using multipart form
                 files = {
                     "document": (
-                        file_path.name,
-                        file_path.read_bytes(),
+                        filename,
+                        data,
                         "application/pdf",
                     )
                 }
@@ -215,7 +372,7 @@ class PaperlessClient:
                     "document_id": document_id,
                     "task_id": task_id,
                     "title": title,
-                    "file_path": str(file_path),
+                    "file_path": None,
                     "tags": tags,
                     "correspondent": correspondent,
                     "document_type": document_type,
@@ -224,7 +381,7 @@ class PaperlessClient:
                 }
 
         except httpx.RequestError as e:
-            error_msg = f"Failed to upload {file_path.name} to paperless-ngx: {str(e)}"
+            error_msg = f"Failed to upload {filename} to paperless-ngx: {str(e)}"
             logger.error(error_msg)
             raise PaperlessUploadError(error_msg) from e
         except httpx.HTTPStatusError as e:
@@ -239,7 +396,8 @@ class PaperlessClient:
 
         This method uses the bulk_edit endpoint to ADD tags to a document without replacing
         existing system-applied tags. This is crucial for preserving paperless-ngx system
-        rule tags while still applying our custom output tags.
+        rule tags while still applying our custom output tags. All tags are added in a
+        single modify_tags request.
 
         Args:
             document_id: ID of the document to apply tags to
@@ -262,87 +420,221 @@ class PaperlessClient:
             return {"success": True, "tags_applied": 0}
 
         # Wait for document processing to complete before applying tags
+        time.sleep(self._tag_wait_seconds(wait_time, f"document {document_id}"))
+
+        return self._tag_single_document(document_id, tags)
+
+    async def apply_tags_to_document_async(
+        self, document_id: int, tags: List[str], wait_time: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async variant of apply_tags_to_document for concurrent tagging.
+
+        Tag name resolution and the bulk_edit request run in a worker thread so
+        that many documents can be tagged concurrently from one event loop.
+
+        Args:
+            document_id: ID of the document to apply tags to
+            tags: List of tag names to apply
+            wait_time: Wait time in seconds before applying tags (uses config default if None)
+
+        Returns:
+            Dict containing operation results
+
+        Raises:
+            PaperlessUploadError: If tag application fails
+        """
+        if not self.is_enabled():
+            raise PaperlessUploadError(
+                "Paperless integration not enabled or configured"
+            )
+
+        if not tags:
+            logger.debug(f"No tags to apply to document {document_id}")
+            return {"success": True, "tags_applied": 0}
+
+        await asyncio.sleep(
+            self._tag_wait_seconds(wait_time, f"document {document_id}")
+        )
+
+        return await asyncio.to_thread(self._tag_single_document, document_id, tags)
+
+    def apply_tags_to_documents(
+        self,
+        document_ids: List[int],
+        tags: List[str],
+        wait_time: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Add the same tags to several documents in one bulk_edit request.
+
+        Existing tags are preserved, as with apply_tags_to_document, but tag
+        names are resolved once and the wait before tagging happens once for
+        the whole batch.
+
+        Args:
+            document_ids: IDs of the documents to tag
+            tags: List of tag names to apply
+            wait_time: Wait time in seconds before applying tags (uses config default if None)
+
+        Returns:
+            Dict containing operation results
+
+        Raises:
+            PaperlessUploadError: If tag application fails
+        """
+        if not self.is_enabled():
+            raise PaperlessUploadError(
+                "Paperless integration not enabled or configured"
+            )
+
+        if not tags or not document_ids:
+            logger.debug("No tags or documents for bulk tag application")
+            return {"success": True, "document_ids": document_ids, "tags_applied": 0}
+
+        time.sleep(self._tag_wait_seconds(wait_time, f"{len(document_ids)} documents"))
+
+        try:
+            tag_ids, response, error = self._add_tags(document_ids, tags)
+        except Exception as e:
+            error_msg = f"Failed to apply tags to documents {document_ids}: {str(e)}"
+            logger.error(error_msg)
+            raise PaperlessUploadError(error_msg) from e
+
+        if not tag_ids:
+            return {
+                "success": False,
+                "document_ids": document_ids,
+                "error": "No valid tags resolved",
+            }
+
+        if error is not None:
+            logger.warning(
+                f"Failed to apply {len(tag_ids)} tags to documents {document_ids}: {error}"
+            )
+            return {
+                "success": False,
+                "document_ids": document_ids,
+                "error": str(error),
+            }
+
+        logger.info(
+            f"Successfully applied {len(tag_ids)} tags to {len(document_ids)} documents"
+        )
+        return {
+            "success": True,
+            "document_ids": document_ids,
+            "tags_applied": len(tag_ids),
+            "response": response,
+        }
+
+    def _tag_wait_seconds(self, wait_time: Optional[int], target: str) -> int:
+        """Return the wait before tagging, falling back to the configured default."""
         actual_wait_time = (
             wait_time if wait_time is not None else self.config.paperless_tag_wait_time
         )
         if actual_wait_time > 0:
             logger.debug(
-                f"Waiting {actual_wait_time} seconds for document {document_id} processing to complete before applying tags"
+                f"Waiting {actual_wait_time} seconds for {target} processing to complete before applying tags"
             )
-            import time
-
-            time.sleep(actual_wait_time)
+        return max(actual_wait_time, 0)
 
+    def _tag_single_document(self, document_id: int, tags: List[str]) -> Dict[str, Any]:
+        """Add tags to one document and summarize the outcome per tag."""
         try:
-            # Resolve tag names to IDs
-            tag_ids = self._resolve_tags(tags)
-            if not tag_ids:
-                logger.warning(f"No valid tag IDs resolved from tags: {tags}")
-                return {"success": False, "error": "No valid tags resolved"}
-
-            successful_applications = []
-            failed_applications = []
-
-            # Apply each tag individually using bulk_edit add_tag method
-            # This preserves existing tags while adding new ones
-            for i, tag_id in enumerate(tag_ids):
-                try:
-                    with httpx.Client(timeout=30.0) as client:
-                        response = client.post(
-                            f"{self.base_url}/api/documents/bulk_edit/",
-                            headers=self.headers,
-                            json={
-                                "documents": [document_id],
-                                "method": "add_tag",
-                                "parameters": {"tag": tag_id},
-                            },
-                        )
-                        response.raise_for_status()
-
-                        successful_applications.append(
-                            {
-                                "tag_name": tags[i],
-                                "tag_id": tag_id,
-                                "response": response.json(),
-                            }
-                        )
+            tag_ids, response, error = self._add_tags([document_id], tags)
+        except Exception as e:
+            error_msg = f"Failed to apply tags to document {document_id}: {str(e)}"
+            logger.error(error_msg)
+            raise PaperlessUploadError(error_msg) from e
 
-                        logger.debug(
-                            f"Successfully applied tag '{tags[i]}' (ID: {tag_id}) to document {document_id}"
-                        )
+        if not tag_ids:
+            return {"success": False, "error": "No valid tags resolved"}
 
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                    error_msg = f"Failed to apply tag '{tags[i]}' (ID: {tag_id}) to document {document_id}: {str(e)}"
-                    logger.warning(error_msg)
-                    failed_applications.append(
-                        {"tag_name": tags[i], "tag_id": tag_id, "error": error_msg}
-                    )
+        return self._summarize_tag_application(
+            document_id, tags, tag_ids, response=response, error=error
+        )
 
-            # Return comprehensive results
-            result = {
-                "success": len(failed_applications) == 0,
-                "document_id": document_id,
-                "tags_applied": len(successful_applications),
-                "tags_failed": len(failed_applications),
-                "successful_applications": successful_applications,
-                "failed_applications": failed_applications,
+    def _add_tags(
+        self, document_ids: List[int], tags: List[str]
+    ) -> tuple[List[int], Any, Optional[Exception]]:
+        """Resolve tag names and add them to the documents in one bulk_edit request.
+
+        Returns:
+            Tuple of (resolved tag IDs, response JSON, request error). The tag ID
+            list is empty when no tags resolve, in which case nothing is sent.
+        """
+        tag_ids = self._resolve_tags(tags)
+        if not tag_ids:
+            logger.warning(f"No valid tag IDs resolved from tags: {tags}")
+            return [], None, None
+
+        # modify_tags preserves existing tags while adding new ones
+        try:
+            with self._http_client(timeout=30.0) as client:
+                response = client.post(
+                    f"{self.base_url}/api/documents/bulk_edit/",
+                    headers=self.headers,
+                    content=self._modify_tags_body(document_ids, tag_ids),
+                )
+                response.raise_for_status()
+                return tag_ids, response.json(), None
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            return tag_ids, None, e
+
+    def _modify_tags_body(self, document_ids: List[int], tag_ids: List[int]) -> bytes:
+        """Serialize a bulk_edit request that adds all tag IDs to the documents."""
+        return _dumps(
+            {
+                "documents": document_ids,
+                "method": "modify_tags",
+                "parameters": {"add_tags": tag_ids, "remove_tags": []},
             }
+        )
 
-            if result["success"]:
-                logger.info(
-                    f"Successfully applied {len(successful_applications)} tags to document {document_id}"
+    def _summarize_tag_application(
+        self,
+        document_id: int,
+        tags: List[str],
+        tag_ids: List[int],
+        response: Any = None,
+        error: Optional[Exception] = None,
+    ) -> Dict[str, Any]:
+        """Build the result dict for a tag application and log the outcome."""
+        successful_applications = []
+        failed_applications = []
+
+        for tag_name, tag_id in zip(tags, tag_ids):
+            if error is None:
+                successful_applications.append(
+                    {"tag_name": tag_name, "tag_id": tag_id, "response": response}
                 )
             else:
-                logger.warning(
-                    f"Applied {len(successful_applications)}/{len(tag_ids)} tags to document {document_id}, {len(failed_applications)} failed"
+                failed_applications.append(
+                    {
+                        "tag_name": tag_name,
+                        "tag_id": tag_id,
+                        "error": f"Failed to apply tag '{tag_name}' (ID: {tag_id}) to document {document_id}: {str(error)}",
+                    }
                 )
 
-            return result
+        result = {
+            "success": error is None,
+            "document_id": document_id,
+            "tags_applied": len(successful_applications),
+            "tags_failed": len(failed_applications),
+            "successful_applications": successful_applications,
+            "failed_applications": failed_applications,
+        }
 
-        except Exception as e:
-            error_msg = f"Failed to apply tags to document {document_id}: {str(e)}"
-            logger.error(error_msg)
-            raise PaperlessUploadError(error_msg) from e
+        if result["success"]:
+            logger.info(
+                f"Successfully applied {len(successful_applications)} tags to document {document_id}"
+            )
+        else:
+            logger.warning(
+                f"Failed to apply {len(tag_ids)} tags to document {document_id}: {error}"
+            )
+
+        return result
 
     def poll_task_completion(
         self, task_id: str, timeout_seconds: int = 300, poll_interval: int = 5
@@ -365,8 +657,6 @@ class PaperlessClient:
                 "Paperless integration not enabled or configured"
             )
 
-        import time
-
         start_time = time.time()
         logger.info(f"Starting task polling for {task_id}, timeout={timeout_seconds}s")
 
@@ -380,7 +670,7 @@ class PaperlessClient:
                     )
 
                 # Query task status
-                with httpx.Client(timeout=30.0) as client:
+                with self._http_client(timeout=30.0) as client:
                     response = client.get(
                         f"{self.base_url}/api/tasks/",
                         headers=self.headers,
@@ -479,6 +769,78 @@ class PaperlessClient:
             logger.error(error_msg)
             raise PaperlessUploadError(error_msg) from e
 
+    def wait_for_documents(
+        self, document_ids: List[int], timeout: float = 30.0
+    ) -> Dict[int, bool]:
+        """Wait until each document is retrievable from the documents API.
+
+        Every ID is polled in parallel with exponential backoff (100ms doubling
+        to 1.6s between attempts), so the wait ends as soon as paperless-ngx has
+        finished with the slowest document rather than after a fixed delay.
+
+        Args:
+            document_ids: IDs of documents expected to become available
+            timeout: Maximum seconds to wait for each document
+
+        Returns:
+            Dict mapping each document ID to whether it became available in time;
+            missing (falsy) IDs map to False without being polled
+
+        Raises:
+            PaperlessUploadError: If paperless integration is not enabled
+        """
+        if not self.is_enabled():
+            raise PaperlessUploadError(
+                "Paperless integration not enabled or configured"
+            )
+
+        result = {doc_id: False for doc_id in document_ids if not doc_id}
+        if result:
+            logger.warning(
+                f"Skipping {len(result)} uploads without a document ID; "
+                "treating them as failed"
+            )
+
+        pollable_ids = [doc_id for doc_id in document_ids if doc_id]
+        if not pollable_ids:
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(len(pollable_ids), 8)) as executor:
+            ready = list(
+                executor.map(
+                    lambda doc_id: self._wait_for_document(doc_id, timeout),
+                    pollable_ids,
+                )
+            )
+
+        result.update(zip(pollable_ids, ready))
+        return result
+
+    def _wait_for_document(self, document_id: int, timeout: float) -> bool:
+        """Poll a single document until it exists or the timeout expires."""
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+
+        while True:
+            try:
+                with self._http_client(timeout=min(timeout, 5.0)) as client:
+                    response = client.get(
+                        f"{self.base_url}/api/documents/{document_id}/",
+                        headers=self.headers,
+                    )
+                if response.status_code == 200:
+                    return True
+            except httpx.RequestError as e:
+                logger.debug(f"Document {document_id} not reachable yet: {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Document {document_id} not available after {timeout}s")
+                return False
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.6)
+
     def find_document_by_title_pattern(
         self, title_pattern: str, created_after: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
@@ -497,7 +859,7 @@ class PaperlessClient:
             return None
 
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with self._http_client(timeout=30.0) as client:
                 params = {
                     "page_size": 20,
                     "ordering": "-created",  # Most recent first
@@ -603,8 +965,13 @@ class PaperlessClient:
         tag_ids = []
 
         for tag_name in tag_names:
+            cached_id = self._tag_id_cache.get(tag_name.lower())
+            if cached_id is not None:
+                tag_ids.append(cached_id)
+                continue
+
             try:
-                with httpx.Client(timeout=30.0) as client:
+                with self._http_client(timeout=30.0) as client:
                     # First try to find existing tag
                     response = client.get(
                         f"{self.base_url}/api/tags/",
@@ -617,6 +984,7 @@ class PaperlessClient:
                     if results:
                         # Tag exists, use its ID
                         tag_ids.append(results[0]["id"])
+                        self._tag_id_cache[tag_name.lower()] = results[0]["id"]
                         logger.debug(
                             f"Found existing tag '{tag_name}' with ID {results[0]['id']}"
                         )
@@ -632,6 +1000,7 @@ class PaperlessClient:
 
                         new_tag = create_response.json()
                         tag_ids.append(new_tag["id"])
+                        self._tag_id_cache[tag_name.lower()] = new_tag["id"]
                         logger.info(
                             f"Created new tag '{tag_name}' with ID {new_tag['id']}"
                         )
@@ -656,7 +1025,7 @@ class PaperlessClient:
             return None
 
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with self._http_client(timeout=30.0) as client:
                 # First try to find existing correspondent
                 response = client.get(
                     f"{self.base_url}/api/correspondents/",
@@ -706,7 +1075,7 @@ class PaperlessClient:
             return None
 
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with self._http_client(timeout=30.0) as client:
                 # First try to find existing document type
                 response = client.get(
                     f"{self.base_url}/api/document_types/",
@@ -756,7 +1125,7 @@ class PaperlessClient:
             return None
 
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with self._http_client(timeout=30.0) as client:
                 # First try to find existing storage path
                 response = client.get(
                     f"{self.base_url}/api/storage_paths/",
@@ -794,6 +1163,47 @@ class PaperlessClient:
             logger.warning(f"Failed to resolve storage path '{storage_path_name}': {e}")
             return None
 
+    async def resolve_metadata_async(
+        self,
+        tags: Optional[List[str]] = None,
+        correspondent: Optional[str] = None,
+        document_type: Optional[str] = None,
+        storage_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Resolve tags, correspondent, document type and storage path concurrently.
+
+        Each resolver does its own lookup-then-create round trips, so they run
+        in worker threads and overlap instead of queueing behind each other.
+        Open a session first to have them share pooled connections.
+
+        Args:
+            tags: Tag names to resolve
+            correspondent: Correspondent name to resolve
+            document_type: Document type name to resolve
+            storage_path: Storage path name to resolve
+
+        Returns:
+            Dict with resolved ``tags``, ``correspondent``, ``document_type``
+            and ``storage_path`` IDs
+        """
+        (
+            tag_ids,
+            correspondent_id,
+            document_type_id,
+            storage_path_id,
+        ) = await asyncio.gather(
+            asyncio.to_thread(self._resolve_tags, tags or []),
+            asyncio.to_thread(self._resolve_correspondent, correspondent),
+            asyncio.to_thread(self._resolve_document_type, document_type),
+            asyncio.to_thread(self._resolve_storage_path, storage_path),
+        )
+        return {
+            "tags": tag_ids,
+            "correspondent": correspondent_id,
+            "document_type": document_type_id,
+            "storage_path": storage_path_id,
+        }
+
     def query_documents_by_tags(
         self,
         tags: List[str],
@@ -881,7 +1291,74 @@ class PaperlessClient:
                 "Paperless integration not enabled or configured"
             )
 
-        # Build query parameters
+        params = self._build_document_query_params(
+            tags=tags,
+            correspondent=correspondent,
+            document_type=document_type,
+            created_after=created_after,
+            created_before=created_before,
+            page_size=page_size,
+        )
+
+        try:
+            with self._http_client(
+                timeout=float(self.config.paperless_query_timeout)
+            ) as client:
+                response = client.get(
+                    f"{self.base_url}/api/documents/",
+                    headers=self.headers,
+                    params=params,
+                )
+                response.raise_for_status()
+
+                data = response.json()
+                results = data.get("results", [])
+
+                # Filter results to ensure only PDF documents (double-check)
+                pdf_documents = [doc for doc in results if self._is_pdf_document(doc)]
+
+                logger.info(
+                    f"Found {len(pdf_documents)} PDF documents out of {len(results)} total documents"
+                )
+
+                return {
+                    "success": True,
+                    "count": len(pdf_documents),
+                    "documents": pdf_documents,
+                    "total_available": data.get("count", 0),
+                }
+
+        except httpx.RequestError as e:
+            error_msg = f"Failed to query documents from paperless-ngx: {str(e)}"
+            logger.error(error_msg)
+            raise PaperlessUploadError(error_msg) from e
+        except httpx.HTTPStatusError as e:
+            error_msg = f"Document query failed with status {e.response.status_code}: {e.response.text}"
+            logger.error(error_msg)
+            raise PaperlessUploadError(error_msg) from e
+
+    def _build_document_query_params(
+        self,
+        tags: Optional[List[str]] = None,
+        correspondent: Optional[str] = None,
+        document_type: Optional[str] = None,
+        created_after: Optional[date] = None,
+        created_before: Optional[date] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Build query parameters for the documents API, resolving filter names.
+
+        Args:
+            tags: List of tag names to filter by
+            correspondent: Correspondent name to filter by
+            document_type: Document type name to filter by
+            created_after: Filter documents created after this date
+            created_before: Filter documents created before this date
+            page_size: Maximum number of documents per page
+
+        Returns:
+            Dict of query parameters
+        """
         params = {
             "mime_type": "application/pdf",  # Only PDF documents
             "page_size": page_size or self.config.paperless_max_documents,
@@ -911,33 +1388,67 @@ class PaperlessClient:
         if created_before:
             params["created__date__lte"] = created_before.isoformat()
 
+        return params
+
+    def iter_documents(
+        self,
+        tags: Optional[List[str]] = None,
+        correspondent: Optional[str] = None,
+        document_type: Optional[str] = None,
+        created_after: Optional[date] = None,
+        created_before: Optional[date] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over PDF documents matching the filters, one page at a time.
+
+        Pages are fetched lazily as the consumer advances, so stopping early
+        avoids requesting the remaining pages.
+
+        Args:
+            tags: List of tag names to filter by
+            correspondent: Correspondent name to filter by
+            document_type: Document type name to filter by
+            created_after: Filter documents created after this date
+            created_before: Filter documents created before this date
+            page_size: Number of documents to request per page
+
+        Yields:
+            PDF document dicts from the documents API
+
+        Raises:
+            PaperlessUploadError: If a page query fails
+        """
+        if not self.is_enabled():
+            raise PaperlessUploadError(
+                "Paperless integration not enabled or configured"
+            )
+
+        params = self._build_document_query_params(
+            tags=tags,
+            correspondent=correspondent,
+            document_type=document_type,
+            created_after=created_after,
+            created_before=created_before,
+            page_size=page_size,
+        )
+
         try:
-            with httpx.Client(
+            with self._http_client(
                 timeout=float(self.config.paperless_query_timeout)
             ) as client:
-                response = client.get(
-                    f"{self.base_url}/api/documents/",
-                    headers=self.headers,
-                    params=params,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                results = data.get("results", [])
-
-                # Filter results to ensure only PDF documents (double-check)
-                pdf_documents = [doc for doc in results if self._is_pdf_document(doc)]
+                url: Optional[str] = f"{self.base_url}/api/documents/"
+                while url:
+                    response = client.get(url, headers=self.headers, params=params)
+                    response.raise_for_status()
 
-                logger.info(
-                    f"Found {len(pdf_documents)} PDF documents out of {len(results)} total documents"
-                )
+                    data = response.json()
+                    for doc in data.get("results", []):
+                        if self._is_pdf_document(doc):
+                            yield doc
 
-                return {
-                    "success": True,
-                    "count": len(pdf_documents),
-                    "documents": pdf_documents,
-                    "total_available": data.get("count", 0),
-                }
+                    # The next link already carries the query parameters
+                    url = data.get("next")
+                    params = None
 
         except httpx.RequestError as e:
             error_msg = f"Failed to query documents from paperless-ngx: {str(e)}"
@@ -978,7 +1489,7 @@ class PaperlessClient:
             )
 
         try:
-            with httpx.Client(
+            with self._http_client(
                 timeout=float(self.config.paperless_query_timeout)
             ) as client:
                 response = client.get(
@@ -1102,7 +1613,7 @@ class PaperlessClient:
             raise PaperlessUploadError("Paperless integration not enabled")
 
         try:
-            with httpx.Client() as client:
+            with self._http_client() as client:
                 response = client.get(
                     f"{self.base_url}/api/tags/",
                     headers=self.headers,
@@ -1206,7 +1717,7 @@ class PaperlessClient:
                 }
 
             # Get current document to retrieve existing tags
-            with httpx.Client() as client:
+            with self._http_client() as client:
                 # Get current document data
                 response = client.get(
                     f"{self.base_url}/api/documents/{document_id}/",
@@ -1277,7 +1788,7 @@ class PaperlessClient:
                 }
 
             # Get current document to retrieve existing tags
-            with httpx.Client() as client:
+            with self._http_client() as client:
                 # Get current document data
                 response = client.get(
                     f"{self.base_url}/api/documents/{document_id}/",
@@ -1,8 +1,10 @@
 """LangGraph workflow definition for bank statement separation."""
 
 import logging
+import re
 import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TypedDict
 
@@ -10,6 +12,89 @@ from langgraph.graph import END, StateGraph
 
 logger = logging.getLogger(__name__)
 
+# Separators dropped from bank names when building filenames
+_BANK_NAME_SEPARATORS = str.maketrans("", "", " -_")
+
+# Month name mapping for natural language statement periods
+_MONTH_NUMBERS = {
+    "january": "01",
+    "february": "02",
+    "march": "03",
+    "april": "04",
+    "may": "05",
+    "june": "06",
+    "july": "07",
+    "august": "08",
+    "september": "09",
+    "october": "10",
+    "november": "11",
+    "december": "12",
+}
+
+# "DD Month YYYY" dates inside a statement period
+_DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+
+
+# Filename components repeat across the statements of a batch, so the pure
+# string helpers behind the workflow's filename methods are memoized
+@lru_cache(maxsize=512)
+def _normalized_bank_name(bank_name: str) -> str:
+    """Lowercase bank_name, drop separators and common words, keep 10 chars."""
+    # Normalize: lowercase, remove spaces and special chars
+    normalized = bank_name.lower().translate(_BANK_NAME_SEPARATORS)
+
+    # Remove common words to shorten
+    normalized = (
+        normalized.replace("banking", "").replace("corporation", "").replace("bank", "")
+    )
+
+    # Truncate to max 10 chars
+    return normalized[:10] or "unknown"
+
+
+@lru_cache(maxsize=512)
+def _last4_digits(account_number: str) -> str:
+    """Return the last four digits of account_number, or '0000'."""
+    # Extract only digits from the account number
+    digits = "".join(filter(str.isdigit, account_number))
+
+    # Return last 4 digits, or '0000' if insufficient
+    return digits[-4:] if len(digits) >= 4 else "0000"
+
+
+@lru_cache(maxsize=512)
+def _statement_end_date(statement_period: str) -> str:
+    """Return the YYYY-MM-DD end date of statement_period, or 'unknown-date'."""
+    # Handle range format like '2015-04-22_2015-05-21' (extract end date)
+    if "_" in statement_period:
+        parts = statement_period.split("_")
+        if len(parts) == 2:
+            end_date = parts[1].strip()
+            if len(end_date) == 10 and end_date.count("-") == 2:
+                return end_date
+
+    # Handle single YYYY-MM-DD format (already correct)
+    if len(statement_period) == 10 and statement_period.count("-") == 2:
+        return statement_period
+
+    # Handle natural language date ranges like "01 January 2023 to 31 January 2023"
+    end_date_str = statement_period
+    if " to " in statement_period.lower():
+        parts = statement_period.split(" to ")
+        if len(parts) == 2:
+            end_date_str = parts[1].strip()
+
+    # Try to parse "DD Month YYYY" format
+    match = _DAY_MONTH_YEAR_RE.search(end_date_str.lower())
+    if match:
+        day, month_name, year = match.groups()
+        month_num = _MONTH_NUMBERS.get(month_name)
+        if month_num:
+            return f"{year}-{month_num}-{day.zfill(2)}"
+
+    # Handle 'Unknown' or other invalid formats
+    return "unknown-date"
+
 
 class WorkflowState(TypedDict):
     """State structure for the bank statement separation workflow."""
@@ -61,14 +146,25 @@ class StatementBoundary:
 class BankStatementWorkflow:
     """LangGraph workflow for bank statement separation."""
 
-    def __init__(self, config: Any):
+    def __init__(
+        self,
+        config: Any,
+        paperless_client: Optional[Any] = None,
+        llm_provider: Optional[Any] = None,
+    ):
         """
         Initialize workflow with configuration.
 
         Args:
             config: Application configuration object
+            paperless_client: Optional PaperlessClient shared by every run; pass
+                one with an open session to reuse its pooled connections
+            llm_provider: Optional LLMProvider shared by the analysis nodes of
+                every run, so its chat client and connections are reused
         """
         self.config = config
+        self.paperless_client = paperless_client
+        self.llm_provider = llm_provider
 
         # Initialize error handler
         from .utils.error_handler import ErrorHandler
@@ -324,7 +420,7 @@ class BankStatementWorkflow:
             # Try LLM-based boundary detection first
             try:
                 logger.info("Attempting LLM-based boundary detection")
-                analyzer = LLMAnalyzer(self.config)
+                analyzer = LLMAnalyzer(self.config, provider=self.llm_provider)
 
                 llm_result = analyzer.detect_statement_boundaries(
                     text_chunks, total_pages
@@ -417,7 +513,7 @@ class BankStatementWorkflow:
 
             # Initialize LLM analyzer for metadata extraction
             try:
-                analyzer = LLMAnalyzer(self.config)
+                analyzer = LLMAnalyzer(self.config, provider=self.llm_provider)
             except Exception as analyzer_error:
                 logger.warning(f"Failed to initialize LLM analyzer: {analyzer_error}")
                 analyzer = None
@@ -989,7 +1085,7 @@ class BankStatementWorkflow:
             from .utils.paperless_client import PaperlessClient
 
             # Initialize paperless client
-            paperless_client = PaperlessClient(self.config)
+            paperless_client = self.paperless_client or PaperlessClient(self.config)
 
             # Check if paperless integration is enabled
             if not paperless_client.is_enabled():
@@ -1320,22 +1416,7 @@ class BankStatementWorkflow:
         if not bank_name or not isinstance(bank_name, str):
             return "unknown"
 
-        # Normalize: lowercase, remove spaces and special chars
-        normalized = (
-            bank_name.lower().replace(" ", "").replace("-", "").replace("_", "")
-        )
-
-        # Remove common words to shorten
-        normalized = (
-            normalized.replace("banking", "")
-            .replace("corporation", "")
-            .replace("bank", "")
-        )
-
-        # Truncate to max 10 chars
-        normalized = normalized[:10] if normalized else "unknown"
-
-        return normalized or "unknown"
+        return _normalized_bank_name(bank_name)
 
     def _extract_last4_digits(self, account_number: str) -> str:
         """Extract last 4 digits from account number.
@@ -1345,11 +1426,7 @@ class BankStatementWorkflow:
         if not account_number or not isinstance(account_number, str):
             return "0000"
 
-        # Extract only digits from the account number
-        digits = "".join(char for char in account_number if char.isdigit())
-
-        # Return last 4 digits, or '0000' if insufficient
-        return digits[-4:] if len(digits) >= 4 else "0000"
+        return _last4_digits(account_number)
 
     def _format_statement_date(self, statement_period: str) -> str:
         """Format statement period to extract end date in YYYY-MM-DD format.
@@ -1365,64 +1442,7 @@ class BankStatementWorkflow:
         if not statement_period or not isinstance(statement_period, str):
             return "unknown-date"
 
-        # Handle range format like '2015-04-22_2015-05-21' (extract end date)
-        if "_" in statement_period:
-            parts = statement_period.split("_")
-            if len(parts) == 2:
-                end_date = parts[1].strip()
-                if len(end_date) == 10 and end_date.count("-") == 2:
-                    return end_date
-
-        # Handle single YYYY-MM-DD format (already correct)
-        if len(statement_period) == 10 and statement_period.count("-") == 2:
-            return statement_period
-
-        # Handle natural language date ranges like "01 January 2023 to 31 January 2023"
-        try:
-            import re
-
-            # Look for "to" pattern to extract end date
-            if " to " in statement_period.lower():
-                parts = statement_period.split(" to ")
-                if len(parts) == 2:
-                    end_date_str = parts[1].strip()
-                else:
-                    end_date_str = statement_period
-            else:
-                end_date_str = statement_period
-
-            # Month name mapping
-            month_names = {
-                "january": "01",
-                "february": "02",
-                "march": "03",
-                "april": "04",
-                "may": "05",
-                "june": "06",
-                "july": "07",
-                "august": "08",
-                "september": "09",
-                "october": "10",
-                "november": "11",
-                "december": "12",
-            }
-
-            # Try to parse "DD Month YYYY" format
-            date_pattern = r"(\d{1,2})\s+(\w+)\s+(\d{4})"
-            match = re.search(date_pattern, end_date_str.lower())
-
-            if match:
-                day, month_name, year = match.groups()
-                month_num = month_names.get(month_name.lower())
-                if month_num:
-                    formatted_date = f"{year}-{month_num}-{day.zfill(2)}"
-                    return formatted_date
-
-        except (ImportError, ValueError, AttributeError):
-            pass
-
-        # Handle 'Unknown' or other invalid formats
-        return "unknown-date"
+        return _statement_end_date(statement_period)
 
     def _detect_and_tag_errors(
         self, state: WorkflowState, upload_results: Dict[str, Any]
@@ -1469,7 +1489,9 @@ class BankStatementWorkflow:
 
             if errors:
                 # Create error summary
-                error_tagger = ErrorTagger(self.config)
+                error_tagger = ErrorTagger(
+                    self.config, paperless_client=self.paperless_client
+                )
                 result["error_summary"] = error_tagger.create_error_summary(errors)
 
                 logger.info(
@@ -526,29 +526,19 @@ startxref
 
                     if matching_doc:
                         doc_id = matching_doc["id"]
-                        current_tags = matching_doc.get("tags", [])
 
-                        # Get test tag IDs
-                        test_tag_ids = client._resolve_tags(
-                            doc_info["pending_custom_tags"]
+                        # Add the custom tags through the client's bulk_edit
+                        # modify_tags request, which preserves existing tags
+                        tag_result = client.apply_tags_to_document(
+                            doc_id, doc_info["pending_custom_tags"], wait_time=0
                         )
-
-                        # Use bulk_edit endpoint to add each custom tag (preserves existing tags)
-                        for tag_id in test_tag_ids:
-                            with httpx.Client(timeout=30.0) as http_client:
-                                response = http_client.post(
-                                    f"{client.base_url}/api/documents/bulk_edit/",
-                                    headers=client.headers,
-                                    json={
-                                        "documents": [doc_id],
-                                        "method": "add_tag",
-                                        "parameters": {"tag": tag_id},
-                                    },
-                                )
-                                response.raise_for_status()
+                        if not tag_result.get("success"):
+                            raise PaperlessUploadError(
+                                tag_result.get("error", "Tag application failed")
+                            )
 
                         print(
-                            f"  ✅ Applied {len(test_tag_ids)} custom tags to async document {doc_id} using bulk_edit"
+                            f"  ✅ Applied {tag_result['tags_applied']} custom tags to async document {doc_id} using bulk_edit"
                         )
                     else:
                         print(
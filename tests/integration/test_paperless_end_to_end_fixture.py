@@ -10,9 +10,13 @@ The fixture ensures reproducible test results by using controlled test data
 with predictable statement boundaries and metadata.
 """
 
+import asyncio
+import hashlib
+import inspect
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -58,16 +62,38 @@ class DocumentSpec:
 class PaperlessEndToEndFixture:
     """End-to-end test fixture for Paperless API integration."""
 
-    def __init__(self, api_client: PaperlessClient):
-        """Initialize the fixture with a Paperless API client."""
+    def __init__(
+        self, api_client: PaperlessClient, pdf_cache_dir: Optional[Path] = None
+    ):
+        """Initialize the fixture with a Paperless API client.
+
+        Args:
+            api_client: Paperless API client
+            pdf_cache_dir: Optional directory for caching rendered test PDFs
+                between runs. Caching is disabled when not set.
+        """
         self.client = api_client
         self.created_documents: List[Dict[str, Any]] = []
         self.test_storage_paths = ["test-input", "test-processed"]
         self.test_timestamp = int(time.time())
+        self.pdf_cache_dir = Path(pdf_cache_dir) if pdf_cache_dir else None
 
     def cleanup_remote_storage(self) -> Dict[str, Any]:
         """Clear remote test storage paths to ensure clean test environment.
 
+        Returns:
+            Dict with cleanup results
+        """
+        return asyncio.run(self.cleanup_remote_storage_async())
+
+    async def cleanup_remote_storage_async(
+        self, max_concurrency: int = 16
+    ) -> Dict[str, Any]:
+        """Clear remote test storage paths, deleting documents concurrently.
+
+        Args:
+            max_concurrency: Maximum number of in-flight delete requests
+
         Returns:
             Dict with cleanup results
         """
@@ -77,14 +103,35 @@ class PaperlessEndToEndFixture:
             "documents_removed": 0,
             "errors": [],
         }
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        try:
-            for storage_path in self.test_storage_paths:
+        async def delete_document(
+            http_client: httpx.AsyncClient, storage_path: str, document_id: int
+        ) -> bool:
+            async with semaphore:
                 try:
-                    # Query documents in this storage path
-                    with httpx.Client(timeout=30.0) as http_client:
+                    delete_response = await http_client.delete(
+                        f"{self.client.base_url}/api/documents/{document_id}/",
+                        headers=self.client.headers,
+                    )
+                    delete_response.raise_for_status()
+                    return True
+                except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                    cleanup_results["errors"].append(
+                        {
+                            "storage_path": storage_path,
+                            "document_id": document_id,
+                            "error": str(e),
+                        }
+                    )
+                    return False
+
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as http_client:
+                for storage_path in self.test_storage_paths:
+                    try:
                         # Get storage path ID
-                        response = http_client.get(
+                        response = await http_client.get(
                             f"{self.client.base_url}/api/storage_paths/",
                             headers=self.client.headers,
                             params={"name__iexact": storage_path},
@@ -98,7 +145,7 @@ class PaperlessEndToEndFixture:
                         storage_path_id = storage_paths[0]["id"]
 
                         # Query documents in this storage path
-                        response = http_client.get(
+                        response = await http_client.get(
                             f"{self.client.base_url}/api/documents/",
                             headers=self.client.headers,
                             params={
@@ -110,33 +157,22 @@ class PaperlessEndToEndFixture:
 
                         documents = response.json().get("results", [])
 
-                        # Delete each document
-                        deleted_count = 0
-                        for doc in documents:
-                            try:
-                                delete_response = http_client.delete(
-                                    f"{self.client.base_url}/api/documents/{doc['id']}/",
-                                    headers=self.client.headers,
-                                )
-                                delete_response.raise_for_status()
-                                deleted_count += 1
-                            except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                                cleanup_results["errors"].append(
-                                    {
-                                        "storage_path": storage_path,
-                                        "document_id": doc["id"],
-                                        "error": str(e),
-                                    }
-                                )
+                        # Delete all documents concurrently
+                        deleted = await asyncio.gather(
+                            *(
+                                delete_document(http_client, storage_path, doc["id"])
+                                for doc in documents
+                            )
+                        )
 
                         cleanup_results["paths_cleared"].append(storage_path)
-                        cleanup_results["documents_removed"] += deleted_count
+                        cleanup_results["documents_removed"] += sum(deleted)
 
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                    cleanup_results["errors"].append(
-                        {"storage_path": storage_path, "error": str(e)}
-                    )
-                    cleanup_results["success"] = False
+                    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                        cleanup_results["errors"].append(
+                            {"storage_path": storage_path, "error": str(e)}
+                        )
+                        cleanup_results["success"] = False
 
         except Exception as e:
             cleanup_results["success"] = False
@@ -243,6 +279,40 @@ class PaperlessEndToEndFixture:
     def create_standardized_pdf(self, doc_spec: DocumentSpec) -> bytes:
         """Create a standardized PDF with known statement boundaries.
 
+        When ``pdf_cache_dir`` is set, rendered PDFs are reused from disk for
+        identical statement specifications.
+
+        Args:
+            doc_spec: Document specification
+
+        Returns:
+            PDF content as bytes
+        """
+        if self.pdf_cache_dir is None:
+            return self._render_standardized_pdf(doc_spec)
+
+        cache_file = self.pdf_cache_dir / f"testdoc-{self._pdf_cache_key(doc_spec)}.pdf"
+        if cache_file.exists():
+            return cache_file.read_bytes()
+
+        pdf_content = self._render_standardized_pdf(doc_spec)
+        self.pdf_cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pdf_content)
+        return pdf_content
+
+    def _pdf_cache_key(self, doc_spec: DocumentSpec) -> str:
+        """Build a cache key from the statement specs and the renderer source.
+
+        Only the statements affect the rendered content, so the timestamped
+        title and filename are deliberately excluded from the key.
+        """
+        renderer_source = inspect.getsource(type(self)._render_standardized_pdf)
+        key_material = f"{renderer_source}\n{doc_spec.statements!r}"
+        return hashlib.sha1(key_material.encode()).hexdigest()
+
+    def _render_standardized_pdf(self, doc_spec: DocumentSpec) -> bytes:
+        """Render a standardized PDF with ReportLab.
+
         Args:
             doc_spec: Document specification
 
@@ -367,78 +437,130 @@ class PaperlessEndToEndFixture:
 
         for doc_spec in test_docs:
             try:
-                # Create PDF content
-                pdf_content = self.create_standardized_pdf(doc_spec)
+                doc_info = self._upload_test_document(doc_spec)
+                if doc_info:
+                    upload_results["uploaded_documents"].append(doc_info)
+                    self.created_documents.append(doc_info)
+            except Exception as e:
+                upload_results["success"] = False
+                upload_results["errors"].append(
+                    {"document": doc_spec.title, "error": str(e)}
+                )
 
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(
-                    mode="wb", suffix=".pdf", delete=False
-                ) as tmp_file:
-                    tmp_file.write(pdf_content)
-                    tmp_path = Path(tmp_file.name)
+        return upload_results
+
+    def upload_test_documents_parallel(
+        self, test_docs: List[DocumentSpec], max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """Upload standardized test documents to Paperless concurrently.
+
+        The first document is uploaded on its own so that any missing tags,
+        correspondent, document type and storage path are created once before
+        the remaining uploads resolve them concurrently.
+
+        Args:
+            test_docs: List of test document specifications
+            max_workers: Maximum number of concurrent uploads
 
+        Returns:
+            Upload results in the same shape as ``upload_test_documents``
+        """
+        upload_results = self.upload_test_documents(test_docs[:1])
+        remaining_docs = test_docs[1:]
+        if not remaining_docs:
+            return upload_results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._upload_test_document, doc_spec)
+                for doc_spec in remaining_docs
+            ]
+
+            # Collect in submission order so results match the input order
+            for doc_spec, future in zip(remaining_docs, futures):
                 try:
-                    # Upload to paperless with test tags
-                    upload_result = self.client.upload_document(
-                        file_path=tmp_path,
-                        title=doc_spec.title,
-                        tags=[
-                            "test:automation",
-                            "test:multi-statement",
-                            "test:unprocessed",
-                        ],
-                        correspondent="Test Automation Bot",
-                        document_type="Test Statement Bundle",
-                        storage_path="test-input",
+                    doc_info = future.result()
+                    if doc_info:
+                        upload_results["uploaded_documents"].append(doc_info)
+                        self.created_documents.append(doc_info)
+                except Exception as e:
+                    upload_results["success"] = False
+                    upload_results["errors"].append(
+                        {"document": doc_spec.title, "error": str(e)}
                     )
 
-                    if upload_result and upload_result.get("success"):
-                        document_id = upload_result.get("document_id")
-                        task_id = upload_result.get("task_id")
+        return upload_results
 
-                        # Handle both immediate document ID and task-based uploads
-                        if document_id:
-                            # Immediate upload - apply test tags right away
-                            self._apply_test_tags_with_retry(
-                                document_id, doc_spec.title
-                            )
-                        elif task_id:
-                            # Task-based upload - wait for processing then apply tags
-                            document_id = self._wait_for_task_and_apply_tags(
-                                task_id, doc_spec.title
-                            )
-                        else:
-                            # Fallback - find document by title after short wait
-                            time.sleep(5)
-                            document_id = self._find_document_by_title_and_apply_tags(
-                                doc_spec.title
-                            )
+    def _upload_test_document(self, doc_spec: DocumentSpec) -> Optional[Dict[str, Any]]:
+        """Upload a single standardized test document and apply test tags.
 
-                        # Store document info with test specification
-                        doc_info = {
-                            "upload_result": upload_result,
-                            "spec": doc_spec,
-                            "title": doc_spec.title,
-                            "filename": doc_spec.filename,
-                            "expected_output_files": doc_spec.expected_output_files,
-                            "expected_statement_count": len(doc_spec.statements),
-                            "document_id": document_id,
-                        }
+        Args:
+            doc_spec: Test document specification
 
-                        upload_results["uploaded_documents"].append(doc_info)
-                        self.created_documents.append(doc_info)
+        Returns:
+            Document info for the upload, or None if Paperless rejected it
+        """
+        # Create PDF content
+        pdf_content = self.create_standardized_pdf(doc_spec)
 
-                finally:
-                    # Clean up temporary file
-                    tmp_path.unlink(missing_ok=True)
+        # Save to temporary file
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".pdf", delete=False
+        ) as tmp_file:
+            tmp_file.write(pdf_content)
+            tmp_path = Path(tmp_file.name)
 
-            except Exception as e:
-                upload_results["success"] = False
-                upload_results["errors"].append(
-                    {"document": doc_spec.title, "error": str(e)}
+        try:
+            # Upload to paperless with test tags
+            upload_result = self.client.upload_document(
+                file_path=tmp_path,
+                title=doc_spec.title,
+                tags=[
+                    "test:automation",
+                    "test:multi-statement",
+                    "test:unprocessed",
+                ],
+                correspondent="Test Automation Bot",
+                document_type="Test Statement Bundle",
+                storage_path="test-input",
+            )
+
+            if not (upload_result and upload_result.get("success")):
+                return None
+
+            document_id = upload_result.get("document_id")
+            task_id = upload_result.get("task_id")
+
+            # Handle both immediate document ID and task-based uploads
+            if document_id:
+                # Immediate upload - apply test tags right away
+                self._apply_test_tags_with_retry(document_id, doc_spec.title)
+            elif task_id:
+                # Task-based upload - wait for processing then apply tags
+                document_id = self._wait_for_task_and_apply_tags(
+                    task_id, doc_spec.title
+                )
+            else:
+                # Fallback - find document by title after short wait
+                time.sleep(5)
+                document_id = self._find_document_by_title_and_apply_tags(
+                    doc_spec.title
                 )
 
-        return upload_results
+            # Store document info with test specification
+            return {
+                "upload_result": upload_result,
+                "spec": doc_spec,
+                "title": doc_spec.title,
+                "filename": doc_spec.filename,
+                "expected_output_files": doc_spec.expected_output_files,
+                "expected_statement_count": len(doc_spec.statements),
+                "document_id": document_id,
+            }
+
+        finally:
+            # Clean up temporary file
+            tmp_path.unlink(missing_ok=True)
 
     def _apply_test_tags_with_retry(
         self, document_id: int, title: str, max_retries: int = 3
@@ -0,0 +1,87 @@
+"""Shared import bootstrap for the manual test scripts.
+
+Manual scripts are run directly (``python tests/manual/<script>.py``), so the
+project root is not on ``sys.path``. Importing this module first puts it there
+once and re-exports the package objects the scripts use.
+"""
+
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.bank_statement_separator.config import Config, load_config  # noqa: E402
+from src.bank_statement_separator.utils.error_detector import (  # noqa: E402
+    ErrorDetector,
+)
+from src.bank_statement_separator.utils.error_tagger import ErrorTagger  # noqa: E402
+from src.bank_statement_separator.utils.paperless_client import (  # noqa: E402
+    PaperlessClient,
+    PaperlessUploadError,
+)
+
+__all__ = [
+    "Config",
+    "ErrorDetector",
+    "ErrorTagger",
+    "PaperlessClient",
+    "PaperlessUploadError",
+    "buffered_stdout",
+    "clients_for",
+    "get_config",
+    "load_config",
+    "project_root",
+    "write_lines",
+]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load the default ``.env`` configuration once per process.
+
+    The instance is shared, so treat it as read-only; derive variations with
+    ``get_config().model_copy(update={...})`` instead of mutating it.
+    """
+    return load_config()
+
+
+@lru_cache(maxsize=4)
+def clients_for(
+    overrides: frozenset,
+) -> tuple[PaperlessClient, ErrorDetector, ErrorTagger]:
+    """Return the client, detector and tagger for a set of config overrides.
+
+    Instances are cached per override set, so scripts run in the same process
+    reuse them; the tagger shares the client and therefore its tag-ID cache.
+    """
+    config = load_config(overrides=dict(overrides))
+    client = PaperlessClient(config)
+    tagger = ErrorTagger(config, paperless_client=client)
+    return client, ErrorDetector(config), tagger
+
+
+@contextmanager
+def buffered_stdout():
+    """Turn off stdout line buffering for the block and restore it afterwards.
+
+    Scripts flush once per output section instead of on every line; use it as
+    a decorator on ``main`` so the change never outlives the script run.
+    """
+    previous = sys.stdout.line_buffering
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        sys.stdout.reconfigure(line_buffering=previous)
+
+
+def write_lines(lines: list[str]) -> None:
+    """Write buffered status lines to stdout in a single call and clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
@@ -204,61 +204,54 @@ def main():
             # Create PDF
             pdf_content = create_test_pdf(doc_info["filename"], doc_info["content"])
 
-            # Save to temp file
-            temp_dir = Path(tempfile.mkdtemp())
-            temp_file = temp_dir / doc_info["filename"]
-
-            with open(temp_file, "wb") as f:
-                f.write(pdf_content)
-
-            try:
-                # Upload with correct "test" storage path
-                upload_result = client.upload_document(
-                    file_path=temp_file,
-                    title=doc_info["title"],
-                    tags=["test:final-integration", "test:storage-path-test"],
-                    correspondent="Test Bank Final",
-                    document_type="Bank Statement",
-                    storage_path="test",  # This should work now
-                )
+            # Save to a temp file; the directory is removed on exit, even on Ctrl-C
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                temp_file = Path(tmp_dir) / doc_info["filename"]
+                temp_file.write_bytes(pdf_content)
+
+                try:
+                    # Upload with correct "test" storage path
+                    upload_result = client.upload_document(
+                        file_path=temp_file,
+                        title=doc_info["title"],
+                        tags=["test:final-integration", "test:storage-path-test"],
+                        correspondent="Test Bank Final",
+                        document_type="Bank Statement",
+                        storage_path="test",  # This should work now
+                    )
 
-                if upload_result.get("success"):
-                    task_id = upload_result.get("task_id")
-                    doc_id = upload_result.get("document_id")
-
-                    print(f"    ✅ Upload queued successfully")
-                    print(f"    📋 Task ID: {task_id}")
-                    print(f"    📋 Document ID: {doc_id}")
-
-                    # If we got a task ID, wait for processing
-                    if task_id and not doc_id:
-                        final_doc_id = wait_for_document_processing(client, task_id)
-                        if final_doc_id:
-                            doc_id = final_doc_id
-
-                    if doc_id:
-                        uploaded_documents.append(
-                            {
-                                "document_id": doc_id,
-                                "filename": doc_info["filename"],
-                                "title": doc_info["title"],
-                                "success": True,
-                            }
-                        )
+                    if upload_result.get("success"):
+                        task_id = upload_result.get("task_id")
+                        doc_id = upload_result.get("document_id")
+
+                        print(f"    ✅ Upload queued successfully")
+                        print(f"    📋 Task ID: {task_id}")
+                        print(f"    📋 Document ID: {doc_id}")
+
+                        # If we got a task ID, wait for processing
+                        if task_id and not doc_id:
+                            final_doc_id = wait_for_document_processing(client, task_id)
+                            if final_doc_id:
+                                doc_id = final_doc_id
+
+                        if doc_id:
+                            uploaded_documents.append(
+                                {
+                                    "document_id": doc_id,
+                                    "filename": doc_info["filename"],
+                                    "title": doc_info["title"],
+                                    "success": True,
+                                }
+                            )
+                        else:
+                            print(f"    ⚠️  Could not get final document ID")
                     else:
-                        print(f"    ⚠️  Could not get final document ID")
-                else:
-                    print(
-                        f"    ❌ Upload failed: {upload_result.get('error', 'Unknown error')}"
-                    )
+                        print(
+                            f"    ❌ Upload failed: {upload_result.get('error', 'Unknown error')}"
+                        )
 
-            except Exception as e:
-                print(f"    ❌ Upload exception: {e}")
-            finally:
-                # Clean up temp file
-                if temp_file.exists():
-                    temp_file.unlink()
-                temp_dir.rmdir()
+                except Exception as e:
+                    print(f"    ❌ Upload exception: {e}")
 
         print(
             f"\n✅ Successfully processed {len(uploaded_documents)} documents with real IDs"
@@ -15,194 +15,251 @@ Usage:
 import argparse
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from bank_statement_separator.config import load_config, Config
-from bank_statement_separator.utils.paperless_client import (
+from _bootstrap import (
+    Config,
     PaperlessClient,
     PaperlessUploadError,
+    load_config,
+    write_lines,
 )
 
 
-def setup_test_environment():
-    """Set up the test environment for API integration testing."""
-    print("🔧 Setting up API integration test environment...")
+_HELP_TEXT = """
+🔧 Paperless-ngx API Integration Testing Helper
 
-    # Check if integration env file exists
-    integration_env = Path("tests/env/paperless_integration.env")
-    if not integration_env.exists():
-        print(f"❌ Integration environment file not found: {integration_env}")
-        return False
+This script helps you set up and run integration tests against a real paperless-ngx instance.
 
-    # Load the environment
-    try:
-        load_config(str(integration_env))
-        print(f"✅ Loaded configuration from {integration_env}")
-    except Exception as e:
-        print(f"❌ Failed to load configuration: {e}")
-        return False
+📋 Prerequisites:
+1. A running paperless-ngx instance (local or remote)
+2. Valid API credentials (URL and token)
+3. Network access to the paperless-ngx server
 
-    # Check required environment variables
-    required_vars = {
-        "PAPERLESS_URL": "Paperless-ngx server URL",
-        "PAPERLESS_TOKEN": "Paperless-ngx API token",
-        "PAPERLESS_API_INTEGRATION_TEST": "Integration test enablement flag",
-    }
-
-    missing_vars = []
-    for var, description in required_vars.items():
-        if not os.getenv(var):
-            missing_vars.append(f"  {var}: {description}")
-
-    if missing_vars:
-        print("❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(var)
-        print(f"\n💡 Set these variables or update {integration_env}")
-        return False
+🚀 Quick Start:
+1. Configure tests/env/paperless_integration.env with real credentials
+2. Run: python tests/manual/test_paperless_api_integration.py --setup
+3. Run: python tests/manual/test_paperless_api_integration.py --validate
+4. Run: python tests/manual/test_paperless_api_integration.py --run-tests
 
-    # Create test directories
-    test_dirs = [
-        "test/output/api_integration",
-        "test/processed/api_integration",
-        "test/logs",
-        "test/quarantine/api_integration",
-        "test/error_reports/api_integration",
-    ]
+📁 Environment Configuration:
+Edit tests/env/paperless_integration.env and set:
+- PAPERLESS_URL=http://your-paperless-server:8000
+- PAPERLESS_TOKEN=your-api-token-here
+- PAPERLESS_API_INTEGRATION_TEST=true
 
-    for test_dir in test_dirs:
-        Path(test_dir).mkdir(parents=True, exist_ok=True)
-        print(f"📁 Created test directory: {test_dir}")
+🔐 Security Notes:
+- Never commit real credentials to version control
+- Use a test/development paperless-ngx instance
+- API tests will create/modify tags, correspondents, and document types
 
-    print("✅ Test environment setup completed successfully!")
-    return True
+🧪 Test Categories:
+- Connection and authentication testing
+- Document query and filtering
+- Document download and validation
+- Tag, correspondent, and document type management
+- Error handling and edge cases
+- Complete workflow testing
+
+⚡ Individual Test Commands:
+- Run connection tests: --run-tests -k "connection"
+- Run query tests: --run-tests -k "query"
+- Run download tests: --run-tests -k "download"
+- Run workflow tests: --run-tests -k "workflow"
+"""
 
 
-def validate_api_connection():
-    """Validate connection to paperless-ngx API."""
-    print("🔌 Validating paperless-ngx API connection...")
+@lru_cache(maxsize=None)
+def get_integration_client() -> PaperlessClient:
+    """Create the Paperless client once and share it across helper commands."""
+    integration_env = Path("tests/env/paperless_integration.env")
+    if integration_env.exists():
+        config = load_config(str(integration_env))
+    else:
+        config = Config(
+            openai_api_key="test-key",
+            paperless_enabled=True,
+            paperless_url=os.getenv("PAPERLESS_URL", "http://localhost:8000"),
+            paperless_token=os.getenv("PAPERLESS_TOKEN"),
+        )
+
+    return PaperlessClient(config)
 
+
+def setup_test_environment():
+    """Set up the test environment for API integration testing."""
+    lines: list[str] = []
     try:
-        # Load configuration
+        lines.append("🔧 Setting up API integration test environment...")
+
+        # Check if integration env file exists
         integration_env = Path("tests/env/paperless_integration.env")
-        if integration_env.exists():
-            config = load_config(str(integration_env))
-        else:
-            config = Config(
-                openai_api_key="test-key",
-                paperless_enabled=True,
-                paperless_url=os.getenv("PAPERLESS_URL", "http://localhost:8000"),
-                paperless_token=os.getenv("PAPERLESS_TOKEN"),
+        if not integration_env.exists():
+            lines.append(
+                f"❌ Integration environment file not found: {integration_env}"
             )
+            return False
 
-        # Create client
-        client = PaperlessClient(config)
+        # Load the environment
+        try:
+            load_config(str(integration_env))
+            lines.append(f"✅ Loaded configuration from {integration_env}")
+        except Exception as e:
+            lines.append(f"❌ Failed to load configuration: {e}")
+            return False
 
-        if not client.is_enabled():
-            print("❌ Paperless client is not enabled or configured")
-            print("💡 Check PAPERLESS_ENABLED, PAPERLESS_URL, and PAPERLESS_TOKEN")
+        # Check required environment variables
+        required_vars = {
+            "PAPERLESS_URL": "Paperless-ngx server URL",
+            "PAPERLESS_TOKEN": "Paperless-ngx API token",
+            "PAPERLESS_API_INTEGRATION_TEST": "Integration test enablement flag",
+        }
+
+        missing_vars = []
+        for var, description in required_vars.items():
+            if not os.getenv(var):
+                missing_vars.append(f"  {var}: {description}")
+
+        if missing_vars:
+            lines.append("❌ Missing required environment variables:")
+            for var in missing_vars:
+                lines.append(var)
+            lines.append(f"\n💡 Set these variables or update {integration_env}")
             return False
 
-        print(f"🔗 Testing connection to: {config.paperless_url}")
+        # Create test directories
+        test_dirs = [
+            "test/output/api_integration",
+            "test/processed/api_integration",
+            "test/logs",
+            "test/quarantine/api_integration",
+            "test/error_reports/api_integration",
+        ]
 
-        # Test connection
-        client.test_connection()
-        print("✅ API connection successful!")
+        for test_dir in test_dirs:
+            Path(test_dir).mkdir(parents=True, exist_ok=True)
+            lines.append(f"📁 Created test directory: {test_dir}")
 
-        # Test basic query
-        print("📄 Testing document query...")
-        result = client.query_documents(page_size=1)
-        print(f"📊 Found {result['count']} total document(s) in system")
-        print(f"📄 Retrieved {len(result['documents'])} document(s) for testing")
+        lines.append("✅ Test environment setup completed successfully!")
+        return True
+    finally:
+        write_lines(lines)
 
-        # Display document info if available
-        if result["documents"]:
-            doc = result["documents"][0]
-            print(
-                f"📄 Sample document: ID={doc['id']}, Title='{doc.get('title', 'N/A')}'"
-            )
 
-        print("✅ API validation completed successfully!")
-        return True
+def validate_api_connection():
+    """Validate connection to paperless-ngx API."""
+    lines: list[str] = []
+    try:
+        lines.append("🔌 Validating paperless-ngx API connection...")
 
-    except PaperlessUploadError as e:
-        print(f"❌ API validation failed: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error during validation: {e}")
-        return False
+        try:
+            client = get_integration_client()
+            config = client.config
 
+            if not client.is_enabled():
+                lines.append("❌ Paperless client is not enabled or configured")
+                lines.append(
+                    "💡 Check PAPERLESS_ENABLED, PAPERLESS_URL, and PAPERLESS_TOKEN"
+                )
+                return False
 
-def create_test_data():
-    """Create or prepare test data in paperless-ngx for testing."""
-    print("📝 Creating test data in paperless-ngx...")
+            lines.append(f"🔗 Testing connection to: {config.paperless_url}")
 
-    try:
-        # Load configuration
-        integration_env = Path("tests/env/paperless_integration.env")
-        if integration_env.exists():
-            config = load_config(str(integration_env))
-        else:
-            config = Config(
-                openai_api_key="test-key",
-                paperless_enabled=True,
-                paperless_url=os.getenv("PAPERLESS_URL", "http://localhost:8000"),
-                paperless_token=os.getenv("PAPERLESS_TOKEN"),
+            # Test connection
+            client.test_connection()
+            lines.append("✅ API connection successful!")
+
+            # Test basic query
+            lines.append("📄 Testing document query...")
+            result = client.query_documents(page_size=1)
+            lines.append(f"📊 Found {result['count']} total document(s) in system")
+            lines.append(
+                f"📄 Retrieved {len(result['documents'])} document(s) for testing"
             )
 
-        client = PaperlessClient(config)
+            # Display document info if available
+            if result["documents"]:
+                doc = result["documents"][0]
+                lines.append(
+                    f"📄 Sample document: ID={doc['id']}, Title='{doc.get('title', 'N/A')}'"
+                )
 
-        if not client.is_enabled():
-            print("❌ Paperless client not configured")
+            lines.append("✅ API validation completed successfully!")
+            return True
+
+        except PaperlessUploadError as e:
+            lines.append(f"❌ API validation failed: {e}")
             return False
+        except Exception as e:
+            lines.append(f"❌ Unexpected error during validation: {e}")
+            return False
+    finally:
+        write_lines(lines)
 
-        # Create test tags
-        print("🏷️  Creating test tags...")
-        test_tags = ["test-integration", "bank-statement", "api-test"]
 
-        for tag in test_tags:
-            try:
-                tag_ids = client._resolve_tags([tag])
-                if tag_ids:
-                    print(f"✅ Tag '{tag}' available (ID: {tag_ids[0]})")
-                else:
-                    print(f"⚠️  Tag '{tag}' could not be created/resolved")
-            except Exception as e:
-                print(f"⚠️  Tag '{tag}' error: {e}")
+def create_test_data():
+    """Create or prepare test data in paperless-ngx for testing."""
+    lines: list[str] = []
+    try:
+        lines.append("📝 Creating test data in paperless-ngx...")
 
-        # Create test correspondent
-        print("🏦 Creating test correspondent...")
         try:
-            correspondent_id = client._resolve_correspondent(
-                "Test Bank API Integration"
-            )
-            if correspondent_id:
-                print(
-                    f"✅ Correspondent 'Test Bank API Integration' available (ID: {correspondent_id})"
+            # Reuses the client built for --validate
+            client = get_integration_client()
+
+            if not client.is_enabled():
+                lines.append("❌ Paperless client not configured")
+                return False
+
+            # Create test tags
+            lines.append("🏷️  Creating test tags...")
+            test_tags = ["test-integration", "bank-statement", "api-test"]
+
+            for tag in test_tags:
+                try:
+                    tag_ids = client._resolve_tags([tag])
+                    if tag_ids:
+                        lines.append(f"✅ Tag '{tag}' available (ID: {tag_ids[0]})")
+                    else:
+                        lines.append(f"⚠️  Tag '{tag}' could not be created/resolved")
+                except Exception as e:
+                    lines.append(f"⚠️  Tag '{tag}' error: {e}")
+
+            # Create test correspondent
+            lines.append("🏦 Creating test correspondent...")
+            try:
+                correspondent_id = client._resolve_correspondent(
+                    "Test Bank API Integration"
                 )
-        except Exception as e:
-            print(f"⚠️  Correspondent creation error: {e}")
+                if correspondent_id:
+                    lines.append(
+                        f"✅ Correspondent 'Test Bank API Integration' available (ID: {correspondent_id})"
+                    )
+            except Exception as e:
+                lines.append(f"⚠️  Correspondent creation error: {e}")
 
-        # Create test document type
-        print("📄 Creating test document type...")
-        try:
-            doc_type_id = client._resolve_document_type("Test Statement Integration")
-            if doc_type_id:
-                print(
-                    f"✅ Document type 'Test Statement Integration' available (ID: {doc_type_id})"
+            # Create test document type
+            lines.append("📄 Creating test document type...")
+            try:
+                doc_type_id = client._resolve_document_type(
+                    "Test Statement Integration"
                 )
-        except Exception as e:
-            print(f"⚠️  Document type creation error: {e}")
+                if doc_type_id:
+                    lines.append(
+                        f"✅ Document type 'Test Statement Integration' available (ID: {doc_type_id})"
+                    )
+            except Exception as e:
+                lines.append(f"⚠️  Document type creation error: {e}")
 
-        print("✅ Test data creation completed!")
-        return True
+            lines.append("✅ Test data creation completed!")
+            return True
 
-    except Exception as e:
-        print(f"❌ Test data creation failed: {e}")
-        return False
+        except Exception as e:
+            lines.append(f"❌ Test data creation failed: {e}")
+            return False
+    finally:
+        write_lines(lines)
 
 
 def run_api_tests(test_pattern: str = ""):
@@ -233,8 +290,8 @@ def run_api_tests(test_pattern: str = ""):
 
         print(f"🏃 Running: {' '.join(cmd)}")
 
-        # Run tests
-        result = subprocess.run(cmd, capture_output=False, text=True)
+        # Run tests, streaming pytest output straight to the terminal
+        result = subprocess.run(cmd, check=False)
 
         if result.returncode == 0:
             print("✅ All API integration tests passed!")
@@ -279,48 +336,7 @@ def cleanup_test_data():
 
 def display_help():
     """Display help information for API integration testing."""
-    help_text = """
-🔧 Paperless-ngx API Integration Testing Helper
-
-This script helps you set up and run integration tests against a real paperless-ngx instance.
-
-📋 Prerequisites:
-1. A running paperless-ngx instance (local or remote)
-2. Valid API credentials (URL and token)
-3. Network access to the paperless-ngx server
-
-🚀 Quick Start:
-1. Configure tests/env/paperless_integration.env with real credentials
-2. Run: python tests/manual/test_paperless_api_integration.py --setup
-3. Run: python tests/manual/test_paperless_api_integration.py --validate
-4. Run: python tests/manual/test_paperless_api_integration.py --run-tests
-
-📁 Environment Configuration:
-Edit tests/env/paperless_integration.env and set:
-- PAPERLESS_URL=http://your-paperless-server:8000
-- PAPERLESS_TOKEN=your-api-token-here
-- PAPERLESS_API_INTEGRATION_TEST=true
-
-🔐 Security Notes:
-- Never commit real credentials to version control
-- Use a test/development paperless-ngx instance
-- API tests will create/modify tags, correspondents, and document types
-
-🧪 Test Categories:
-- Connection and authentication testing
-- Document query and filtering
-- Document download and validation
-- Tag, correspondent, and document type management
-- Error handling and edge cases
-- Complete workflow testing
-
-⚡ Individual Test Commands:
-- Run connection tests: --run-tests -k "connection"
-- Run query tests: --run-tests -k "query"
-- Run download tests: --run-tests -k "download"
-- Run workflow tests: --run-tests -k "workflow"
-"""
-    print(help_text)
+    sys.stdout.write(_HELP_TEXT + "\n")
 
 
 def main():
@@ -4,14 +4,9 @@ Manual test script to create and verify test documents in paperless-ngx.
 This script helps troubleshoot tag assignment and document querying.
 """
 
-from pathlib import Path
-import sys
+from itertools import islice
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from bank_statement_separator.config import Config
-from bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import Config, PaperlessClient
 
 
 def main():
@@ -36,14 +31,14 @@ def main():
         print(f"❌ Connection failed: {e}")
         return
 
-    print("\n📄 Querying all documents (first 10)...")
+    print("\n📄 Querying recent documents (first 5)...")
     try:
-        result = client.query_documents(page_size=10)
-        print(f"📊 Total documents in system: {result['count']}")
+        recent_docs = list(islice(client.iter_documents(page_size=10), 5))
+        print(f"📊 Documents returned: {len(recent_docs)}")
 
-        if result["documents"]:
+        if recent_docs:
             print("\n📋 Recent documents:")
-            for i, doc in enumerate(result["documents"][:5]):
+            for i, doc in enumerate(recent_docs):
                 print(
                     f"  {i + 1}. ID: {doc['id']}, Title: {doc.get('title', 'No title')}"
                 )
@@ -58,12 +53,13 @@ def main():
 
     print("\n🏷️  Querying documents with test:automation tag...")
     try:
-        result = client.query_documents_by_tags(["test:automation"])
-        print(f"📊 Documents with test:automation tag: {result['count']}")
+        test_docs = list(
+            islice(client.iter_documents(tags=["test:automation"], page_size=3), 3)
+        )
 
-        if result["count"] > 0:
+        if test_docs:
             print("✅ Found test documents!")
-            for doc in result["documents"][:3]:
+            for doc in test_docs:
                 print(f"  - {doc['id']}: {doc.get('title', 'No title')}")
         else:
             print("⚠️  No documents found with test:automation tag")
@@ -15,18 +15,17 @@ Environment variables required:
     PAPERLESS_API_INTEGRATION_TEST=true
 """
 
+import asyncio
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from src.bank_statement_separator.config import Config
-from src.bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import Config, PaperlessClient, project_root
 from tests.integration.test_paperless_end_to_end_fixture import PaperlessEndToEndFixture
 
+# Rendered test PDFs are reused across demo runs
+PDF_CACHE_DIR = project_root / "test" / ".cache"
+
 
 def main():
     """Run the end-to-end test demonstration."""
@@ -81,11 +80,20 @@ def main():
 
         # Step 2: Initialize fixture
         print("🏗️  Step 2: Initializing end-to-end test fixture...")
-        fixture = PaperlessEndToEndFixture(client)
+        fixture = PaperlessEndToEndFixture(client, pdf_cache_dir=PDF_CACHE_DIR)
+
+        # Steps 3 and 4: Clean remote storage (network) while generating test
+        # documents locally, pre-rendering the PDFs into the cache
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cleanup_future = executor.submit(
+                asyncio.run, fixture.cleanup_remote_storage_async()
+            )
+            test_docs = fixture.generate_standardized_test_data()
+            for doc_spec in test_docs:
+                fixture.create_standardized_pdf(doc_spec)
+            cleanup_result = cleanup_future.result()
 
-        # Step 3: Clean remote storage
         print("🧹 Step 3: Cleaning remote test storage...")
-        cleanup_result = fixture.cleanup_remote_storage()
         if cleanup_result["success"]:
             print(f"✅ Cleaned {len(cleanup_result['paths_cleared'])} storage paths")
             print(f"   Removed {cleanup_result['documents_removed']} documents")
@@ -93,9 +101,7 @@ def main():
             print(f"⚠️  Cleanup had issues: {cleanup_result['errors']}")
         print()
 
-        # Step 4: Generate and upload test documents
         print("📄 Step 4: Generating standardized test documents...")
-        test_docs = fixture.generate_standardized_test_data()
         print(f"✅ Generated {len(test_docs)} test document specifications")
 
         for i, doc_spec in enumerate(test_docs, 1):
@@ -109,7 +115,7 @@ def main():
         print()
 
         print("📤 Step 5: Uploading test documents to Paperless...")
-        upload_result = fixture.upload_test_documents(test_docs)
+        upload_result = fixture.upload_test_documents_parallel(test_docs, max_workers=8)
 
         if upload_result["success"]:
             print(
@@ -15,16 +15,11 @@ Usage:
     python test_paperless_e2e_quick.py
 """
 
+import asyncio
 import os
 import sys
-from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-from src.bank_statement_separator.config import Config
-from src.bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import Config, PaperlessClient
 from tests.integration.test_paperless_end_to_end_fixture import PaperlessEndToEndFixture
 
 
@@ -70,7 +65,7 @@ def main():
 
         # Quick cleanup test (dry run)
         print("🧹 Testing storage cleanup...")
-        cleanup_result = fixture.cleanup_remote_storage()
+        cleanup_result = asyncio.run(fixture.cleanup_remote_storage_async())
         print(f"✅ Cleanup result: {cleanup_result['success']}")
         print(f"   Paths: {cleanup_result['paths_cleared']}")
         print(f"   Documents removed: {cleanup_result['documents_removed']}")
@@ -1,197 +1,45 @@
 #!/usr/bin/env python3
 """
 Test error detection and tagging with real Paperless integration.
-"""
-
-import os
-import sys
-from pathlib import Path
-from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+A single ping preflight exits early when Paperless is unreachable; use
+test_mock_error_tagging.py to run the simulation offline.
+"""
 
-from bank_statement_separator.config import load_config
-from bank_statement_separator.utils.error_detector import ErrorDetector
-from bank_statement_separator.utils.error_tagger import ErrorTagger
-from bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import buffered_stdout, clients_for
+from test_mock_error_tagging import (
+    ERROR_TAGGING_OVERRIDES,
+    end_section,
+    print_configuration,
+    run_simulation,
+)
 
 
+# Buffer output and flush once per section rather than on every line
+@buffered_stdout()
 def main():
     """Test error detection and tagging with Paperless enabled."""
+
     print("🧪 Testing Error Detection and Tagging with Paperless Integration")
     print("=" * 70)
 
-    # Enable paperless and error detection for testing
-    env_overrides = {
-        "PAPERLESS_ENABLED": "true",
-        "PAPERLESS_ERROR_DETECTION_ENABLED": "true",
-        "PAPERLESS_ERROR_TAGS": "processing:needs-review,error:automated-detection",
-        "PAPERLESS_ERROR_TAG_THRESHOLD": "0.5",
-        "PAPERLESS_ERROR_SEVERITY_LEVELS": "medium,high,critical",
-        "PAPERLESS_ERROR_BATCH_TAGGING": "false",
-    }
-
-    with patch.dict(os.environ, env_overrides):
-        config = load_config()
-
-        print(f"🔧 Configuration:")
-        print(f"  • Paperless enabled: {config.paperless_enabled}")
-        print(f"  • Paperless URL: {config.paperless_url}")
-        print(
-            f"  • Error detection enabled: {config.paperless_error_detection_enabled}"
-        )
-        print(f"  • Error tags: {config.paperless_error_tags}")
-        print(f"  • Error threshold: {config.paperless_error_tag_threshold}")
-        print(f"  • Error severity levels: {config.paperless_error_severity_levels}")
-        print()
-
-        # Test Paperless connection
-        print("🌐 Testing Paperless connection...")
-        try:
-            client = PaperlessClient(config)
-
-            if client.is_enabled():
-                print(
-                    f"  ✅ Successfully connected to Paperless at: {config.paperless_url}"
-                )
-                print(f"  ✅ Using token: {config.paperless_token[:10]}...")
-            else:
-                print("  ❌ Paperless client not enabled")
-                return
-
-        except Exception as e:
-            print(f"  ❌ Paperless connection failed: {e}")
-            print("  ℹ️  Continuing with mock testing...")
-            # Continue with mock testing even if connection fails
-
-        print()
-
-        # Test error detection
-        print("🔍 Testing error detection...")
-        detector = ErrorDetector(config)
-
-        # Simulate a workflow with errors
-        workflow_state = {
-            "current_step": "pdf_generation_error",
-            "error_message": "PDF generation failed due to corrupted input file",
-            "generated_files": [],
-            "total_statements_found": 3,
-            "detected_boundaries": [
-                {"confidence": 0.3, "start_page": 1, "end_page": 5},  # Low confidence
-                {"confidence": 0.2, "start_page": 6, "end_page": 10},  # Low confidence
-            ],
-        }
-
-        detected_errors = detector.detect_errors(workflow_state)
-
-        print(f"  ✅ Detected {len(detected_errors)} errors:")
-        for i, error in enumerate(detected_errors, 1):
-            print(
-                f"    {i}. {error['type']} ({error['severity']}) - {error['description']}"
-            )
-
-        print()
-
-        # Test error tagging
-        print("🏷️  Testing error tagging...")
-        tagger = ErrorTagger(config)
-
-        # Create mock upload results
-        upload_results = {
-            "uploads": [
-                {
-                    "document_id": 12345,
-                    "success": True,
-                    "filename": "test_statement_1.pdf",
-                },
-                {
-                    "document_id": 12346,
-                    "success": True,
-                    "filename": "test_statement_2.pdf",
-                },
-            ]
-        }
-
-        # Generate error tags
-        error_tags = tagger._generate_error_tags(detected_errors)
-        print(f"  📋 Generated error tags: {error_tags}")
-
-        # Create error summary
-        error_summary = tagger.create_error_summary(detected_errors)
-        print(f"  📋 Error summary: {error_summary}")
-
-        # Test if errors should be tagged
-        should_tag = tagger._should_tag_errors(detected_errors)
-        print(f"  📋 Should tag errors: {should_tag}")
-
-        if should_tag:
-            print("  ✅ Errors meet severity threshold - tagging would be applied")
-            print("  📋 In a real scenario, the following would happen:")
-            for upload in upload_results["uploads"]:
-                doc_id = upload["document_id"]
-                filename = upload["filename"]
-                print(
-                    f"    • Document {doc_id} ({filename}) would be tagged with: {error_tags}"
-                )
-        else:
-            print("  ℹ️  Errors don't meet severity threshold - no tagging needed")
-
-        print()
-
-        # Test workflow integration simulation
-        print("🔄 Testing workflow integration simulation...")
-
-        # Simulate what would happen in the actual workflow
-        error_tagging_result = {
-            "attempted": True,
-            "errors_detected": len(detected_errors),
-            "tagged_documents": len(upload_results["uploads"]) if should_tag else 0,
-            "success": True,
-            "error_summary": error_summary,
-            "details": [
-                {
-                    "document_id": upload["document_id"],
-                    "tags_applied": len(error_tags),
-                    "tags": error_tags,
-                }
-                for upload in upload_results["uploads"]
-            ]
-            if should_tag
-            else [],
-        }
-
-        print(f"  📊 Workflow Integration Results:")
-        print(f"    • Error detection attempted: {error_tagging_result['attempted']}")
-        print(f"    • Errors detected: {error_tagging_result['errors_detected']}")
-        print(f"    • Documents tagged: {error_tagging_result['tagged_documents']}")
-        print(f"    • Operation success: {error_tagging_result['success']}")
-        print(f"    • Error summary: {error_tagging_result['error_summary']}")
+    # Overrides apply to this config only; os.environ is left untouched
+    client, detector, tagger = clients_for(frozenset(ERROR_TAGGING_OVERRIDES.items()))
+    config = client.config
+    print_configuration(config)
 
-        if error_tagging_result["details"]:
-            print(f"    • Tagging details:")
-            for detail in error_tagging_result["details"]:
-                print(
-                    f"      - Document {detail['document_id']}: {detail['tags_applied']} tags applied"
-                )
+    # Preflight: skip everything else when Paperless cannot be reached
+    print("🌐 Testing Paperless connection...")
+    if not client.ping():
+        print("  ⏭️  Paperless offline or not configured; skipping")
+        print("  ℹ️  Run test_mock_error_tagging.py for the offline simulation")
+        return
 
-        print()
-        print("🎉 Error detection and tagging test completed successfully!")
-        print("✅ All functionality is working as expected")
+    print(f"  ✅ Successfully connected to Paperless at: {config.paperless_url}")
+    print(f"  ✅ Using token: {config.paperless_token[:10]}...")
+    end_section()
 
-        # Summary
-        print()
-        print("📋 SUMMARY:")
-        print("=" * 30)
-        print(
-            f"✅ Error Detection: {len(detected_errors)} errors detected from workflow state"
-        )
-        print(f"✅ Error Tagging: {len(error_tags)} unique tags generated")
-        print(
-            f"✅ Severity Filtering: {'Passed' if should_tag else 'Filtered out'} based on severity levels"
-        )
-        print(f"✅ Configuration: All error tagging options working correctly")
-        print(f"✅ Integration: Workflow integration ready for production use")
+    run_simulation(detector, tagger)
 
 
 if __name__ == "__main__":
@@ -3,15 +3,7 @@
 Check available storage paths and test document creation with correct path.
 """
 
-import os
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from bank_statement_separator.config import load_config
-from bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import PaperlessClient, get_config
 
 
 def main():
@@ -19,8 +11,7 @@ def main():
     print("📁 Checking Available Storage Paths")
     print("=" * 40)
 
-    config = load_config()
-    config.paperless_enabled = True
+    config = get_config().model_copy(update={"paperless_enabled": True})
 
     client = PaperlessClient(config)
 
@@ -29,9 +20,8 @@ def main():
         return
 
     try:
-        import httpx
-
-        with httpx.Client(timeout=30.0) as http_client:
+        # Reuse the client's pooled session rather than a separate httpx.Client
+        with client, client._http_client(timeout=30.0) as http_client:
             # Check available storage paths
             print("📋 Available Storage Paths:")
             try:
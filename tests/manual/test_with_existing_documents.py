@@ -4,24 +4,22 @@ Test error tagging with existing documents in Paperless.
 This bypasses the async upload issue by using documents that are already processed.
 """
 
-import os
-import sys
-from pathlib import Path
-from unittest.mock import patch
+from datetime import date
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from bank_statement_separator.config import load_config
-from bank_statement_separator.utils.error_detector import ErrorDetector
-from bank_statement_separator.utils.error_tagger import ErrorTagger
-from bank_statement_separator.utils.paperless_client import PaperlessClient
+from _bootstrap import (
+    ErrorDetector,
+    ErrorTagger,
+    PaperlessClient,
+    load_config,
+    write_lines,
+)
 
 
 def main():
     """Test error tagging with existing documents."""
-    print("🧪 Testing Error Tagging with Existing Documents")
-    print("=" * 50)
+    lines: list[str] = []
+    lines.append("🧪 Testing Error Tagging with Existing Documents")
+    lines.append("=" * 50)
 
     # Enable error detection
     env_overrides = {
@@ -33,40 +31,35 @@ def main():
         "PAPERLESS_ERROR_BATCH_TAGGING": "false",
     }
 
-    # Apply environment overrides
-    original_env = {}
-    for key, value in env_overrides.items():
-        original_env[key] = os.environ.get(key)
-        os.environ[key] = value
-
+    client = None
     try:
-        config = load_config()
+        # Overrides are applied to the loaded config only; os.environ is untouched
+        config = load_config(overrides=env_overrides)
 
-        print(f"📋 Configuration:")
-        print(f"  • Paperless URL: {config.paperless_url}")
-        print(f"  • Error tags: {config.paperless_error_tags}")
-        print()
+        lines.append(f"📋 Configuration:")
+        lines.append(f"  • Paperless URL: {config.paperless_url}")
+        lines.append(f"  • Error tags: {config.paperless_error_tags}")
+        lines.append("")
 
-        # Connect to Paperless
+        # Connect to Paperless; one pooled session serves discovery and tagging
         client = PaperlessClient(config)
 
         if not client.is_enabled():
-            print("❌ Paperless client not enabled")
+            lines.append("❌ Paperless client not enabled")
             return
 
+        client.open_session()
+
         # Get recent documents to test with
-        print("🔍 Finding recent test documents...")
+        lines.append("🔍 Finding recent test documents...")
+        write_lines(lines)
 
         try:
-            import httpx
-
-            with httpx.Client(timeout=30.0) as http_client:
+            with client._http_client(timeout=30.0) as http_client:
                 # Get recent documents created today with FINAL in title
-                from datetime import datetime
-
-                today = datetime.now().strftime("%Y-%m-%d")
+                today = date.today().isoformat()
                 response = http_client.get(
-                    f"{config.paperless_url.rstrip('/')}/api/documents/?title__icontains=FINAL&created__date__gte={today}&ordering=-created&page_size=5",
+                    f"{config.paperless_url.rstrip('/')}/api/documents/?title__icontains=FINAL&created__date__gte={today}&ordering=-created&page_size=5&fields=id,title,created",
                     headers=client.headers,
                 )
                 response.raise_for_status()
@@ -75,13 +68,15 @@ def main():
                 documents = docs_data.get("results", [])
 
                 if not documents:
-                    print("❌ No recent FINAL test documents found created today")
-                    print(
+                    lines.append(
+                        "❌ No recent FINAL test documents found created today"
+                    )
+                    lines.append(
                         "   Run the final integration test first to create test documents."
                     )
                     return
 
-                print(f"✅ Found {len(documents)} recent test documents:")
+                lines.append(f"✅ Found {len(documents)} recent test documents:")
 
                 test_documents = []
                 for doc in documents[:2]:  # Use first 2 documents
@@ -89,19 +84,21 @@ def main():
                     title = doc.get("title", "Unknown")
                     created = doc.get("created", "Unknown")
 
-                    print(f"  • Document {doc_id}: {title} (created: {created[:10]})")
+                    lines.append(
+                        f"  • Document {doc_id}: {title} (created: {created[:10]})"
+                    )
                     test_documents.append(
                         {"document_id": doc_id, "title": title, "success": True}
                     )
 
-                print()
+                lines.append("")
 
         except Exception as e:
-            print(f"❌ Failed to fetch documents: {e}")
+            lines.append(f"❌ Failed to fetch documents: {e}")
             return
 
         # Simulate error detection
-        print("🔍 Simulating error detection...")
+        lines.append("🔍 Simulating error detection...")
 
         error_workflow_state = {
             "current_step": "pdf_generation_error",
@@ -135,17 +132,18 @@ def main():
         detector = ErrorDetector(config)
         detected_errors = detector.detect_errors(error_workflow_state)
 
-        print(f"✅ Detected {len(detected_errors)} processing errors:")
+        lines.append(f"✅ Detected {len(detected_errors)} processing errors:")
         for i, error in enumerate(detected_errors, 1):
-            print(
+            lines.append(
                 f"  {i}. {error['type']} ({error['severity']}) - {error['description']}"
             )
-        print()
+        lines.append("")
 
         # Apply error tags to existing documents
-        print("🏷️  Applying real error tags to existing documents...")
+        lines.append("🏷️  Applying real error tags to existing documents...")
+        write_lines(lines)
 
-        tagger = ErrorTagger(config)
+        tagger = ErrorTagger(config, paperless_client=client)
 
         # Create mock upload results using existing documents
         upload_results = {"uploads": test_documents}
@@ -153,51 +151,52 @@ def main():
         # Apply error tags
         result = tagger.apply_error_tags(detected_errors, upload_results)
 
-        print(f"📊 Error Tagging Results:")
-        print(f"  • Errors detected: {len(detected_errors)}")
-        print(f"  • Documents to tag: {len(test_documents)}")
-        print(f"  • Tagging attempted: {result.get('success', False)}")
-        print(f"  • Documents tagged: {result.get('tagged_documents', 0)}")
-        print(f"  • Skipped documents: {result.get('skipped_documents', 0)}")
+        lines.append(f"📊 Error Tagging Results:")
+        lines.append(f"  • Errors detected: {len(detected_errors)}")
+        lines.append(f"  • Documents to tag: {len(test_documents)}")
+        lines.append(f"  • Tagging attempted: {result.get('success', False)}")
+        lines.append(f"  • Documents tagged: {result.get('tagged_documents', 0)}")
+        lines.append(f"  • Skipped documents: {result.get('skipped_documents', 0)}")
 
         if result.get("details"):
-            print(f"  • Tagging details:")
+            lines.append(f"  • Tagging details:")
             for detail in result["details"]:
                 doc_id = detail.get("document_id")
                 tags_applied = detail.get("tags_applied", 0)
                 tags = detail.get("tags", [])
-                print(f"    - Document {doc_id}: {tags_applied} tags applied")
-                print(f"      Tags: {', '.join(tags)}")
+                lines.append(f"    - Document {doc_id}: {tags_applied} tags applied")
+                lines.append(f"      Tags: {', '.join(tags)}")
 
         if result.get("errors"):
-            print(f"  • Tagging errors:")
+            lines.append(f"  • Tagging errors:")
             for error in result["errors"]:
-                print(f"    - {error}")
+                lines.append(f"    - {error}")
 
-        print()
+        lines.append("")
 
         # Show success message
         if result.get("tagged_documents", 0) > 0:
-            print("🎉 SUCCESS! Error tags have been applied to existing documents!")
-            print()
-            print("🔍 To verify in Paperless:")
-            print(f"1. Go to {config.paperless_url}")
-            print("2. Search for documents with the error tags:")
+            lines.append(
+                "🎉 SUCCESS! Error tags have been applied to existing documents!"
+            )
+            lines.append("")
+            lines.append("🔍 To verify in Paperless:")
+            lines.append(f"1. Go to {config.paperless_url}")
+            lines.append("2. Search for documents with the error tags:")
             for tag in config.paperless_error_tags:
-                print(f"   • {tag}")
-            print("3. Check the documents we just tagged:")
+                lines.append(f"   • {tag}")
+            lines.append("3. Check the documents we just tagged:")
             for doc in test_documents:
-                print(f"   • Document {doc['document_id']}: {doc['title']}")
+                lines.append(f"   • Document {doc['document_id']}: {doc['title']}")
         else:
-            print("⚠️  No documents were tagged. Check the errors above for details.")
+            lines.append(
+                "⚠️  No documents were tagged. Check the errors above for details."
+            )
 
     finally:
-        # Restore original environment variables
-        for key, original_value in original_env.items():
-            if original_value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = original_value
+        write_lines(lines)
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
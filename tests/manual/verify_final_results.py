@@ -3,22 +3,59 @@
 Verify final results: Documents in 'test' storage path with error tags applied.
 """
 
-import os
-import sys
-from pathlib import Path
-from datetime import datetime
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from bank_statement_separator.config import load_config
-from bank_statement_separator.utils.paperless_client import PaperlessClient
-
-
-def main():
+import asyncio
+from datetime import date
+
+from _bootstrap import PaperlessClient, load_config, write_lines
+
+
+# Only these document fields are read; Paperless omits the rest (content etc.)
+DOCUMENT_LIST_FIELDS = "id,title,created,tags,storage_path"
+
+
+async def fetch_all_results(
+    http_client, url: str, headers: dict, params: dict
+) -> list[dict]:
+    """Collect ``results`` from every page of a list endpoint by following ``next``."""
+    results: list[dict] = []
+    next_url, next_params = url, params
+    while next_url:
+        response = await http_client.get(next_url, headers=headers, params=next_params)
+        response.raise_for_status()
+        data = response.json()
+        results.extend(data.get("results", []))
+        # ``next`` already carries the query string
+        next_url, next_params = data.get("next"), None
+    return results
+
+
+async def fetch_names(
+    http_client, base_url: str, headers: dict, endpoint: str, ids
+) -> dict:
+    """Fetch ``{id: name}`` for all ``ids`` of an endpoint in one request."""
+    if not ids:
+        return {}
+
+    response = await http_client.get(
+        f"{base_url}/api/{endpoint}/",
+        headers=headers,
+        params={
+            "id__in": ",".join(str(i) for i in sorted(ids)),
+            "page_size": len(ids),
+        },
+    )
+    response.raise_for_status()
+    return {
+        item["id"]: item.get("name", f"ID:{item['id']}")
+        for item in response.json().get("results", [])
+    }
+
+
+async def main():
     """Verify final results of error tagging in test storage path."""
-    print("🎯 FINAL VERIFICATION RESULTS")
-    print("=" * 50)
+    lines: list[str] = []
+    lines.append("🎯 FINAL VERIFICATION RESULTS")
+    lines.append("=" * 50)
 
     config = load_config()
     config.paperless_enabled = True
@@ -26,32 +63,83 @@ def main():
     client = PaperlessClient(config)
 
     if not client.is_enabled():
-        print("❌ Paperless client not enabled")
+        lines.append("❌ Paperless client not enabled")
+        write_lines(lines)
         return
 
+    # Show the header before waiting on the network
+    write_lines(lines)
+
     try:
         import httpx
 
-        with httpx.Client(timeout=30.0) as http_client:
-            # Get today's FINAL test documents
-            today = datetime.now().strftime("%Y-%m-%d")
+        async with httpx.AsyncClient(
+            timeout=30.0, limits=httpx.Limits(max_connections=10)
+        ) as http_client:
+            base_url = config.paperless_url.rstrip("/")
+
+            # Resolve error tag IDs up front, across every page of results
+            error_tags = await fetch_all_results(
+                http_client,
+                f"{base_url}/api/tags/",
+                client.headers,
+                {"name__icontains": "error", "fields": "id", "page_size": 100},
+            )
+            error_tag_ids = {tag["id"] for tag in error_tags}
+
+            if not error_tag_ids:
+                lines.append("⚠️  No error tags exist in Paperless")
 
-            response = http_client.get(
-                f"{config.paperless_url.rstrip('/')}/api/documents/?title__icontains=FINAL&created__date__gte={today}&ordering=-created&page_size=10",
+            # Get today's FINAL test documents; error tags are checked per document
+            # so untagged documents are reported as failures rather than hidden
+            today = date.today().isoformat()
+
+            response = await http_client.get(
+                f"{base_url}/api/documents/",
                 headers=client.headers,
+                params={
+                    "title__icontains": "FINAL",
+                    "created__date__gte": today,
+                    "ordering": "-created",
+                    "page_size": 10,
+                    "fields": DOCUMENT_LIST_FIELDS,
+                },
             )
             response.raise_for_status()
 
             docs_data = response.json()
             documents = docs_data.get("results", [])
 
-            print(f"📋 Documents created today with 'FINAL' in title:")
-            print()
+            lines.append("📋 Documents created today with 'FINAL' in title:")
+            lines.append("")
 
             if not documents:
-                print("❌ No FINAL test documents found for today")
+                lines.append("❌ No FINAL test documents found for today")
                 return
 
+            # The list payload already carries tag and storage path IDs, so two
+            # bulk name lookups are the only other requests needed
+            tag_names_by_id, storage_path_names = await asyncio.gather(
+                fetch_names(
+                    http_client,
+                    base_url,
+                    client.headers,
+                    "tags",
+                    {tag_id for doc in documents for tag_id in doc.get("tags", [])},
+                ),
+                fetch_names(
+                    http_client,
+                    base_url,
+                    client.headers,
+                    "storage_paths",
+                    {
+                        doc["storage_path"]
+                        for doc in documents
+                        if doc.get("storage_path")
+                    },
+                ),
+            )
+
             success_count = 0
 
             for doc in documents:
@@ -63,102 +151,73 @@ def main():
                 # Get storage path name
                 storage_path_name = "Default"
                 if storage_path:
-                    try:
-                        storage_response = http_client.get(
-                            f"{config.paperless_url.rstrip('/')}/api/storage_paths/{storage_path}/",
-                            headers=client.headers,
-                        )
-                        if storage_response.status_code == 200:
-                            storage_data = storage_response.json()
-                            storage_path_name = storage_data.get(
-                                "name", f"ID:{storage_path}"
-                            )
-                    except (KeyError, TypeError, AttributeError):
-                        storage_path_name = f"ID:{storage_path}"
-
-                # Get document tags
-                try:
-                    doc_response = http_client.get(
-                        f"{config.paperless_url.rstrip('/')}/api/documents/{doc_id}/",
-                        headers=client.headers,
+                    storage_path_name = storage_path_names.get(
+                        storage_path, f"ID:{storage_path}"
                     )
-                    if doc_response.status_code == 200:
-                        doc_details = doc_response.json()
-                        tag_ids = doc_details.get("tags", [])
-
-                        # Get tag names
-                        tag_names = []
-                        for tag_id in tag_ids:
-                            try:
-                                tag_response = http_client.get(
-                                    f"{config.paperless_url.rstrip('/')}/api/tags/{tag_id}/",
-                                    headers=client.headers,
-                                )
-                                if tag_response.status_code == 200:
-                                    tag_data = tag_response.json()
-                                    tag_names.append(
-                                        tag_data.get("name", f"ID:{tag_id}")
-                                    )
-                            except (KeyError, TypeError, AttributeError):
-                                tag_names.append(f"ID:{tag_id}")
-
-                        print(f"📄 Document {doc_id}: {title}")
-                        print(f"   • Created: {created[:10]}")
-                        print(f"   • Storage Path: {storage_path_name}")
-                        print(f"   • Tags Applied: {len(tag_names)}")
-
-                        if tag_names:
-                            print(f"   • Tag Names:")
-                            for tag in sorted(tag_names):
-                                print(f"     - {tag}")
-
-                        # Check if in test storage and has error tags
-                        has_test_storage = storage_path_name.lower() == "test"
-                        has_error_tags = any(
-                            "error" in tag.lower() for tag in tag_names
-                        )
-
-                        if has_test_storage and has_error_tags:
-                            success_count += 1
-                            print(f"   ✅ SUCCESS: In 'test' storage with error tags!")
-                        elif has_test_storage:
-                            print(f"   ⚠️  In 'test' storage but no error tags")
-                        elif has_error_tags:
-                            print(f"   ⚠️  Has error tags but wrong storage path")
-                        else:
-                            print(f"   ❌ Missing both test storage and error tags")
-
-                        print()
-
-                except Exception as e:
-                    print(f"   ❌ Error fetching document details: {e}")
-                    print()
-
-            print("=" * 50)
-            print(f"🎉 FINAL RESULTS SUMMARY:")
-            print(f"  • Total documents found: {len(documents)}")
-            print(f"  • Successfully configured: {success_count}")
-            print(f"  • Success rate: {success_count / len(documents) * 100:.1f}%")
+
+                # Get tag names
+                tag_ids = doc.get("tags", [])
+                tag_names = [
+                    tag_names_by_id.get(tag_id, f"ID:{tag_id}") for tag_id in tag_ids
+                ]
+
+                lines.append(f"📄 Document {doc_id}: {title}")
+                lines.append(f"   • Created: {created[:10]}")
+                lines.append(f"   • Storage Path: {storage_path_name}")
+                lines.append(f"   • Tags Applied: {len(tag_names)}")
+
+                if tag_names:
+                    lines.append(f"   • Tag Names:")
+                    for tag in sorted(tag_names):
+                        lines.append(f"     - {tag}")
+
+                # Check if in test storage and has error tags
+                has_test_storage = storage_path_name.lower() == "test"
+                has_error_tags = not error_tag_ids.isdisjoint(tag_ids)
+
+                if has_test_storage and has_error_tags:
+                    success_count += 1
+                    lines.append(f"   ✅ SUCCESS: In 'test' storage with error tags!")
+                elif has_test_storage:
+                    lines.append(f"   ⚠️  In 'test' storage but no error tags")
+                elif has_error_tags:
+                    lines.append(f"   ⚠️  Has error tags but wrong storage path")
+                else:
+                    lines.append(f"   ❌ Missing both test storage and error tags")
+
+                lines.append("")
+
+            lines.append("=" * 50)
+            lines.append(f"🎉 FINAL RESULTS SUMMARY:")
+            lines.append(f"  • Total documents found: {len(documents)}")
+            lines.append(f"  • Successfully configured: {success_count}")
+            lines.append(
+                f"  • Success rate: {success_count / len(documents) * 100:.1f}%"
+            )
 
             if success_count == len(documents):
-                print()
-                print("🚀 COMPLETE SUCCESS!")
-                print(
+                lines.append("")
+                lines.append("🚀 COMPLETE SUCCESS!")
+                lines.append(
                     "✅ All documents are in 'test' storage path with error tags applied!"
                 )
-                print("✅ Error detection and tagging system is fully operational!")
+                lines.append(
+                    "✅ Error detection and tagging system is fully operational!"
+                )
             elif success_count > 0:
-                print()
-                print(
+                lines.append("")
+                lines.append(
                     f"🎯 Partial success: {success_count}/{len(documents)} documents configured correctly"
                 )
             else:
-                print()
-                print("⚠️  No documents were configured correctly")
+                lines.append("")
+                lines.append("⚠️  No documents were configured correctly")
 
     except Exception as e:
-        print(f"❌ Failed to verify results: {e}")
+        lines.append(f"❌ Failed to verify results: {e}")
+    finally:
+        write_lines(lines)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,14 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from src.bank_statement_separator.config import Config
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """Validated default configuration shared across the session.
+
+    Treat it as read-only; derive variants with ``model_copy(update=...)``.
+    """
+    return Config(openai_api_key="test-key")
@@ -1,194 +1,250 @@
 """Unit tests for CLI functionality."""
 
-from click.testing import CliRunner
+from typing import Callable, Dict, Iterable, Tuple
+
+import pytest
+from click.testing import CliRunner, Result
 
 from src.bank_statement_separator.main import main
 
 
+def assert_all_in(text: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in text, reporting all that are missing."""
+    missing = [n for n in needles if n not in text]
+    assert not missing, f"Missing from output: {missing}"
+
+
+@pytest.fixture(scope="session")
+def help_outputs() -> Callable[[Tuple[str, ...]], Result]:
+    """Invoke the CLI once per argv tuple and share the result across tests.
+
+    Help and version output is deterministic, so each command only needs to be
+    rendered once per session.
+    """
+    runner = CliRunner()
+    results: Dict[Tuple[str, ...], Result] = {}
+
+    def invoke(argv: Tuple[str, ...]) -> Result:
+        if argv not in results:
+            results[argv] = runner.invoke(main, list(argv))
+        return results[argv]
+
+    return invoke
+
+
 class TestEnvHelpCommand:
     """Test the env-help command functionality."""
 
-    def test_env_help_all_categories(self):
+    def test_env_help_all_categories(self, help_outputs):
         """Test env-help command displays all categories by default."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help"])
+        result = help_outputs(("env-help",))
 
         assert result.exit_code == 0
-        assert "Environment Variable Documentation" in result.output
-        assert "🤖 LLM Provider Configuration" in result.output
-        assert "⚙️ Processing Configuration" in result.output
-        assert "🔒 Security & Logging" in result.output
-        assert "📄 Paperless-ngx Integration" in result.output
-        assert "🚨 Error Handling & Quarantine" in result.output
-        assert "✅ Document Validation" in result.output
-
-    def test_env_help_llm_category(self):
+        assert_all_in(
+            result.output,
+            [
+                "Environment Variable Documentation",
+                "🤖 LLM Provider Configuration",
+                "⚙️ Processing Configuration",
+                "🔒 Security & Logging",
+                "📄 Paperless-ngx Integration",
+                "🚨 Error Handling & Quarantine",
+                "✅ Document Validation",
+            ],
+        )
+
+    def test_env_help_llm_category(self, help_outputs):
         """Test env-help command with LLM category filter."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help", "--category", "llm"])
+        result = help_outputs(("env-help", "--category", "llm"))
 
         assert result.exit_code == 0
-        assert "🤖 LLM Provider Configuration" in result.output
-        assert "OPENAI_API_KEY" in result.output
-        assert "OLLAMA_BASE_URL" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "🤖 LLM Provider Configuration",
+                "OPENAI_API_KEY",
+                "OLLAMA_BASE_URL",
+            ],
+        )
         # Should not contain other categories when filtered
         assert "📄 Paperless-ngx Integration" not in result.output
 
-    def test_env_help_processing_category(self):
+    def test_env_help_processing_category(self, help_outputs):
         """Test env-help command with processing category filter."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help", "--category", "processing"])
+        result = help_outputs(("env-help", "--category", "processing"))
 
         assert result.exit_code == 0
-        assert "⚙️ Processing Configuration" in result.output
-        assert "CHUNK_SIZE" in result.output
-        assert "DEFAULT_OUTPUT_DIR" in result.output
-        assert "MAX_FILE_SIZE_MB" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "⚙️ Processing Configuration",
+                "CHUNK_SIZE",
+                "DEFAULT_OUTPUT_DIR",
+                "MAX_FILE_SIZE_MB",
+            ],
+        )
 
-    def test_env_help_paperless_category(self):
+    def test_env_help_paperless_category(self, help_outputs):
         """Test env-help command with paperless category filter."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help", "--category", "paperless"])
+        result = help_outputs(("env-help", "--category", "paperless"))
 
         assert result.exit_code == 0
-        assert "📄 Paperless-ngx Integration" in result.output
-        assert "PAPERLESS_ENABLED" in result.output
-        assert "PAPERLESS_URL" in result.output
-        assert "PAPERLESS_TOKEN" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "📄 Paperless-ngx Integration",
+                "PAPERLESS_ENABLED",
+                "PAPERLESS_URL",
+                "PAPERLESS_TOKEN",
+            ],
+        )
 
-    def test_env_help_invalid_category(self):
+    def test_env_help_invalid_category(self, help_outputs):
         """Test env-help command with invalid category."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help", "--category", "invalid"])
+        result = help_outputs(("env-help", "--category", "invalid"))
 
         # Click validates choices and exits with code 2 for invalid options
         assert result.exit_code == 2
         assert "Invalid value for '--category'" in result.output
 
-    def test_env_help_contains_documentation_links(self):
+    def test_env_help_contains_documentation_links(self, help_outputs):
         """Test that env-help includes documentation links."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["env-help"])
+        result = help_outputs(("env-help",))
 
         assert result.exit_code == 0
-        assert "https://madeinoz67.github.io/bank-statement-separator/" in result.output
-        assert "Configuration Guide" in result.output
-        assert "Environment Variables Reference" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "https://madeinoz67.github.io/bank-statement-separator/",
+                "Configuration Guide",
+                "Environment Variables Reference",
+            ],
+        )
 
 
 class TestVersionCommand:
     """Test the version command enhancements."""
 
-    def test_version_contains_repository_link(self):
+    def test_version_contains_repository_link(self, help_outputs):
         """Test that version command includes repository link."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["version"])
+        result = help_outputs(("version",))
 
         assert result.exit_code == 0
         assert "https://github.com/madeinoz67/bank-statement-separator" in result.output
 
-    def test_version_contains_documentation_links(self):
+    def test_version_contains_documentation_links(self, help_outputs):
         """Test that version command includes documentation and issue links."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["version"])
+        result = help_outputs(("version",))
 
         assert result.exit_code == 0
-        assert (
-            "Documentation: https://madeinoz67.github.io/bank-statement-separator/"
-            in result.output
-        )
-        assert (
-            "Issues: https://github.com/madeinoz67/bank-statement-separator/issues"
-            in result.output
+        assert_all_in(
+            result.output,
+            [
+                "Documentation: https://madeinoz67.github.io/bank-statement-separator/",
+                "Issues: https://github.com/madeinoz67/bank-statement-separator/issues",
+            ],
         )
 
-    def test_version_contains_basic_info(self):
+    def test_version_contains_basic_info(self, help_outputs):
         """Test that version command contains expected information."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["version"])
+        result = help_outputs(("version",))
 
         assert result.exit_code == 0
-        assert "Bank Statement Separator" in result.output
-        assert "Version Information" in result.output
-        assert "Stephen Eaton" in result.output
-        assert "MIT" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "Bank Statement Separator",
+                "Version Information",
+                "Stephen Eaton",
+                "MIT",
+            ],
+        )
 
 
 class TestCommandHelpEnhancements:
     """Test that individual commands include environment variable help."""
 
-    def test_process_command_help_includes_env_vars(self):
-        """Test that process command help includes environment variables."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["process", "--help"])
-
-        assert result.exit_code == 0
-        assert "COMMON ENVIRONMENT VARIABLES" in result.output
-        assert "OPENAI_API_KEY" in result.output
-        assert "DEFAULT_OUTPUT_DIR" in result.output
-        assert "env-help" in result.output
-
-    def test_process_paperless_help_includes_env_vars(self):
-        """Test that process-paperless command help includes environment variables."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["process-paperless", "--help"])
+    @pytest.mark.parametrize(
+        "command,needles",
+        [
+            (
+                "process",
+                [
+                    "COMMON ENVIRONMENT VARIABLES",
+                    "OPENAI_API_KEY",
+                    "DEFAULT_OUTPUT_DIR",
+                    "env-help",
+                ],
+            ),
+            (
+                "process-paperless",
+                [
+                    "REQUIRED ENVIRONMENT VARIABLES",
+                    "PAPERLESS_ENABLED",
+                    "PAPERLESS_URL",
+                    "PAPERLESS_TOKEN",
+                ],
+            ),
+            (
+                "batch-process",
+                [
+                    "BATCH PROCESSING ENVIRONMENT VARIABLES",
+                    "ERROR HANDLING VARIABLES",
+                    "QUARANTINE_DIRECTORY",
+                    "MAX_RETRY_ATTEMPTS",
+                ],
+            ),
+            (
+                "quarantine-status",
+                [
+                    "RELEVANT ENVIRONMENT VARIABLES",
+                    "QUARANTINE_DIRECTORY",
+                    "ENABLE_ERROR_REPORTING",
+                ],
+            ),
+            (
+                "quarantine-clean",
+                [
+                    "RELEVANT ENVIRONMENT VARIABLES",
+                    "QUARANTINE_DIRECTORY",
+                    "ERROR_REPORT_DIRECTORY",
+                ],
+            ),
+        ],
+    )
+    def test_command_help_includes_env_vars(self, help_outputs, command, needles):
+        """Test that each command's help includes its environment variables."""
+        result = help_outputs((command, "--help"))
 
         assert result.exit_code == 0
-        assert "REQUIRED ENVIRONMENT VARIABLES" in result.output
-        assert "PAPERLESS_ENABLED" in result.output
-        assert "PAPERLESS_URL" in result.output
-        assert "PAPERLESS_TOKEN" in result.output
-
-    def test_batch_process_help_includes_env_vars(self):
-        """Test that batch-process command help includes environment variables."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["batch-process", "--help"])
-
-        assert result.exit_code == 0
-        assert "BATCH PROCESSING ENVIRONMENT VARIABLES" in result.output
-        assert "ERROR HANDLING VARIABLES" in result.output
-        assert "QUARANTINE_DIRECTORY" in result.output
-        assert "MAX_RETRY_ATTEMPTS" in result.output
-
-    def test_quarantine_status_help_includes_env_vars(self):
-        """Test that quarantine-status command help includes environment variables."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["quarantine-status", "--help"])
-
-        assert result.exit_code == 0
-        assert "RELEVANT ENVIRONMENT VARIABLES" in result.output
-        assert "QUARANTINE_DIRECTORY" in result.output
-        assert "ENABLE_ERROR_REPORTING" in result.output
-
-    def test_quarantine_clean_help_includes_env_vars(self):
-        """Test that quarantine-clean command help includes environment variables."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["quarantine-clean", "--help"])
-
-        assert result.exit_code == 0
-        assert "RELEVANT ENVIRONMENT VARIABLES" in result.output
-        assert "QUARANTINE_DIRECTORY" in result.output
-        assert "ERROR_REPORT_DIRECTORY" in result.output
+        assert_all_in(result.output, needles)
 
 
 class TestCliIntegration:
     """Test CLI integration with the help system."""
 
-    def test_main_help_lists_env_help_command(self):
+    def test_main_help_lists_env_help_command(self, help_outputs):
         """Test that main CLI help lists the env-help command."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = help_outputs(("--help",))
 
         assert result.exit_code == 0
-        assert "env-help" in result.output
-        assert "Display environment variable documentation for the CLI" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "env-help",
+                "Display environment variable documentation for the CLI",
+            ],
+        )
 
-    def test_env_help_command_exists_in_main_group(self):
+    def test_env_help_command_exists_in_main_group(self, help_outputs):
         """Test that env-help command is properly registered."""
-        runner = CliRunner()
-        # This should not produce a "No such command" error
-        result = runner.invoke(main, ["env-help", "--help"])
+        result = help_outputs(("env-help", "--help"))
 
         assert result.exit_code == 0
-        assert "Display environment variable documentation for the CLI" in result.output
-        assert "--category" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "Display environment variable documentation for the CLI",
+                "--category",
+            ],
+        )
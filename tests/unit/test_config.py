@@ -1,20 +1,82 @@
 """Unit tests for configuration management."""
 
 import os
+import re
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-
-from src.bank_statement_separator.config import Config, load_config, validate_env_file
+from dotenv import dotenv_values
+
+from src.bank_statement_separator.config import (
+    Config,
+    _config_from_env,
+    clear_config_cache,
+    clear_env_file_cache,
+    load_config,
+    load_config_from_mapping,
+    validate_env_file,
+)
+
+
+def deny_read_access(monkeypatch, denied_path: Path) -> None:
+    """Make os.access report denied_path as unreadable without touching its mode."""
+    real_access = os.access
+
+    def fake_access(path, mode, *args, **kwargs):
+        if Path(path) == denied_path:
+            return False
+        return real_access(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(os, "access", fake_access)
+
+
+# Variables removed from the process environment before loading defaults
+DEFAULT_ENV_VARS_TO_CLEAR = frozenset(
+    {
+        "OPENAI_API_KEY",
+        "LLM_PROVIDER",
+        "OPENAI_MODEL",
+        "DEFAULT_OUTPUT_DIR",
+        "LOG_LEVEL",
+    }
+)
+
+# Invalid field values and the compiled validator messages they must raise
+INVALID_CONFIG_CASES = [
+    ({"log_level": "INVALID"}, re.compile("Log level must be one of")),
+    ({"openai_model": "invalid-model"}, re.compile("OpenAI model must be one of")),
+    ({"llm_provider": "invalid-provider"}, re.compile("LLM provider must be one of")),
+    (
+        {"chunk_size": 1000, "chunk_overlap": 1500},
+        re.compile("Chunk overlap must be less than chunk size"),
+    ),
+]
+
+# Static env file contents shared by tests that only read them
+STATIC_ENV_FILES = {
+    "readable": b"TEST_VAR=value",
+    "override": b"LOG_LEVEL=DEBUG\nOPENAI_API_KEY=test-override",
+}
+
+
+@pytest.fixture(scope="session")
+def env_files(tmp_path_factory) -> dict[str, Path]:
+    """Write the static env files once per session and map name to path."""
+    env_dir = tmp_path_factory.mktemp("env_files")
+    paths = {}
+    for name, content in STATIC_ENV_FILES.items():
+        paths[name] = env_dir / f"{name}.env"
+        paths[name].write_bytes(content)
+    return paths
 
 
 class TestValidateEnvFile:
     """Test validate_env_file function."""
 
-    def test_validate_existing_readable_file(self, tmp_path):
+    def test_validate_existing_readable_file(self, env_files):
         """Test validation succeeds for existing readable file."""
-        env_file = tmp_path / "test.env"
-        env_file.write_text("TEST_VAR=value")
+        env_file = env_files["readable"]
 
         assert validate_env_file(str(env_file)) is True
 
@@ -30,10 +92,23 @@ class TestValidateEnvFile:
         with pytest.raises(ValueError, match="Environment path is not a file"):
             validate_env_file(str(tmp_path))
 
-    def test_validate_unreadable_file(self, tmp_path):
+    def test_validate_unreadable_file(self, env_files, monkeypatch):
         """Test validation fails for unreadable file."""
+        env_file = env_files["readable"]
+        deny_read_access(monkeypatch, env_file)
+
+        with pytest.raises(PermissionError, match="Cannot read environment file"):
+            validate_env_file(str(env_file))
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        os.name != "posix" or os.geteuid() == 0,
+        reason="root bypasses file permission checks",
+    )
+    def test_validate_unreadable_file_real_permissions(self, tmp_path):
+        """Test validation fails for a file whose mode denies reading."""
         env_file = tmp_path / "unreadable.env"
-        env_file.write_text("TEST_VAR=value")
+        env_file.write_bytes(STATIC_ENV_FILES["readable"])
         env_file.chmod(0o000)
 
         try:
@@ -47,20 +122,12 @@ class TestValidateEnvFile:
 class TestLoadConfig:
     """Test load_config function."""
 
+    @pytest.mark.xdist_group(name="env_mutation")
     def test_load_config_default(self):
         """Test loading config without custom env file."""
-        # Clear specific environment variables that might interfere
-        env_vars_to_clear = [
-            "OPENAI_API_KEY",
-            "LLM_PROVIDER",
-            "OPENAI_MODEL",
-            "DEFAULT_OUTPUT_DIR",
-            "LOG_LEVEL",
-        ]
-
-        # Create a clean environment by removing these variables completely
+        # Create a clean environment by removing interfering variables completely
         cleared_env = {
-            k: v for k, v in os.environ.items() if k not in env_vars_to_clear
+            k: v for k, v in os.environ.items() if k not in DEFAULT_ENV_VARS_TO_CLEAR
         }
 
         with patch.dict(os.environ, cleared_env, clear=True):
@@ -76,21 +143,19 @@ class TestLoadConfig:
             assert config.default_output_dir == "./separated_statements"
             assert config.log_level == "INFO"
 
-    def test_load_config_custom_env_file(self, tmp_path):
-        """Test loading config with custom env file."""
-        # Create custom env file
-        custom_env = tmp_path / "custom.env"
-        custom_env.write_text("""
-LLM_PROVIDER=ollama
-OPENAI_MODEL=gpt-4o
-DEFAULT_OUTPUT_DIR=/custom/output
-LOG_LEVEL=DEBUG
-OPENAI_API_KEY=test-key-123
-MAX_FILE_SIZE_MB=200
-ENABLE_AUDIT_LOGGING=false
-""")
-
-        config = load_config(str(custom_env))
+    def test_load_config_custom_env_file(self):
+        """Test loading config with custom environment values."""
+        config = load_config_from_mapping(
+            {
+                "LLM_PROVIDER": "ollama",
+                "OPENAI_MODEL": "gpt-4o",
+                "DEFAULT_OUTPUT_DIR": "/custom/output",
+                "LOG_LEVEL": "DEBUG",
+                "OPENAI_API_KEY": "test-key-123",
+                "MAX_FILE_SIZE_MB": "200",
+                "ENABLE_AUDIT_LOGGING": "false",
+            }
+        )
 
         # Should use custom values
         assert config.llm_provider == "ollama"
@@ -101,65 +166,177 @@ ENABLE_AUDIT_LOGGING=false
         assert config.max_file_size_mb == 200
         assert config.enable_audit_logging is False
 
-    def test_load_config_override_behavior(self, tmp_path):
+    @pytest.mark.xdist_group(name="env_mutation")
+    def test_load_config_override_behavior(self, env_files):
         """Test that custom env file overrides existing environment variables."""
-        # Set environment variable
+        # Set environment variable; the env file sets a different value
         with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}):
-            # Create custom env file with different value
-            custom_env = tmp_path / "override.env"
-            custom_env.write_text("LOG_LEVEL=DEBUG\nOPENAI_API_KEY=test-override")
-
-            config = load_config(str(custom_env))
+            config = load_config(str(env_files["override"]))
 
             # Should use custom env file value, not environment variable
             assert config.log_level == "DEBUG"
             assert config.openai_api_key == "test-override"
 
-    def test_load_config_list_values(self, tmp_path):
-        """Test loading config with list-type values."""
-        custom_env = tmp_path / "lists.env"
-        custom_env.write_text("""
-ALLOWED_INPUT_DIRS=/path1,/path2,/path3
-PAPERLESS_TAGS=bank,statement,financial
-ALLOWED_FILE_EXTENSIONS=.pdf,.doc
-OPENAI_API_KEY=test-list-key
-""")
+    def test_load_config_overrides_argument(self):
+        """Test overrides take precedence without modifying os.environ."""
+        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}):
+            config = load_config(
+                overrides={
+                    "LOG_LEVEL": "DEBUG",
+                    "PAPERLESS_ERROR_TAGS": "error:one, error:two",
+                    "PAPERLESS_ERROR_TAG_THRESHOLD": "0.7",
+                }
+            )
+
+            assert config.log_level == "DEBUG"
+            assert config.paperless_error_tags == ["error:one", "error:two"]
+            assert config.paperless_error_tag_threshold == 0.7
+            assert os.environ["LOG_LEVEL"] == "ERROR"
+
+    def test_load_config_unknown_override(self):
+        """Test unknown override keys are rejected."""
+        with pytest.raises(ValueError, match="Unknown configuration overrides"):
+            load_config(overrides={"NOT_A_SETTING": "1"})
+
+    def test_load_config_caches_env_file(self, tmp_path):
+        """Test an unchanged env file is parsed once and re-parsed on change."""
+        clear_env_file_cache()
+        custom_env = tmp_path / "cached.env"
+        custom_env.write_bytes(b"LOG_LEVEL=DEBUG\nOPENAI_API_KEY=test-cache")
+
+        with patch(
+            "src.bank_statement_separator.config.dotenv_values",
+            wraps=dotenv_values,
+        ) as mock_parse:
+            load_config(str(custom_env))
+            config = load_config(str(custom_env))
+            assert config.log_level == "DEBUG"
+            assert mock_parse.call_count == 1
+
+            custom_env.write_bytes(b"LOG_LEVEL=WARNING\nOPENAI_API_KEY=test-cache")
+            os.utime(custom_env, ns=(0, 0))
+            config = load_config(str(custom_env))
+            assert config.log_level == "WARNING"
+            assert mock_parse.call_count == 2
+
+    def test_load_config_cached_env_file_interpolates_current_environment(
+        self, tmp_path
+    ):
+        """Test ${VAR} references follow os.environ even when parsing is cached."""
+        clear_env_file_cache()
+        custom_env = tmp_path / "interpolated.env"
+        custom_env.write_bytes(b"OPENAI_API_KEY=key-${KEY_SUFFIX}")
+
+        with (
+            patch.dict(os.environ, {"KEY_SUFFIX": "first"}),
+            patch(
+                "src.bank_statement_separator.config.dotenv_values",
+                wraps=dotenv_values,
+            ) as mock_parse,
+        ):
+            assert load_config(str(custom_env)).openai_api_key == "key-first"
+
+            os.environ["KEY_SUFFIX"] = "second"
+            assert load_config(str(custom_env)).openai_api_key == "key-second"
+            assert mock_parse.call_count == 1
+
+    def test_load_config_caches_validated_config(self, monkeypatch):
+        """Test unchanged environment values are validated once per process."""
+        clear_config_cache()
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+        monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+
+        with patch(
+            "src.bank_statement_separator.config._config_from_env",
+            wraps=_config_from_env,
+        ) as mock_convert:
+            first = load_config()
+            second = load_config()
+            assert mock_convert.call_count == 1
+
+            # Each caller gets its own copy to adjust
+            first.openai_model = "gpt-4o"
+            assert second.openai_model == "gpt-4o-mini"
+
+            monkeypatch.setenv("LOG_LEVEL", "ERROR")
+            assert load_config().log_level == "ERROR"
+            assert mock_convert.call_count == 2
+
+    def test_load_config_from_mapping_ignores_process_env(self):
+        """Test mapping-based loading does not consult os.environ."""
+        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}):
+            config = load_config_from_mapping(
+                {"OPENAI_API_KEY": "test-mapping-key", "UNRELATED_VAR": "1"}
+            )
+
+        assert config.log_level == "INFO"
+        assert config.openai_api_key == "test-mapping-key"
 
-        config = load_config(str(custom_env))
+    def test_load_config_list_values(self):
+        """Test loading config with list-type values."""
+        config = load_config_from_mapping(
+            {
+                "ALLOWED_INPUT_DIRS": "/path1,/path2,/path3",
+                "PAPERLESS_TAGS": "bank,statement,financial",
+                "ALLOWED_FILE_EXTENSIONS": ".pdf,.doc",
+                "OPENAI_API_KEY": "test-list-key",
+            }
+        )
 
         assert config.allowed_input_dirs == ["/path1", "/path2", "/path3"]
         assert config.paperless_tags == ["bank", "statement", "financial"]
         assert config.allowed_file_extensions == [".pdf", ".doc"]
 
-    def test_load_config_boolean_values(self, tmp_path):
-        """Test loading config with boolean values."""
-        custom_env = tmp_path / "booleans.env"
-        custom_env.write_text("""
-ENABLE_AUDIT_LOGGING=true
-PAPERLESS_ENABLED=1
-INCLUDE_BANK_IN_FILENAME=yes
-ENABLE_FALLBACK_PROCESSING=on
-OPENAI_API_KEY=test-bool-key
-""")
+    def test_list_fields_accept_comma_separated_strings(self):
+        """List fields split strings on commas and drop blank items."""
+        config = Config(
+            openai_api_key="test-key",
+            paperless_tags=" bank , ,statement,",
+            allowed_output_dirs="",
+        )
 
-        config = load_config(str(custom_env))
+        assert config.paperless_tags == ["bank", "statement"]
+        assert config.allowed_output_dirs == []
+
+    def test_load_config_boolean_values(self):
+        """Test loading config with boolean values."""
+        config = load_config_from_mapping(
+            {
+                "ENABLE_AUDIT_LOGGING": "true",
+                "PAPERLESS_ENABLED": "1",
+                "INCLUDE_BANK_IN_FILENAME": "yes",
+                "ENABLE_FALLBACK_PROCESSING": "on",
+                "OPENAI_API_KEY": "test-bool-key",
+            }
+        )
 
         assert config.enable_audit_logging is True
         assert config.paperless_enabled is True
         assert config.include_bank_in_filename is True
         assert config.enable_fallback_processing is True
 
-    def test_load_config_numeric_values(self, tmp_path):
-        """Test loading config with numeric values."""
-        custom_env = tmp_path / "numbers.env"
-        custom_env.write_text("""
-LLM_TEMPERATURE=0.5
-CHUNK_SIZE=8000
-MAX_FILE_SIZE_MB=150
-OPENAI_API_KEY=test-numeric-key
-""")
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [(" TRUE ", True), ("Y", True), ("t", True), ("off", False), ("", False)],
+    )
+    def test_load_config_boolean_normalization(self, raw, expected):
+        """Boolean strings are matched case-insensitively after trimming."""
+        config = load_config_from_mapping(
+            {"PAPERLESS_ENABLED": raw, "OPENAI_API_KEY": "test-bool-key"}
+        )
 
-        config = load_config(str(custom_env))
+        assert config.paperless_enabled is expected
+
+    def test_load_config_numeric_values(self):
+        """Test loading config with numeric values."""
+        config = load_config_from_mapping(
+            {
+                "LLM_TEMPERATURE": "0.5",
+                "CHUNK_SIZE": "8000",
+                "MAX_FILE_SIZE_MB": "150",
+                "OPENAI_API_KEY": "test-numeric-key",
+            }
+        )
 
         assert config.llm_temperature == 0.5
         assert config.chunk_size == 8000
@@ -172,19 +349,14 @@ OPENAI_API_KEY=test-numeric-key
         with pytest.raises(FileNotFoundError, match="Environment file not found"):
             load_config(str(nonexistent_file))
 
-    def test_load_config_unreadable_file(self, tmp_path):
+    def test_load_config_unreadable_file(self, env_files, monkeypatch):
         """Test loading config with unreadable file raises error."""
-        unreadable_file = tmp_path / "unreadable.env"
-        unreadable_file.write_text("TEST=value")
-        unreadable_file.chmod(0o000)
+        unreadable_file = env_files["readable"]
+        deny_read_access(monkeypatch, unreadable_file)
 
-        try:
-            # The load_config function now re-raises PermissionError directly
-            with pytest.raises(PermissionError, match="Cannot read environment file"):
-                load_config(str(unreadable_file))
-        finally:
-            # Restore permissions for cleanup
-            unreadable_file.chmod(0o644)
+        # The load_config function now re-raises PermissionError directly
+        with pytest.raises(PermissionError, match="Cannot read environment file"):
+            load_config(str(unreadable_file))
 
     def test_load_config_directory_path(self, tmp_path):
         """Test loading config with directory path raises error."""
@@ -195,27 +367,15 @@ OPENAI_API_KEY=test-numeric-key
 class TestConfigValidation:
     """Test Config model validation."""
 
-    def test_invalid_log_level(self):
-        """Test that invalid log level raises validation error."""
-        with pytest.raises(ValueError, match="Log level must be one of"):
-            Config(log_level="INVALID", openai_api_key="test-key")
-
-    def test_invalid_openai_model(self):
-        """Test that invalid OpenAI model raises validation error."""
-        with pytest.raises(ValueError, match="OpenAI model must be one of"):
-            Config(openai_model="invalid-model", openai_api_key="test-key")
-
-    def test_invalid_llm_provider(self):
-        """Test that invalid LLM provider raises validation error."""
-        with pytest.raises(ValueError, match="LLM provider must be one of"):
-            Config(llm_provider="invalid-provider", openai_api_key="test-key")
-
-    def test_chunk_overlap_validation(self):
-        """Test chunk overlap cannot exceed chunk size."""
-        with pytest.raises(
-            ValueError, match="Chunk overlap must be less than chunk size"
-        ):
-            Config(chunk_size=1000, chunk_overlap=1500, openai_api_key="test-key")
+    @pytest.mark.parametrize(
+        ("overrides", "error_pattern"),
+        INVALID_CONFIG_CASES,
+        ids=["log_level", "openai_model", "llm_provider", "chunk_overlap"],
+    )
+    def test_invalid_values_raise_validation_error(self, overrides, error_pattern):
+        """Test that invalid field values raise the validator's error message."""
+        with pytest.raises(ValueError, match=error_pattern):
+            Config(openai_api_key="test-key", **overrides)
 
     def test_openai_api_key_validation_production(self):
         """Test OpenAI API key validation works for valid production keys."""
@@ -223,57 +383,54 @@ class TestConfigValidation:
         config = Config(openai_api_key="sk-test1234567890abcdef1234567890abcdef")
         assert config.openai_api_key == "sk-test1234567890abcdef1234567890abcdef"
 
-    def test_openai_api_key_validation_test_env(self):
+    @pytest.mark.parametrize(
+        "test_key", ["test-key", "invalid-key", "mock-key", "fake-key", "dummy-key", ""]
+    )
+    def test_openai_api_key_validation_test_env(self, test_key):
         """Test OpenAI API key validation allows test keys in test environment."""
-        # Test keys should be allowed
-        test_keys = ["test-key", "invalid-key", "mock-key", "fake-key", "dummy-key", ""]
-
-        for test_key in test_keys:
-            # Should not raise validation error for test keys
-            config = Config(openai_api_key=test_key)
-            assert config.openai_api_key == test_key
+        # Should not raise validation error for test keys
+        config = Config(openai_api_key=test_key)
+        assert config.openai_api_key == test_key
 
 
 class TestConfigEnvironmentIntegration:
     """Test integration with different environment configurations."""
 
-    def test_development_config(self, tmp_path):
+    def test_development_config(self):
         """Test loading development configuration."""
-        dev_env = tmp_path / ".env.dev"
-        dev_env.write_text("""
-# Development Configuration
-LLM_PROVIDER=openai
-OPENAI_API_KEY=test-dev-key
-OPENAI_MODEL=gpt-4o-mini
-LOG_LEVEL=DEBUG
-DEFAULT_OUTPUT_DIR=./dev_output
-ENABLE_AUDIT_LOGGING=true
-""")
-
-        config = load_config(str(dev_env))
+        config = load_config_from_mapping(
+            {
+                # Development Configuration
+                "LLM_PROVIDER": "openai",
+                "OPENAI_API_KEY": "test-dev-key",
+                "OPENAI_MODEL": "gpt-4o-mini",
+                "LOG_LEVEL": "DEBUG",
+                "DEFAULT_OUTPUT_DIR": "./dev_output",
+                "ENABLE_AUDIT_LOGGING": "true",
+            }
+        )
 
         assert config.llm_provider == "openai"
         assert config.log_level == "DEBUG"
         assert config.default_output_dir == "./dev_output"
         assert config.enable_audit_logging is True
 
-    def test_production_config(self, tmp_path):
+    def test_production_config(self):
         """Test loading production configuration."""
-        prod_env = tmp_path / ".env.prod"
-        prod_env.write_text("""
-# Production Configuration
-LLM_PROVIDER=openai
-OPENAI_API_KEY=test-prod-key
-OPENAI_MODEL=gpt-4o
-LOG_LEVEL=WARNING
-DEFAULT_OUTPUT_DIR=/var/app/output
-MAX_FILE_SIZE_MB=50
-ENABLE_AUDIT_LOGGING=true
-ALLOWED_INPUT_DIRS=/secure/input
-ALLOWED_OUTPUT_DIRS=/secure/output
-""")
-
-        config = load_config(str(prod_env))
+        config = load_config_from_mapping(
+            {
+                # Production Configuration
+                "LLM_PROVIDER": "openai",
+                "OPENAI_API_KEY": "test-prod-key",
+                "OPENAI_MODEL": "gpt-4o",
+                "LOG_LEVEL": "WARNING",
+                "DEFAULT_OUTPUT_DIR": "/var/app/output",
+                "MAX_FILE_SIZE_MB": "50",
+                "ENABLE_AUDIT_LOGGING": "true",
+                "ALLOWED_INPUT_DIRS": "/secure/input",
+                "ALLOWED_OUTPUT_DIRS": "/secure/output",
+            }
+        )
 
         assert config.llm_provider == "openai"
         assert config.openai_model == "gpt-4o"
@@ -283,21 +440,20 @@ ALLOWED_OUTPUT_DIRS=/secure/output
         assert config.allowed_input_dirs == ["/secure/input"]
         assert config.allowed_output_dirs == ["/secure/output"]
 
-    def test_testing_config(self, tmp_path):
+    def test_testing_config(self):
         """Test loading testing configuration."""
-        test_env = tmp_path / ".env.test"
-        test_env.write_text("""
-# Testing Configuration
-LLM_PROVIDER=auto
-OPENAI_API_KEY=test-key
-OPENAI_MODEL=gpt-4o-mini
-LOG_LEVEL=ERROR
-DEFAULT_OUTPUT_DIR=./test_output
-MAX_FILE_SIZE_MB=10
-ENABLE_FALLBACK_PROCESSING=false
-""")
-
-        config = load_config(str(test_env))
+        config = load_config_from_mapping(
+            {
+                # Testing Configuration
+                "LLM_PROVIDER": "auto",
+                "OPENAI_API_KEY": "test-key",
+                "OPENAI_MODEL": "gpt-4o-mini",
+                "LOG_LEVEL": "ERROR",
+                "DEFAULT_OUTPUT_DIR": "./test_output",
+                "MAX_FILE_SIZE_MB": "10",
+                "ENABLE_FALLBACK_PROCESSING": "false",
+            }
+        )
 
         assert config.llm_provider == "auto"
         assert config.log_level == "ERROR"
@@ -1,35 +1,94 @@
 """Tests for error detection and automatic tagging functionality."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.bank_statement_separator.config import Config
+from src.bank_statement_separator.utils.error_detector import ErrorDetector
+from src.bank_statement_separator.utils.error_tagger import ErrorTagger
+from src.bank_statement_separator.workflow import BankStatementWorkflow
+
+
+# ErrorDetector only reads its config, so one instance serves every detection test
+@pytest.fixture(scope="module")
+def detection_config():
+    """Create a mock configuration with error tagging enabled."""
+    config = SimpleNamespace(
+        paperless_enabled=True,
+        paperless_url="https://paperless.example.com",
+        paperless_token="test-token",
+        paperless_error_tags=["processing:needs-review"],
+        paperless_error_tag_threshold=0.5,
+        paperless_error_detection_enabled=True,
+        paperless_error_severity_levels=["medium", "high", "critical"],
+    )
+    return config
+
+
+@pytest.fixture(scope="module")
+def error_detector(detection_config):
+    """Create an error detector instance."""
+    return ErrorDetector(detection_config)
+
+
+# Workflow states that must each raise at least one error of the given type
+ERROR_DETECTION_CASES = [
+    pytest.param(
+        {
+            "current_step": "statement_detection_complete",
+            "detected_boundaries": [
+                {"confidence": 0.3, "start_page": 1, "end_page": 5},
+                {"confidence": 0.2, "start_page": 6, "end_page": 10},
+            ],
+            "confidence_scores": [0.3, 0.2],
+        },
+        "low_confidence_boundaries",
+        id="boundary_detection_issues",
+    ),
+    pytest.param(
+        {
+            "current_step": "pdf_generation_error",
+            "error_message": "PDF generation failed: corrupted input file",
+            "generated_files": [],
+            "total_statements_found": 3,
+        },
+        "pdf_processing_error",
+        id="pdf_processing_errors",
+    ),
+    pytest.param(
+        {
+            "current_step": "metadata_extraction_complete",
+            "extracted_metadata": [
+                {"account_number": "ACCT0001", "confidence": 0.2},
+                {"account_number": "ACCT0002", "confidence": 0.3},
+            ],
+        },
+        "metadata_extraction_failure",
+        id="metadata_extraction_problems",
+    ),
+    pytest.param(
+        {
+            "current_step": "output_validation_error",
+            "validation_results": {
+                "is_valid": False,
+                "error_details": ["Page count mismatch", "Content sampling failed"],
+                "checks": {
+                    "page_count": {"status": "failed"},
+                    "content_sampling": {"status": "failed"},
+                },
+            },
+        },
+        "validation_failure",
+        id="validation_failures",
+    ),
+]
 
 
 class TestErrorDetection:
     """Test error detection during workflow execution."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration with error tagging enabled."""
-        config = Mock(spec=Config)
-        config.paperless_enabled = True
-        config.paperless_url = "https://paperless.example.com"
-        config.paperless_token = "test-token"
-        config.paperless_error_tags = ["processing:needs-review"]
-        config.paperless_error_tag_threshold = 0.5
-        config.paperless_error_detection_enabled = True
-        config.paperless_error_severity_levels = ["medium", "high", "critical"]
-        return config
-
-    @pytest.fixture
-    def error_detector(self, mock_config):
-        """Create an error detector instance."""
-        from src.bank_statement_separator.utils.error_detector import ErrorDetector
-
-        return ErrorDetector(mock_config)
-
     def test_detect_llm_analysis_failure(self, error_detector):
         """Test detection of LLM analysis failures."""
         # Simulate workflow state with LLM failure
@@ -46,69 +105,41 @@ class TestErrorDetection:
         assert any(error["type"] == "llm_analysis_failure" for error in errors)
         assert any("API timeout" in error["description"] for error in errors)
 
-    def test_detect_boundary_detection_issues(self, error_detector):
-        """Test detection of boundary detection issues."""
+    def test_detect_fallback_boundaries(self, error_detector):
+        """Test fallback segmentation is reported with the fallback count."""
         workflow_state = {
             "current_step": "statement_detection_complete",
             "detected_boundaries": [
-                {"confidence": 0.3, "start_page": 1, "end_page": 5},
-                {"confidence": 0.2, "start_page": 6, "end_page": 10},
-            ],
-            "confidence_scores": [0.3, 0.2],
-        }
-
-        errors = error_detector.detect_errors(workflow_state)
-
-        assert len(errors) > 0
-        assert any(error["type"] == "low_confidence_boundaries" for error in errors)
-
-    def test_detect_pdf_processing_errors(self, error_detector):
-        """Test detection of PDF processing errors."""
-        workflow_state = {
-            "current_step": "pdf_generation_error",
-            "error_message": "PDF generation failed: corrupted input file",
-            "generated_files": [],
-            "total_statements_found": 3,
-        }
-
-        errors = error_detector.detect_errors(workflow_state)
-
-        assert len(errors) > 0
-        assert any(error["type"] == "pdf_processing_error" for error in errors)
-
-    def test_detect_metadata_extraction_problems(self, error_detector):
-        """Test detection of metadata extraction problems."""
-        workflow_state = {
-            "current_step": "metadata_extraction_complete",
-            "extracted_metadata": [
-                {"account_number": "ACCT0001", "confidence": 0.2},
-                {"account_number": "ACCT0002", "confidence": 0.3},
+                {
+                    "confidence": 0.9,
+                    "start_page": 1,
+                    "end_page": 4,
+                    "reasoning": "Fallback page-based segmentation",
+                },
+                {
+                    "confidence": 0.9,
+                    "start_page": 5,
+                    "end_page": 8,
+                    "reasoning": "LLM-based detection",
+                },
             ],
         }
 
         errors = error_detector.detect_errors(workflow_state)
 
-        assert len(errors) > 0
-        assert any(error["type"] == "metadata_extraction_failure" for error in errors)
-
-    def test_detect_validation_failures(self, error_detector):
-        """Test detection of validation failures."""
-        workflow_state = {
-            "current_step": "output_validation_error",
-            "validation_results": {
-                "is_valid": False,
-                "error_details": ["Page count mismatch", "Content sampling failed"],
-                "checks": {
-                    "page_count": {"status": "failed"},
-                    "content_sampling": {"status": "failed"},
-                },
-            },
-        }
+        fallback_errors = [
+            e for e in errors if e["details"].get("fallback_boundaries") is not None
+        ]
+        assert len(fallback_errors) == 1
+        assert fallback_errors[0]["type"] == "llm_analysis_failure"
+        assert fallback_errors[0]["details"]["fallback_boundaries"] == 1
 
+    @pytest.mark.parametrize(("workflow_state", "expected_type"), ERROR_DETECTION_CASES)
+    def test_detect_error_type(self, error_detector, workflow_state, expected_type):
+        """Test each failing workflow state is reported with its error type."""
         errors = error_detector.detect_errors(workflow_state)
 
-        assert len(errors) > 0
-        assert any(error["type"] == "validation_failure" for error in errors)
+        assert any(error["type"] == expected_type for error in errors)
 
     def test_no_errors_detected_for_successful_workflow(self, error_detector):
         """Test that no errors are detected for successful workflow."""
@@ -139,16 +170,17 @@ class TestAutomaticTagging:
     @pytest.fixture
     def mock_config(self):
         """Create a mock configuration with error tagging enabled."""
-        config = Mock(spec=Config)
-        config.paperless_enabled = True
-        config.paperless_url = "https://paperless.example.com"
-        config.paperless_token = "test-token"
-        config.paperless_error_tags = ["processing:needs-review", "error:detected"]
-        config.paperless_error_tag_threshold = 0.5
-        config.paperless_error_detection_enabled = True
-        config.paperless_error_severity_levels = ["medium", "high", "critical"]
-        config.paperless_error_batch_tagging = False
-        config.paperless_tag_wait_time = 5
+        config = SimpleNamespace(
+            paperless_enabled=True,
+            paperless_url="https://paperless.example.com",
+            paperless_token="test-token",
+            paperless_error_tags=["processing:needs-review", "error:detected"],
+            paperless_error_tag_threshold=0.5,
+            paperless_error_detection_enabled=True,
+            paperless_error_severity_levels=["medium", "high", "critical"],
+            paperless_error_batch_tagging=False,
+            paperless_tag_wait_time=5,
+        )
         return config
 
     @pytest.fixture
@@ -167,11 +199,9 @@ class TestAutomaticTagging:
             yield client
 
     @pytest.fixture
-    def error_tagger(self, mock_config):
-        """Create an error tagger instance."""
-        from src.bank_statement_separator.utils.error_tagger import ErrorTagger
-
-        return ErrorTagger(mock_config)
+    def error_tagger(self, mock_config, mock_paperless_client):
+        """Create an error tagger instance using the mock paperless client."""
+        return ErrorTagger(mock_config, paperless_client=mock_paperless_client)
 
     def test_apply_error_tags_to_documents(self, error_tagger, mock_paperless_client):
         """Test applying error tags to documents with processing issues."""
@@ -187,13 +217,83 @@ class TestAutomaticTagging:
             ]
         }
 
-        with patch.object(error_tagger, "paperless_client", mock_paperless_client):
-            result = error_tagger.apply_error_tags(errors, upload_results)
+        result = error_tagger.apply_error_tags(errors, upload_results)
 
         assert result["success"] is True
         assert result["tagged_documents"] == 2
         mock_paperless_client.apply_tags_to_document.assert_called()
 
+    def test_batch_mode_tags_documents_in_one_call(
+        self, error_tagger, mock_paperless_client
+    ):
+        """Test batch mode applies error tags to all documents with one request."""
+        error_tagger.config.paperless_error_batch_tagging = True
+        mock_paperless_client.apply_tags_to_documents.return_value = {
+            "success": True,
+            "document_ids": [123, 124],
+            "tags_applied": 2,
+        }
+
+        errors = [{"type": "llm_analysis_failure", "severity": "high"}]
+        upload_results = {
+            "uploads": [
+                {"document_id": 123, "success": True},
+                {"document_id": 124, "success": True},
+            ]
+        }
+
+        result = error_tagger.apply_error_tags(errors, upload_results)
+
+        assert result["success"] is True
+        assert result["tagged_documents"] == 2
+        assert [d["document_id"] for d in result["details"]] == [123, 124]
+        mock_paperless_client.apply_tags_to_documents.assert_called_once()
+        assert mock_paperless_client.apply_tags_to_documents.call_args[0][0] == [
+            123,
+            124,
+        ]
+        mock_paperless_client.apply_tags_to_document.assert_not_called()
+
+    def test_batch_mode_failure_reported_per_document(
+        self, error_tagger, mock_paperless_client
+    ):
+        """Test a failed bulk request is reported against every document."""
+        error_tagger.config.paperless_error_batch_tagging = True
+        mock_paperless_client.apply_tags_to_documents.return_value = {
+            "success": False,
+            "document_ids": [123, 124],
+            "error": "Connection failed",
+        }
+
+        errors = [{"type": "llm_analysis_failure", "severity": "high"}]
+        upload_results = {
+            "uploads": [
+                {"document_id": 123, "success": True},
+                {"document_id": 124, "success": True},
+            ]
+        }
+
+        result = error_tagger.apply_error_tags(errors, upload_results)
+
+        assert result["success"] is False
+        assert result["tagged_documents"] == 0
+        assert result["details"] == []
+        assert result["errors"] == [
+            "Failed to tag document 123: Connection failed",
+            "Failed to tag document 124: Connection failed",
+        ]
+
+    def test_uses_provided_paperless_client(self, mock_config):
+        """Test a supplied Paperless client is used instead of a new one."""
+        shared_client = Mock()
+        with patch(
+            "src.bank_statement_separator.utils.error_tagger.PaperlessClient"
+        ) as mock_client_class:
+            tagger = ErrorTagger(mock_config, paperless_client=shared_client)
+
+        assert tagger.paperless_client is shared_client
+        mock_client_class.assert_not_called()
+
     def test_skip_tagging_for_low_severity_errors(
         self, error_tagger, mock_paperless_client
     ):
@@ -202,8 +302,7 @@ class TestAutomaticTagging:
 
         upload_results = {"uploads": [{"document_id": 123, "success": True}]}
 
-        with patch.object(error_tagger, "paperless_client", mock_paperless_client):
-            result = error_tagger.apply_error_tags(errors, upload_results)
+        result = error_tagger.apply_error_tags(errors, upload_results)
 
         assert result["tagged_documents"] == 0
         mock_paperless_client.apply_tags_to_document.assert_not_called()
@@ -219,8 +318,7 @@ class TestAutomaticTagging:
         errors = [{"type": "llm_analysis_failure", "severity": "high"}]
         upload_results = {"uploads": [{"document_id": 123, "success": True}]}
 
-        with patch.object(error_tagger, "paperless_client", mock_paperless_client):
-            result = error_tagger.apply_error_tags(errors, upload_results)
+        result = error_tagger.apply_error_tags(errors, upload_results)
 
         assert result["success"] is False
         assert "API error" in str(result["errors"][0])
@@ -231,41 +329,47 @@ class TestAutomaticTagging:
 
         upload_results = {"uploads": [{"document_id": 123, "success": True}]}
 
-        with patch.object(error_tagger, "paperless_client", mock_paperless_client):
-            result = error_tagger.apply_error_tags(errors, upload_results)
+        result = error_tagger.apply_error_tags(errors, upload_results)
 
         assert result["tagged_documents"] == 0
         mock_paperless_client.apply_tags_to_document.assert_not_called()
 
 
-class TestWorkflowIntegration:
-    """Test integration of error detection and tagging into the workflow."""
+@pytest.fixture(scope="class")
+def workflow_config():
+    """Baseline workflow configuration; tests derive variants, never mutate it."""
+    return SimpleNamespace(
+        paperless_enabled=True,
+        paperless_error_detection_enabled=True,
+        paperless_error_tags=["processing:needs-review"],
+        paperless_error_severity_levels=["medium", "high", "critical"],
+        quarantine_directory=None,
+        max_retry_attempts=2,
+        continue_on_validation_warnings=True,
+        auto_quarantine_critical_failures=True,
+        preserve_failed_outputs=True,
+        enable_error_reporting=True,
+        error_report_directory=None,
+        validation_strictness="normal",
+        default_output_dir="./test_output",
+    )
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration."""
-        config = Mock(spec=Config)
-        config.paperless_enabled = True
-        config.paperless_error_detection_enabled = True
-        config.paperless_error_tags = ["processing:needs-review"]
-        config.paperless_error_severity_levels = ["medium", "high", "critical"]
-        config.quarantine_directory = None
-        config.max_retry_attempts = 2
-        config.continue_on_validation_warnings = True
-        config.auto_quarantine_critical_failures = True
-        config.preserve_failed_outputs = True
-        config.enable_error_reporting = True
-        config.error_report_directory = None
-        config.validation_strictness = "normal"
-        config.default_output_dir = "./test_output"
-        return config
 
-    @pytest.fixture
-    def workflow(self, mock_config):
-        """Create a workflow instance."""
-        from src.bank_statement_separator.workflow import BankStatementWorkflow
+@pytest.fixture(scope="class")
+def workflow(workflow_config):
+    """Workflow instance shared by a test class; its graph is built once."""
+    return BankStatementWorkflow(workflow_config)
+
+
+def with_config(workflow, monkeypatch, **overrides):
+    """Swap in a copy of the workflow config with ``overrides`` for one test."""
+    config = SimpleNamespace(**{**vars(workflow.config), **overrides})
+    monkeypatch.setattr(workflow, "config", config)
+    return config
+
 
-        return BankStatementWorkflow(mock_config)
+class TestWorkflowIntegration:
+    """Test integration of error detection and tagging into the workflow."""
 
     def test_paperless_upload_node_detects_and_tags_errors(self, workflow):
         """Test that the paperless upload node detects errors and applies tags."""
@@ -290,9 +394,9 @@ class TestWorkflowIntegration:
 
         mock_detect_tag.assert_called_once()
 
-    def test_error_detection_disabled_skips_tagging(self, workflow):
+    def test_error_detection_disabled_skips_tagging(self, workflow, monkeypatch):
         """Test that disabled error detection skips tagging."""
-        workflow.config.paperless_error_detection_enabled = False
+        with_config(workflow, monkeypatch, paperless_error_detection_enabled=False)
 
         state = {
             "current_step": "pdf_generation_error",
@@ -304,9 +408,9 @@ class TestWorkflowIntegration:
         assert result["attempted"] is False
         assert result["errors_detected"] == 0
 
-    def test_paperless_disabled_skips_error_tagging(self, workflow):
+    def test_paperless_disabled_skips_error_tagging(self, workflow, monkeypatch):
         """Test that disabled paperless integration skips error tagging."""
-        workflow.config.paperless_enabled = False
+        with_config(workflow, monkeypatch, paperless_enabled=False)
 
         state = {"current_step": "output_validation_complete"}
 
@@ -332,17 +436,14 @@ class TestConfigurationOptions:
         assert config.paperless_error_detection_enabled is True
         assert len(config.paperless_error_tags) == 2
 
-    def test_error_tag_threshold_validation(self):
-        """Test validation of error tag threshold."""
-        # Test invalid threshold (too high)
-        with pytest.raises(ValueError):
-            Config(paperless_error_tag_threshold=1.5)
-
-        # Test invalid threshold (negative)
+    @pytest.mark.parametrize("threshold", [1.5, -0.1], ids=["too_high", "negative"])
+    def test_error_tag_threshold_validation(self, threshold):
+        """Test validation rejects error tag thresholds outside 0-1."""
         with pytest.raises(ValueError):
-            Config(paperless_error_tag_threshold=-0.1)
+            Config(paperless_error_tag_threshold=threshold)
 
-        # Test valid threshold
+    def test_error_tag_threshold_valid(self):
+        """Test a threshold within range is accepted."""
         config = Config(paperless_error_tag_threshold=0.7)
         assert config.paperless_error_tag_threshold == 0.7
 
@@ -352,9 +453,9 @@ class TestConfigurationOptions:
         assert len(config.paperless_error_tags) == 3
         assert "tag2:value" in config.paperless_error_tags
 
-    def test_default_error_configuration(self):
+    def test_default_error_configuration(self, default_config):
         """Test default error configuration values."""
-        config = Config()
+        config = default_config
         assert config.paperless_error_detection_enabled is False
         assert config.paperless_error_tags is None
         assert config.paperless_error_tag_threshold == 0.5
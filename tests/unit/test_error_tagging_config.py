@@ -1,37 +1,46 @@
 """Tests for error tagging configuration."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
-from src.bank_statement_separator.config import Config, load_config
+from src.bank_statement_separator.config import Config, load_config_from_mapping
+
+
+def validated_copy(base: Config, **updates) -> Config:
+    """Copy base and validate only the updated fields against their schema.
+
+    Unlike ``model_copy(update=...)`` the new values still pass through field
+    validation, but the untouched fields are not re-validated.
+    """
+    config = base.model_copy()
+    for field, value in updates.items():
+        Config.__pydantic_validator__.validate_assignment(config, field, value)
+    return config
 
 
 class TestErrorTaggingConfig:
     """Test error tagging configuration options."""
 
-    def test_error_detection_enabled_config(self):
+    def test_error_detection_enabled_config(self, default_config):
         """Test error detection enabled configuration."""
-        config = Config(paperless_error_detection_enabled=True)
+        config = validated_copy(default_config, paperless_error_detection_enabled=True)
         assert config.paperless_error_detection_enabled is True
 
-        config = Config(paperless_error_detection_enabled=False)
+        config = validated_copy(default_config, paperless_error_detection_enabled=False)
         assert config.paperless_error_detection_enabled is False
 
-    def test_error_tags_config(self):
+    def test_error_tags_config(self, default_config):
         """Test error tags configuration."""
         tags = ["processing:needs-review", "error:detected", "manual:check"]
-        config = Config(paperless_error_tags=tags)
+        config = validated_copy(default_config, paperless_error_tags=tags)
         assert config.paperless_error_tags == tags
         assert len(config.paperless_error_tags) == 3
 
-    def test_error_tag_threshold_config(self):
+    def test_error_tag_threshold_config(self, default_config):
         """Test error tag threshold configuration."""
-        config = Config(paperless_error_tag_threshold=0.3)
+        config = validated_copy(default_config, paperless_error_tag_threshold=0.3)
         assert config.paperless_error_tag_threshold == 0.3
 
-        config = Config(paperless_error_tag_threshold=0.8)
+        config = validated_copy(default_config, paperless_error_tag_threshold=0.8)
         assert config.paperless_error_tag_threshold == 0.8
 
     def test_error_tag_threshold_validation(self):
@@ -48,15 +57,15 @@ class TestErrorTaggingConfig:
         with pytest.raises(ValueError):
             Config(paperless_error_tag_threshold=1.1)
 
-    def test_error_severity_levels_config(self):
+    def test_error_severity_levels_config(self, default_config):
         """Test error severity levels configuration."""
         levels = ["low", "medium", "high", "critical"]
-        config = Config(paperless_error_severity_levels=levels)
+        config = validated_copy(default_config, paperless_error_severity_levels=levels)
         assert config.paperless_error_severity_levels == levels
 
-    def test_default_error_config_values(self):
+    def test_default_error_config_values(self, default_config):
         """Test default error configuration values."""
-        config = Config()
+        config = default_config
         assert config.paperless_error_detection_enabled is False
         assert config.paperless_error_tags is None
         assert config.paperless_error_tag_threshold == 0.5
@@ -71,8 +80,7 @@ class TestErrorTaggingConfig:
             "PAPERLESS_ERROR_SEVERITY_LEVELS": "high,critical",
         }
 
-        with patch.dict(os.environ, env_vars):
-            config = load_config()
+        config = load_config_from_mapping(env_vars)
 
         assert config.paperless_error_detection_enabled is True
         assert config.paperless_error_tags == [
@@ -82,9 +90,10 @@ class TestErrorTaggingConfig:
         assert config.paperless_error_tag_threshold == 0.7
         assert config.paperless_error_severity_levels == ["high", "critical"]
 
-    def test_error_config_with_paperless_disabled(self):
+    def test_error_config_with_paperless_disabled(self, default_config):
         """Test error configuration when paperless is disabled."""
-        config = Config(
+        config = validated_copy(
+            default_config,
             paperless_enabled=False,
             paperless_error_detection_enabled=True,
             paperless_error_tags=["processing:needs-review"],
@@ -95,20 +104,20 @@ class TestErrorTaggingConfig:
         assert config.paperless_error_detection_enabled is True
         assert config.paperless_error_tags == ["processing:needs-review"]
 
-    def test_empty_error_tags_list(self):
+    def test_empty_error_tags_list(self, default_config):
         """Test handling of empty error tags list."""
-        config = Config(paperless_error_tags=[])
+        config = validated_copy(default_config, paperless_error_tags=[])
         assert config.paperless_error_tags == []
 
-        config = Config(paperless_error_tags=None)
+        config = validated_copy(default_config, paperless_error_tags=None)
         assert config.paperless_error_tags is None
 
-    def test_error_batch_tagging_config(self):
+    def test_error_batch_tagging_config(self, default_config):
         """Test batch vs individual error tagging configuration."""
-        config = Config(paperless_error_batch_tagging=True)
+        config = validated_copy(default_config, paperless_error_batch_tagging=True)
         assert config.paperless_error_batch_tagging is True
 
-        config = Config(paperless_error_batch_tagging=False)
+        config = validated_copy(default_config, paperless_error_batch_tagging=False)
         assert config.paperless_error_batch_tagging is False
 
     def test_config_field_descriptions(self):
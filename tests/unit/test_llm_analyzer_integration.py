@@ -18,6 +18,7 @@ from src.bank_statement_separator.nodes.llm_analyzer import (
     LLMAnalyzer,
     StatementMetadata,
 )
+from src.bank_statement_separator.workflow import BankStatementWorkflow
 
 
 @pytest.mark.unit
@@ -275,6 +276,26 @@ class TestLLMAnalyzerWithFactory:
             assert info["type"] == "OpenAIProvider"
             assert "available" in info
 
+    def test_workflow_passes_shared_provider_to_analyzer(self, default_config):
+        """Test the workflow hands its injected provider to every analyzer."""
+        shared_provider = Mock()
+        workflow = BankStatementWorkflow(default_config, llm_provider=shared_provider)
+        state = {"text_chunks": ["Page 1 content"], "total_pages": 1}
+
+        with patch(
+            "src.bank_statement_separator.nodes.llm_analyzer.LLMAnalyzer"
+        ) as mock_analyzer_class:
+            analyzer = mock_analyzer_class.return_value
+            analyzer.detect_statement_boundaries.return_value = BoundaryDetectionResult(
+                total_statements=1, boundaries=[]
+            )
+            workflow._statement_detection_node(state)
+            workflow._statement_detection_node(state)
+
+        assert mock_analyzer_class.call_count == 2
+        for call in mock_analyzer_class.call_args_list:
+            assert call.kwargs["provider"] is shared_provider
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -316,6 +316,82 @@ class TestPaperlessDocumentQuery:
         assert params["created__date__gte"] == "2024-01-01"
         assert params["created__date__lte"] == "2024-03-31"
 
+    @patch("httpx.Client")
+    def test_iter_documents_follows_pagination(
+        self, mock_httpx_client, paperless_client, mock_documents_response
+    ):
+        """Test lazy document iteration across paginated responses."""
+        first_page = Mock()
+        first_page.raise_for_status.return_value = None
+        first_page.json.return_value = {
+            **mock_documents_response,
+            "next": "http://localhost:8000/api/documents/?page=2",
+        }
+        second_page = Mock()
+        second_page.raise_for_status.return_value = None
+        second_page.json.return_value = {
+            "count": 4,
+            "next": None,
+            "results": [{"id": 104, "content_type": "application/pdf"}],
+        }
+        mock_client = Mock()
+        mock_client.get.side_effect = [first_page, second_page]
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with patch.object(paperless_client, "_resolve_tags", return_value=[1]):
+            documents = list(
+                paperless_client.iter_documents(tags=["unprocessed"], page_size=3)
+            )
+
+        assert [doc["id"] for doc in documents] == [101, 102, 103, 104]
+        assert mock_client.get.call_count == 2
+
+        # First page carries the filters, the next link is followed verbatim
+        first_call, second_call = mock_client.get.call_args_list
+        assert first_call[1]["params"]["tags__id__in"] == "1"
+        assert first_call[1]["params"]["page_size"] == 3
+        assert second_call[0][0] == "http://localhost:8000/api/documents/?page=2"
+        assert second_call[1]["params"] is None
+
+    @patch("httpx.Client")
+    def test_iter_documents_stops_early(
+        self, mock_httpx_client, paperless_client, mock_documents_response
+    ):
+        """Test that consuming only part of the first page fetches one page."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {
+            **mock_documents_response,
+            "next": "http://localhost:8000/api/documents/?page=2",
+        }
+        mock_client = Mock()
+        mock_client.get.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        documents = paperless_client.iter_documents(page_size=3)
+        assert next(documents)["id"] == 101
+        documents.close()
+
+        mock_client.get.assert_called_once()
+
+    @patch("httpx.Client")
+    def test_iter_documents_http_error(self, mock_httpx_client, paperless_client):
+        """Test document iteration with HTTP error."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.text = "Server Error"
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "500 Server Error", request=Mock(), response=mock_response
+        )
+        mock_client = Mock()
+        mock_client.get.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with pytest.raises(
+            PaperlessUploadError, match="Document query failed with status 500"
+        ):
+            list(paperless_client.iter_documents())
+
 
 @pytest.mark.unit
 @pytest.mark.requires_paperless
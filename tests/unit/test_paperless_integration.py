@@ -1,7 +1,9 @@
 """Comprehensive tests for paperless-ngx integration with mocked API calls."""
 
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import httpx
 import pytest
@@ -154,6 +156,269 @@ class TestPaperlessClient:
         ):
             client.test_connection()
 
+    @patch("httpx.Client")
+    def test_ping_success(self, mock_httpx_client, paperless_client):
+        """Test ping reports a reachable API."""
+        mock_client = Mock()
+        mock_client.head.return_value = Mock(is_success=True)
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        assert paperless_client.ping() is True
+        mock_httpx_client.assert_called_once_with(timeout=2.0)
+        mock_client.head.assert_called_once_with(
+            "http://localhost:8000/api/", headers=paperless_client.headers
+        )
+
+    @patch("httpx.Client")
+    def test_ping_offline(self, mock_httpx_client, paperless_client):
+        """Test ping returns False instead of raising when offline."""
+        mock_client = Mock()
+        mock_client.head.side_effect = httpx.ConnectError("Connection refused")
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        assert paperless_client.ping() is False
+
+    def test_ping_disabled(self, disabled_paperless_config):
+        """Test ping is False without making a request when disabled."""
+        client = PaperlessClient(disabled_paperless_config)
+
+        assert client.ping() is False
+
+    @patch("httpx.Client")
+    def test_session_reused_across_requests(self, mock_httpx_client, paperless_client):
+        """Test an open session is shared by requests and released on close."""
+        session = mock_httpx_client.return_value
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"results": [{"id": 3}]}
+        session.get.return_value = mock_response
+
+        with paperless_client:
+            paperless_client.test_connection()
+            paperless_client._resolve_correspondent("Test Bank")
+
+        mock_httpx_client.assert_called_once()
+        assert session.get.call_count == 2
+        session.__enter__.assert_not_called()
+        session.close.assert_called_once()
+        assert paperless_client._session is None
+
+    @patch("httpx.Client")
+    def test_session_requests_use_per_call_timeout(
+        self, mock_httpx_client, paperless_client
+    ):
+        """Test the caller's timeout reaches requests made on an open session."""
+        session = mock_httpx_client.return_value
+        session.head.return_value = Mock(is_success=True)
+        session.get.return_value = Mock(status_code=200)
+
+        with paperless_client:
+            paperless_client.ping(timeout=2.0)
+            paperless_client.wait_for_documents([42], timeout=30.0)
+
+        assert session.head.call_args.kwargs["timeout"] == 2.0
+        assert session.get.call_args.kwargs["timeout"] == 5.0
+
+    @patch("time.sleep")
+    @patch("httpx.Client")
+    def test_wait_for_documents_polls_until_available(
+        self, mock_httpx_client, mock_sleep, paperless_client
+    ):
+        """Test documents are polled with backoff until the API returns them."""
+        mock_client = Mock()
+        mock_client.get.side_effect = [
+            Mock(status_code=404),
+            Mock(status_code=404),
+            Mock(status_code=200),
+        ]
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        result = paperless_client.wait_for_documents([42])
+
+        assert result == {42: True}
+        assert mock_client.get.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+    @patch("time.sleep")
+    @patch("httpx.Client")
+    def test_wait_for_documents_timeout(
+        self, mock_httpx_client, mock_sleep, paperless_client
+    ):
+        """Test documents that never appear are reported as unavailable."""
+        mock_client = Mock()
+        mock_client.get.return_value = Mock(status_code=404)
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        result = paperless_client.wait_for_documents([7], timeout=0)
+
+        assert result == {7: False}
+        mock_sleep.assert_not_called()
+
+    @patch("httpx.Client")
+    def test_wait_for_documents_skips_missing_ids(
+        self, mock_httpx_client, paperless_client
+    ):
+        """Test missing document IDs are reported as failed without polling."""
+        mock_client = Mock()
+        mock_client.get.return_value = Mock(status_code=200)
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        result = paperless_client.wait_for_documents([None, 42])
+
+        assert result == {None: False, 42: True}
+        mock_client.get.assert_called_once()
+        assert mock_client.get.call_args.args[0].endswith("/api/documents/42/")
+
+    @patch("httpx.Client")
+    def test_apply_tags_to_document_single_request(
+        self, mock_httpx_client, paperless_client
+    ):
+        """Test all tags are added in one bulk_edit modify_tags request."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"result": "OK"}
+        mock_client.post.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with patch.object(paperless_client, "_resolve_tags", return_value=[1, 2]):
+            result = paperless_client.apply_tags_to_document(
+                123, ["error:low-confidence", "error:review"], wait_time=0
+            )
+
+        assert result["success"] is True
+        assert result["tags_applied"] == 2
+        mock_client.post.assert_called_once_with(
+            "http://localhost:8000/api/documents/bulk_edit/",
+            headers=paperless_client.headers,
+            content=ANY,
+        )
+        payload = json.loads(mock_client.post.call_args[1]["content"])
+        assert payload == {
+            "documents": [123],
+            "method": "modify_tags",
+            "parameters": {"add_tags": [1, 2], "remove_tags": []},
+        }
+
+    @patch("time.sleep")
+    @patch("httpx.Client")
+    def test_apply_tags_to_documents_single_bulk_request(
+        self, mock_httpx_client, mock_sleep, paperless_client
+    ):
+        """Test several documents are tagged with one bulk_edit request."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"result": "OK"}
+        mock_client.post.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with patch.object(
+            paperless_client, "_resolve_tags", return_value=[1, 2]
+        ) as mock_resolve:
+            result = paperless_client.apply_tags_to_documents(
+                [123, 124, 125], ["error:low-confidence", "error:review"], wait_time=3
+            )
+
+        assert result["success"] is True
+        assert result["tags_applied"] == 2
+        assert result["document_ids"] == [123, 124, 125]
+        mock_sleep.assert_called_once_with(3)
+        mock_resolve.assert_called_once()
+        mock_client.post.assert_called_once()
+        payload = json.loads(mock_client.post.call_args[1]["content"])
+        assert payload == {
+            "documents": [123, 124, 125],
+            "method": "modify_tags",
+            "parameters": {"add_tags": [1, 2], "remove_tags": []},
+        }
+
+    @patch("httpx.Client")
+    def test_apply_tags_to_document_async_success(
+        self, mock_httpx_client, paperless_client
+    ):
+        """Test async tag application adds all tags in one request."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"result": "OK"}
+        mock_client.post.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with patch.object(paperless_client, "_resolve_tags", return_value=[1, 2]):
+            result = asyncio.run(
+                paperless_client.apply_tags_to_document_async(
+                    123, ["error:low-confidence", "error:review"], wait_time=0
+                )
+            )
+
+        assert result["success"] is True
+        assert result["tags_applied"] == 2
+        mock_client.post.assert_called_once()
+        payload = json.loads(mock_client.post.call_args[1]["content"])
+        assert payload["method"] == "modify_tags"
+        assert payload["parameters"]["add_tags"] == [1, 2]
+
+    @patch("httpx.Client")
+    def test_apply_tags_to_document_async_request_error(
+        self, mock_httpx_client, paperless_client
+    ):
+        """Test async tag application reports tags that failed to apply."""
+        mock_client = Mock()
+        mock_client.post.side_effect = httpx.RequestError("Connection failed")
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with patch.object(paperless_client, "_resolve_tags", return_value=[1, 2]):
+            result = asyncio.run(
+                paperless_client.apply_tags_to_document_async(
+                    123, ["error:low-confidence", "error:review"], wait_time=0
+                )
+            )
+
+        assert result["success"] is False
+        assert result["tags_applied"] == 0
+        assert result["tags_failed"] == 2
+
+    def test_resolve_metadata_async(self, paperless_client):
+        """Test metadata names are resolved together into one result."""
+        with (
+            patch.object(paperless_client, "_resolve_tags", return_value=[1, 2]),
+            patch.object(paperless_client, "_resolve_correspondent", return_value=10),
+            patch.object(paperless_client, "_resolve_document_type", return_value=20),
+            patch.object(
+                paperless_client, "_resolve_storage_path", return_value=None
+            ) as mock_storage_path,
+        ):
+            result = asyncio.run(
+                paperless_client.resolve_metadata_async(
+                    tags=["bank", "statement"],
+                    correspondent="Test Bank",
+                    document_type="Bank Statement",
+                )
+            )
+
+        assert result == {
+            "tags": [1, 2],
+            "correspondent": 10,
+            "document_type": 20,
+            "storage_path": None,
+        }
+        mock_storage_path.assert_called_once_with(None)
+
+    @patch("httpx.Client")
+    def test_resolve_tags_caches_ids(self, mock_httpx_client, paperless_client):
+        """Test resolved tag IDs are reused without another lookup."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"results": [{"id": 7}]}
+        mock_client.get.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        assert paperless_client._resolve_tags(["Statement"]) == [7]
+        assert paperless_client._resolve_tags(["statement"]) == [7]
+        mock_client.get.assert_called_once()
+
     @patch("httpx.Client")
     def test_upload_document_success(
         self, mock_httpx_client, paperless_client, test_pdf_file
@@ -223,6 +488,38 @@ class TestPaperlessClient:
         assert result["document_type"] == "Bank Statement"  # From config
         assert result["storage_path"] == "Bank Statements"  # From config
 
+    @patch("httpx.Client")
+    def test_upload_document_bytes_success(self, mock_httpx_client, paperless_client):
+        """Test uploading in-memory PDF content without a file on disk."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"id": 789}
+        mock_client.post.return_value = mock_response
+        mock_httpx_client.return_value.__enter__.return_value = mock_client
+
+        with (
+            patch.object(paperless_client, "_resolve_tags", return_value=[1]),
+            patch.object(paperless_client, "_resolve_correspondent", return_value=10),
+            patch.object(paperless_client, "_resolve_document_type", return_value=20),
+            patch.object(paperless_client, "_resolve_storage_path", return_value=None),
+        ):
+            result = paperless_client.upload_document_bytes(
+                data=b"%PDF-1.4 test", filename="memory_statement.pdf"
+            )
+
+        assert result["success"] is True
+        assert result["document_id"] == 789
+        assert result["title"] == "memory_statement"
+        assert result["file_path"] is None
+
+        files = mock_client.post.call_args[1]["files"]
+        assert files["document"] == (
+            "memory_statement.pdf",
+            b"%PDF-1.4 test",
+            "application/pdf",
+        )
+
     @patch("httpx.Client")
     def test_upload_document_request_error(
         self, mock_httpx_client, paperless_client, test_pdf_file
@@ -534,15 +831,37 @@ class TestPaperlessWorkflowIntegration:
         assert len(result_state["paperless_upload_results"]["uploads"]) == 2
         assert len(result_state["paperless_upload_results"]["errors"]) == 0
 
+    def test_paperless_upload_node_uses_shared_client(
+        self, workflow_config, mock_workflow_state
+    ):
+        """Test an injected Paperless client is used instead of building one."""
+        shared_client = Mock()
+        shared_client.is_enabled.return_value = True
+        shared_client.test_connection.return_value = True
+        shared_client.upload_document.return_value = {
+            "success": True,
+            "document_id": 123,
+            "title": "Test Statement",
+            "file_path": "test.pdf",
+        }
+        workflow = BankStatementWorkflow(
+            workflow_config, paperless_client=shared_client
+        )
+
+        with patch(
+            "src.bank_statement_separator.utils.paperless_client.PaperlessClient"
+        ) as mock_client_class:
+            result_state = workflow._paperless_upload_node(mock_workflow_state)
+
+        mock_client_class.assert_not_called()
+        assert shared_client.upload_document.call_count == 2
+        assert result_state["paperless_upload_results"]["success"] is True
+
     def test_paperless_upload_node_connection_failure(
         self, workflow, mock_workflow_state
     ):
         """Test paperless upload node with connection failure."""
         # Mock connection test failure
-        from src.bank_statement_separator.utils.paperless_client import (
-            PaperlessUploadError,
-        )
-
         with patch(
             "src.bank_statement_separator.utils.paperless_client.PaperlessClient"
         ) as mock_client_class:
@@ -634,10 +953,6 @@ class TestPaperlessWorkflowIntegration:
                 if mock_client.upload_document.call_count == 1:
                     return {"success": True, "document_id": 123, "title": "Statement 1"}
                 else:
-                    from src.bank_statement_separator.utils.paperless_client import (
-                        PaperlessUploadError,
-                    )
-
                     raise PaperlessUploadError("Network error")
 
             mock_client.upload_document.side_effect = upload_side_effect